@@ -0,0 +1,39 @@
+"""Server-level MySQL connections for admin scripts (no default database)."""
+
+from typing import Optional
+
+import aiomysql
+
+from app.common.config import settings
+
+_admin_pool: Optional[aiomysql.Pool] = None
+
+
+async def get_admin_pool() -> aiomysql.Pool:
+    """
+    Get the shared admin connection pool, creating it on first use.
+
+    Connections are opened without selecting a database so they can run
+    server-level statements such as CREATE DATABASE or SHOW PROCESSLIST.
+    """
+    global _admin_pool
+    if _admin_pool is None:
+        _admin_pool = await aiomysql.create_pool(
+            host=settings.DB_HOST,
+            port=settings.DB_PORT,
+            user=settings.DB_USER,
+            password=settings.DB_PASSWORD,
+            minsize=1,
+            maxsize=4,
+            autocommit=True,
+        )
+    return _admin_pool
+
+
+async def close_admin_pool() -> None:
+    """Close the shared admin pool if it was created."""
+    global _admin_pool
+    if _admin_pool is not None:
+        _admin_pool.close()
+        await _admin_pool.wait_closed()
+        _admin_pool = None
@@ -0,0 +1,142 @@
+"""Helpers for running schema changes from migration scripts."""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+# MySQL server error codes
+ER_DUP_KEYNAME = 1061  # ADD of an index/constraint name that already exists
+ER_CANT_DROP_FIELD_OR_KEY = 1091  # DROP of a column/index that does not exist
+ER_NO_SUCH_TABLE = 1146
+
+# ER_ALTER_OPERATION_NOT_SUPPORTED(_REASON): the requested ALGORITHM/LOCK is
+# not possible for this change
+_UNSUPPORTED_ALTER_ERRORS = (1845, 1846)
+
+# Tried in order before letting the server pick (usually COPY). INSTANT only
+# accepts the default lock level.
+ONLINE_ALTER_ALGORITHMS = (
+    ("INSTANT", ", ALGORITHM=INSTANT"),
+    ("INPLACE", ", ALGORITHM=INPLACE, LOCK=NONE"),
+)
+
+# Rows updated per statement by backfill_nulls
+BACKFILL_BATCH_SIZE = 10_000
+
+# Names of applied migrations. Created on first use by mark_applied
+SCHEMA_MIGRATIONS_TABLE_SQL = text(
+    """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        name VARCHAR(255) PRIMARY KEY,
+        applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+)
+_IS_APPLIED_SQL = text("SELECT 1 FROM schema_migrations WHERE name = :name")
+_MARK_APPLIED_SQL = text("INSERT IGNORE INTO schema_migrations (name) VALUES (:name)")
+_MARK_UNAPPLIED_SQL = text("DELETE FROM schema_migrations WHERE name = :name")
+
+
+def mysql_error_code(exc: DBAPIError) -> Optional[int]:
+    """Return the MySQL error number behind a SQLAlchemy DBAPI error."""
+    orig = exc.orig
+    if orig is not None and orig.args and isinstance(orig.args[0], int):
+        return orig.args[0]
+    return None
+
+
+async def exec_alter(conn: AsyncConnection, sql: str) -> str:
+    """
+    Run an ALTER TABLE with the cheapest algorithm the server accepts.
+
+    INSTANT changes only metadata, INPLACE with LOCK=NONE rebuilds without
+    blocking writes, and the plain statement falls back to a table copy.
+
+    Args:
+        conn: Open connection to run the statement on
+        sql: ALTER TABLE statement without ALGORITHM/LOCK clauses
+
+    Returns:
+        The algorithm that was used ("INSTANT", "INPLACE" or "DEFAULT")
+    """
+    statement = sql.strip().rstrip(";")
+
+    for name, clause in ONLINE_ALTER_ALGORITHMS:
+        try:
+            await conn.execute(text(statement + clause))
+            return name
+        except OperationalError as e:
+            if mysql_error_code(e) not in _UNSUPPORTED_ALTER_ERRORS:
+                raise
+            logger.info("ALGORITHM=%s not supported, falling back: %s", name, e.orig)
+
+    await conn.execute(text(statement))
+    return "DEFAULT"
+
+
+async def backfill_nulls(
+    conn: AsyncConnection,
+    table: str,
+    column: str,
+    value,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> int:
+    """
+    Replace NULLs in a column with a value, a batch of rows at a time.
+
+    Run before tightening a column to NOT NULL. On an AUTOCOMMIT connection
+    each batch commits on its own, so row locks and undo stay bounded rather
+    than covering the whole table in one statement.
+
+    Args:
+        conn: Open connection to run the updates on
+        table: Table to update
+        column: Column whose NULLs are replaced
+        value: Replacement value
+        batch_size: Maximum rows updated per statement
+
+    Returns:
+        Total number of rows updated
+    """
+    statement = text(
+        f"UPDATE {table} SET {column} = :value WHERE {column} IS NULL LIMIT {int(batch_size)}"
+    )
+
+    total = 0
+    while True:
+        result = await conn.execute(statement, {"value": value})
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
+
+
+async def is_applied(conn: AsyncConnection, name: str) -> bool:
+    """Return True if the named migration is recorded in schema_migrations."""
+    try:
+        result = await conn.execute(_IS_APPLIED_SQL, {"name": name})
+    except DBAPIError as e:
+        # Nothing has been recorded yet
+        if mysql_error_code(e) == ER_NO_SUCH_TABLE:
+            return False
+        raise
+    return result.scalar() is not None
+
+
+async def mark_applied(conn: AsyncConnection, name: str) -> None:
+    """Record the named migration in schema_migrations."""
+    await conn.execute(SCHEMA_MIGRATIONS_TABLE_SQL)
+    await conn.execute(_MARK_APPLIED_SQL, {"name": name})
+
+
+async def mark_unapplied(conn: AsyncConnection, name: str) -> None:
+    """Remove the named migration's record so its upgrade can run again."""
+    try:
+        await conn.execute(_MARK_UNAPPLIED_SQL, {"name": name})
+    except DBAPIError as e:
+        if mysql_error_code(e) != ER_NO_SUCH_TABLE:
+            raise
@@ -198,21 +198,24 @@ def get_question_repository(
 
 # Singleton instances
 _settings = settings
-_langchain_service = LangChainService(settings=_settings, backend="gemini")
 
 
 def get_settings() -> Settings:
     return _settings
 
 
+@lru_cache()
 def get_langchain_service() -> LangChainService:
-    return _langchain_service
+    # Built on first use so importing the app does not create an LLM client
+    return LangChainService(settings=_settings, backend="gemini")
 
 
 def get_course_generation_service(
     ai_service: LangChainService = Depends(get_langchain_service),
 ) -> CourseGenerationService:
-    return CourseGenerationService(ai_service)
+    return CourseGenerationService(
+        ai_service, cache_plans=_settings.COURSE_PLAN_CACHE_ENABLED
+    )
 
 
 def get_lesson_generation_service(
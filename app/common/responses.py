@@ -55,7 +55,9 @@ def success_response(
         )
         ```
     """
-    return ApiResponse(
+    # Skip validation here: data is untyped (Any) on the bare ApiResponse, and
+    # FastAPI validates and serializes against the route's response_model anyway
+    return ApiResponse.model_construct(
         status_code=status_code,
         details=details,
         data=data
@@ -86,7 +88,7 @@ def error_response(
         )
         ```
     """
-    return ApiResponse(
+    return ApiResponse.model_construct(
         status_code=status_code,
         details=details,
         data=data
@@ -0,0 +1,35 @@
+"""Event loop runner for standalone entrypoints (migrations, demos, scripts)."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, like asyncio.run().
+
+    Uses uvloop's libuv-based event loop when it is installed and falls back
+    to the default asyncio loop otherwise (e.g. on Windows). On Python 3.12+
+    tasks are created eagerly, so coroutines that finish without suspending
+    never go through the loop's ready queue.
+
+    Args:
+        main: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            runner.get_loop().set_task_factory(eager_task_factory)
+        return runner.run(main)
@@ -0,0 +1,28 @@
+"""Initialization and teardown run from the application lifespan."""
+
+import asyncio
+import logging
+
+from app.common.dependencies import get_email_service, get_firebase_storage_service
+
+logger = logging.getLogger(__name__)
+
+
+async def init_firebase() -> None:
+    """
+    Initialize the Firebase Admin app and cache the storage bucket.
+
+    Runs in a worker thread since credential loading and bucket lookup are
+    blocking. Failures are logged rather than raised so the API can still
+    start without Firebase configured; storage calls retry initialization
+    and raise if it still fails.
+    """
+    try:
+        await asyncio.to_thread(get_firebase_storage_service().initialize)
+    except Exception as e:
+        logger.error(f"Firebase storage initialization failed: {e}")
+
+
+async def close_http_clients() -> None:
+    """Close pooled HTTP connections held by long-lived service singletons."""
+    get_email_service().close()
@@ -48,7 +48,7 @@ class OTPService(Commitable):
 
         # Send email
         try:
-            email_sent = self.email_service.send_email(
+            email_sent = await self.email_service.send_email(
                 to_email=email,
                 subject="Your Verification Code",
                 template_name="otp_verification.html",
@@ -90,7 +90,7 @@ class OTPService(Commitable):
         try:
             magic_link = f"https://www.learnitin.online/app/reset-password?email={email}&otp={code}"
 
-            email_sent = self.email_service.send_email(
+            email_sent = await self.email_service.send_email(
                 to_email=email,
                 subject="Reset Your Password",
                 template_name="magic_link_password_reset.html",
@@ -151,7 +151,7 @@ class OTPService(Commitable):
                 f"https://www.learnitin.online/app/{path}?email={email}&otp={code}"
             )
 
-            email_sent = self.email_service.send_email(
+            email_sent = await self.email_service.send_email(
                 to_email=email,
                 subject=subject,
                 template_name=template,
@@ -1,4 +1,6 @@
 """Course generation service using AI."""
+import hashlib
+import json
 import re
 from fastapi import HTTPException, status
 from typing import List, Union
@@ -9,17 +11,56 @@ from app.features.courses.schemas import (
     ModuleOverview,
     LessonOverview,
 )
+from app.common.cache import cache_service
 from app.services.langchain_service import LangChainService
 from app.features.subscriptions.models import Subscription, SubscriptionResourceType
 from app.features.subscriptions.usage_service import SubscriptionUsageService
 from typing import List, Union, Optional
 
+COURSE_PLAN_CACHE = "course_generation_plans"
+
+# Outlines for a given (topic, level, pace, duration, goals) are reused for a
+# while instead of paying for another multi-second LLM call. Done when the AI
+# service is deterministic (temperature == 0), like the LLM response cache, or
+# when enabled with COURSE_PLAN_CACHE_ENABLED; otherwise sampled outlines are
+# expected to differ when the user asks again
+cache_service.register(COURSE_PLAN_CACHE, maxsize=512, ttl=6 * 3600)
+
+
+class CoursesResponse(BaseModel):
+    """Response containing multiple course outlines."""
+
+    courses: List[CourseOutline]
+
 
 class CourseGenerationService:
     """Service for AI-powered course generation."""
 
-    def __init__(self, ai_service: LangChainService):
+    def __init__(self, ai_service: LangChainService, cache_plans: bool = False):
+        """
+        Args:
+            ai_service: LLM service used to generate the outlines
+            cache_plans: Reuse outlines for repeated requests even when the
+                AI service samples (temperature > 0)
+        """
         self.ai_service = ai_service
+        self.cache_plans = cache_plans
+
+    @staticmethod
+    def _plan_key(request: CourseGenerationRequest, weeks: int) -> str:
+        """Fingerprint the request fields that shape the generated outlines."""
+        payload = json.dumps(
+            [
+                request.topic.strip().lower(),
+                request.level,
+                request.learning_pace.strip().lower(),
+                (request.duration_preference or "").strip().lower(),
+                weeks,
+                sorted(goal.strip() for goal in request.learning_goals or []),
+            ],
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     async def generate_courses(
         self,
@@ -50,6 +91,17 @@ class CourseGenerationService:
                 weeks = int(match.group(1))
             except ValueError:
                 pass
+
+        use_cache = self.cache_plans or self.ai_service.temperature == 0
+        plan_key = self._plan_key(request, weeks)
+        if use_cache:
+            cached: Optional[List[CourseOutline]] = cache_service.get(
+                COURSE_PLAN_CACHE, plan_key
+            )
+            if cached is not None:
+                # Callers mutate the outlines (e.g. set level), so hand out copies
+                return [outline.model_copy(deep=True) for outline in cached]
+
         # Define free lesson rules depending on course size
         free_lessons_rule = (
             "All lessons in the first module (Module 1) must be completely free (set `credit_cost`, `audio_credit_cost`, and `quiz_credit_cost` to 0)."
@@ -106,12 +158,6 @@ Pricing Guidelines for Lessons:
 
 Make the courses practical, engaging, and suitable for {request.level} learners."""
 
-        # Define the response schema for structured output
-        class CoursesResponse(BaseModel):
-            """Response containing multiple course outlines."""
-
-            courses: List[CourseOutline]
-
         # Use LangChain service to generate courses
         response: Union[CoursesResponse, str] = await self.ai_service.invoke(
             system_prompt=system_prompt,
@@ -124,4 +170,10 @@ Make the courses practical, engaging, and suitable for {request.level} learners.
                 detail=f"Failed to generate courses: {response}",
             )
 
+        if use_cache:
+            cache_service.set(
+                COURSE_PLAN_CACHE,
+                plan_key,
+                [outline.model_copy(deep=True) for outline in response.courses],
+            )
         return response.courses
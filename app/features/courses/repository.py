@@ -1,7 +1,7 @@
 """Course repository for database operations."""
 
-from typing import Optional, List
-from sqlalchemy import func
+from typing import Optional, List, Tuple
+from sqlalchemy import delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select, col
@@ -153,6 +153,25 @@ class CourseRepository:
         # Invalidate course caches
         self.invalidate_cache(course_id)
 
+    async def delete_by_ids(self, course_ids: List[int]) -> int:
+        """Delete courses by ID in a single statement.
+
+        Child rows are removed by the ON DELETE CASCADE foreign keys. The
+        caller is responsible for committing.
+
+        Returns:
+            Number of deleted courses.
+        """
+        if not course_ids:
+            return 0
+
+        result = await self.session.execute(
+            delete(Course).where(col(Course.id).in_(course_ids))
+        )
+        for course_id in course_ids:
+            self.invalidate_cache(course_id)
+        return result.rowcount  # ty:ignore[unresolved-attribute]
+
     @staticmethod
     def invalidate_cache(course_id: int) -> None:
         """Manually invalidate the course caches.
@@ -202,6 +221,20 @@ class CourseRepository:
         cache_service.set(COURSE_LIST_ORPHANED_CACHE, cache_key, courses)
         return courses
 
+    async def get_orphaned_course_ids_and_urls(self) -> List[Tuple[int, Optional[str]]]:
+        """
+        Get (id, image_url) pairs for orphaned courses.
+
+        Selects only the two columns maintenance needs, so no Course objects
+        are loaded. Always reads from the database rather than the cache.
+        """
+        result = await self.session.execute(
+            select(Course.id, Course.image_url)
+            .where(Course.user_id == None)
+            .where(Course.is_public == False)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
     async def get_all_with_filters(
         self,
         skip: int = 0,
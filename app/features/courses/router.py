@@ -847,7 +847,7 @@ async def upload_category_or_subcategory_image(
         destination_path = f"category/{type}_{id}_{uuid.uuid4()}.{file_ext}"
 
         # Upload using storage_service
-        image_url = storage_service.upload_bytes(
+        image_url = await storage_service.upload_bytes_async(
             data=file_bytes,
             destination_path=destination_path,
             content_type=file.content_type or "image/png",
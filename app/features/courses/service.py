@@ -203,7 +203,7 @@ class CourseService(Commitable):
             if image_bytes:
                 filename = f"courses/{course.user_id}/{uuid.uuid4()}.png"
                 # Upload to firebase
-                image_url = self.storage_service.upload_bytes(
+                image_url = await self.storage_service.upload_bytes_async(
                     data=image_bytes,
                     destination_path=filename,
                     content_type="image/png",
@@ -1,8 +1,8 @@
 """Lesson repository for database operations."""
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import json
-from sqlalchemy import desc, func
+from sqlalchemy import delete, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, col
 from sqlalchemy.orm import selectinload
@@ -238,6 +238,20 @@ class LessonAudioRepository:
         )
         return list(result.scalars().all())
 
+    async def get_orphaned_audio_ids_and_urls(self) -> List[Tuple[int, Optional[str]]]:
+        """
+        Get (id, audio_url) pairs for orphaned lesson audios.
+
+        Selects only the two columns maintenance needs, so no LessonAudio
+        objects (and their script text) are loaded.
+        """
+        result = await self.session.execute(
+            select(LessonAudio.id, LessonAudio.audio_url).where(
+                LessonAudio.lesson_id == None
+            )
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
     async def create(self, audio: LessonAudio) -> LessonAudio:
         """Create a new lesson audio."""
         self.session.add(audio)
@@ -270,3 +284,17 @@ class LessonAudioRepository:
         """Delete a lesson audio."""
         await self.session.delete(audio)
         await self.session.flush()
+
+    async def delete_by_ids(self, audio_ids: List[int]) -> int:
+        """Delete lesson audios by ID in a single statement.
+
+        Returns:
+            Number of deleted rows.
+        """
+        if not audio_ids:
+            return 0
+
+        result = await self.session.execute(
+            delete(LessonAudio).where(col(LessonAudio.id).in_(audio_ids))
+        )
+        return result.rowcount  # ty:ignore[unresolved-attribute]
@@ -172,9 +172,8 @@ class LessonService(Commitable):
                         f"Generated audio for part {part.order} ('{part.title}') is invalid, empty or corrupted."
                     )
 
-                # Upload to Firebase (run in thread since it is a synchronous blocking call)
-                audio_url = await asyncio.to_thread(
-                    self.storage_service.upload_audio,
+                # Upload to Firebase
+                audio_url = await self.storage_service.upload_audio_async(
                     audio_data=audio_bytes,
                     folder=f"lesson_audio/{lesson_id}",
                 )
@@ -1,5 +1,6 @@
 """Background tasks for notifications."""
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -49,8 +50,13 @@ async def send_push_notification_task(
 
         print(f"Sending push notification to user {user_id}")
         fcm_service = get_fcm_service()
-        response = fcm_service.send_to_token(
-            token=user.device_reg_token, title=title, body=body, data=fcm_data
+        # firebase_admin is blocking; keep the event loop free while it sends
+        response = await asyncio.to_thread(
+            fcm_service.send_to_token,
+            token=user.device_reg_token,
+            title=title,
+            body=body,
+            data=fcm_data,
         )
 
         if response:
@@ -110,8 +116,12 @@ async def send_multicast_push_notification_task(
 
     logger.info(f"Sending multicast push to {len(tokens)} devices")
     fcm_service = get_fcm_service()
-    response = fcm_service.send_multicast(
-        tokens=tokens, title=title, body=body, data=fcm_data
+    response = await asyncio.to_thread(
+        fcm_service.send_multicast,
+        tokens=tokens,
+        title=title,
+        body=body,
+        data=fcm_data,
     )
 
     if response:
@@ -3,6 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.common.config import settings
 from app.common.database.session import init_db, close_db
+from app.common.startup import close_http_clients, init_firebase
 from app.common.events.bus import event_bus
 from app.common.responses import ApiResponse, success_response
 from app.features.auth.router import router as auth_router
@@ -30,6 +31,9 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize database
     await init_db()
 
+    # Initialize Firebase and resolve the storage bucket once
+    await init_firebase()
+
     # Register notification event handlers
     event_bus.on(
         NotificationInAppPushEvent, handle_in_app_push_for_fcm
@@ -80,6 +84,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown: Close database connections and stop event bus
     await event_bus.stop(clear=True)
+    await close_http_clients()
     await close_db()
 
 
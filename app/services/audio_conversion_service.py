@@ -9,7 +9,7 @@ class AudioConversionService:
 
     def pcm_to_mp3_bytes(
         self,
-        pcm_bytes: bytes,
+        pcm_bytes: bytes | bytearray,
         sample_rate: int = 24000,  # Google TTS default sample rate
         channels: int = 1,  # Google TTS usually outputs mono
         bitrate: str = "128k",  # MP3 bitrate
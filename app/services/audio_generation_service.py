@@ -2,7 +2,10 @@
 
 import asyncio
 import mimetypes
+import re
 import struct
+import time
+from functools import lru_cache
 from typing import Optional
 
 from google import genai
@@ -20,6 +23,31 @@ MAX_WORDS_ABSOLUTE = 750  # Absolute maximum observed before truncation
 MAX_CHARACTERS_SAFE = 2500  # Safe character limit (~500 words)
 MAX_CHARACTERS_ABSOLUTE = 3750  # Absolute maximum (~750 words)
 
+# RIFF/WAVE header for PCM data, compiled once rather than on every pack
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+# Matches the sample width ("audio/L16") and rate ("rate=24000") parameters
+_MIME_RE = re.compile(r"audio/L(\d+)|rate=(\d+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _parse_mime_params(mime_type: str) -> tuple[int, Optional[int]]:
+    """Parse (bits per sample, rate) from an audio MIME type; rate may be None."""
+    bits_per_sample = 16
+    rate = None
+
+    if not mime_type:
+        return bits_per_sample, rate
+
+    for match in _MIME_RE.finditer(mime_type):
+        bits, rate_str = match.groups()
+        if bits:
+            bits_per_sample = int(bits)
+        elif rate_str:
+            rate = int(rate_str)
+
+    return bits_per_sample, rate
+
 
 class ContentTooLongError(ValueError):
     """Raised when content exceeds Gemini TTS limits."""
@@ -49,12 +77,17 @@ class AudioGenerationService:
             ContentTooLongError: If content exceeds the limits
         """
         byte_size = len(text.encode("utf-8"))
-        word_count = len(text.split())
         char_count = len(text)
 
         max_words = MAX_WORDS_SAFE if strict else MAX_WORDS_ABSOLUTE
         max_chars = MAX_CHARACTERS_SAFE if strict else MAX_CHARACTERS_ABSOLUTE
 
+        # Words are separated by whitespace, so there are at most
+        # (char_count + 1) // 2 of them; below the limit the split is skipped
+        word_count = (
+            len(text.split()) if (char_count + 1) // 2 > max_words else None
+        )
+
         errors = []
 
         if byte_size > MAX_BYTES_LIMIT:
@@ -62,7 +95,7 @@ class AudioGenerationService:
                 f"Content size ({byte_size} bytes) exceeds maximum limit of {MAX_BYTES_LIMIT} bytes"
             )
 
-        if word_count > max_words:
+        if word_count is not None and word_count > max_words:
             errors.append(
                 f"Word count ({word_count}) exceeds {'safe' if strict else 'absolute'} limit of {max_words} words"
             )
@@ -73,6 +106,8 @@ class AudioGenerationService:
             )
 
         if errors:
+            if word_count is None:
+                word_count = len(text.split())
             error_msg = "Content too long for Gemini TTS:\n" + "\n".join(
                 f"  - {e}" for e in errors
             )
@@ -93,26 +128,65 @@ class AudioGenerationService:
 
         Raises:
             ContentTooLongError: If content exceeds limits and validate=True
+            asyncio.TimeoutError: If generation exceeds TTS_HARD_DEADLINE_S
         """
         if validate:
             self.validate_content_length(text, strict=False)
 
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._generate_audio_sync, text
+        payload, container, params = await self._generate_raw(text)
+        if not payload:
+            return b""
+
+        # If it was raw PCM, we need to add the WAV header based on the mime type parameters
+        if container == "pcm":
+            return self._convert_to_wav(payload, params)
+
+        # Otherwise return the accumulated data (e.g. if it was mp3)
+        return bytes(payload)
+
+    async def _generate_raw(
+        self, text: str
+    ) -> tuple[bytearray, str, dict[str, Optional[int]]]:
+        """Run _generate_raw_sync in the default executor under the hard deadline."""
+        # wait_for cannot stop the worker thread itself; the stream deadline in
+        # _generate_raw_sync (TTS_TIMEOUT_S) is what releases it.
+        return await asyncio.wait_for(
+            asyncio.get_event_loop().run_in_executor(
+                None, self._generate_raw_sync, text
+            ),
+            timeout=self.settings.TTS_HARD_DEADLINE_S,
         )
 
-    def _generate_audio_sync(self, text: str) -> bytes:
+    def _generate_raw_sync(
+        self, text: str
+    ) -> tuple[bytearray, str, dict[str, Optional[int]]]:
+        """
+        Stream TTS output from Gemini without any container conversion.
+
+        Returns:
+            A ``(payload, container, params)`` tuple. ``container`` is "pcm" for
+            headerless audio/L16 data (``params`` then holds bits_per_sample and
+            rate) or "mp3" for an already-encoded stream. An empty payload
+            signals failure.
+        """
+        empty: tuple[bytearray, str, dict[str, Optional[int]]] = (bytearray(), "pcm", {})
+
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY is not set")
 
         model = "gemini-2.5-pro-preview-tts"
+        timeout_s = self.settings.TTS_TIMEOUT_S
 
         try:
-            client = genai.Client(api_key=self.api_key, vertexai=False)
+            client = genai.Client(
+                api_key=self.api_key,
+                vertexai=False,
+                http_options=types.HttpOptions(timeout=int(timeout_s * 1000)),
+            )
             print("Using Google AI (API Key) backend for audio generation")
         except Exception as e:
             print(f"Google AI (API Key) initialization failed: {e}")
-            return b""
+            return empty
 
         contents = [
             types.Content(
@@ -156,6 +230,8 @@ class AudioGenerationService:
         last_mime_type = None
         is_raw_pcm = False
 
+        started_at = time.monotonic()
+
         try:
             # Iterate through the stream and collect data
             for chunk in client.models.generate_content_stream(
@@ -163,6 +239,11 @@ class AudioGenerationService:
                 contents=contents,
                 config=generate_content_config,
             ):
+                if time.monotonic() - started_at > timeout_s:
+                    # Partial audio would be truncated mid-sentence; treat as failure
+                    print(f"Audio generation exceeded {timeout_s}s deadline, aborting")
+                    return empty
+
                 if (
                     chunk.candidates is None
                     or not chunk.candidates
@@ -190,26 +271,23 @@ class AudioGenerationService:
                     )
         except Exception as e:
             print(f"Error during generate_content_stream: {e}")
-            return b""
+            return empty
 
         if not combined_data:
-            return b""
+            return empty
 
-        # If it was raw PCM, we need to add the WAV header based on the mime type parameters
         if is_raw_pcm:
             print("Is raw pcm")
-            return self._convert_to_wav(
-                bytes(combined_data),
-                last_mime_type or "audio/L16;rate=24000",
-            )
+            params = self._parse_audio_mime_type(last_mime_type or "audio/L16")
+            return combined_data, "pcm", params
 
-        # Otherwise return the accumulated data (e.g. if it was mp3)
         print("Generated audio is mp3")
-        return bytes(combined_data)
+        return combined_data, "mp3", {}
 
-    def _convert_to_wav(self, audio_data: bytes, mime_type: str) -> bytes:
+    def _convert_to_wav(
+        self, audio_data: bytes | bytearray, parameters: dict[str, Optional[int]]
+    ) -> bytes:
         """Generates a WAV file header for the given audio data and parameters."""
-        parameters = self._parse_audio_mime_type(mime_type)
         bits_per_sample = parameters["bits_per_sample"] or 16
         sample_rate = parameters["rate"] or 24000
         num_channels = 1
@@ -219,8 +297,7 @@ class AudioGenerationService:
         byte_rate = sample_rate * block_align
         chunk_size = 36 + data_size
 
-        header = struct.pack(
-            "<4sI4s4sIHHIIHH4sI",
+        header = _WAV_HEADER.pack(
             b"RIFF",  # ChunkID
             chunk_size,  # ChunkSize
             b"WAVE",  # Format
@@ -239,7 +316,7 @@ class AudioGenerationService:
 
     def _convert_pcm_to_mp3(
         self,
-        pcm_bytes: bytes,
+        pcm_bytes: bytes | bytearray,
         sample_rate: int = 24000,
         channels: int = 1,
         bitrate: str = "128k",
@@ -275,7 +352,8 @@ class AudioGenerationService:
 
         Args:
             text: The text to convert to speech.
-            sample_rate: Audio sample rate (default: 24000 Hz)
+            sample_rate: Fallback sample rate when the stream does not report one
+                (default: 24000 Hz)
             bitrate: MP3 bitrate (default: "128k")
             validate: If True, validate content length before generation.
 
@@ -289,61 +367,29 @@ class AudioGenerationService:
         if validate:
             self.validate_content_length(text, strict=False)
 
-        # First generate the audio (which may be PCM or MP3)
-        audio_data = await self.generate_audio(
-            text, validate=False
-        )  # Already validated
-
-        # Check if it's already MP3 by looking at the header
-        # MP3 files typically start with ID3 tag or sync word (0xFF 0xFB/0xFA)
-        if len(audio_data) > 3 and (
-            audio_data[:3] == b"ID3"
-            or (audio_data[0] == 0xFF and audio_data[1] & 0xE0 == 0xE0)
-        ):
-            # Already MP3
-            return audio_data
-
-        # If it's WAV, we need to extract the PCM data and convert
-        if audio_data[:4] == b"RIFF":
-            # Extract PCM data from WAV (skip 44-byte header)
-            pcm_data = audio_data[44:]
+        payload, container, params = await self._generate_raw(text)
+        if not payload:
+            return b""
+
+        # Raw PCM goes straight to the encoder; no WAV header round-trip
+        if container == "pcm":
             return self._convert_pcm_to_mp3(
-                pcm_bytes=pcm_data,
-                sample_rate=sample_rate,
+                pcm_bytes=payload,
+                sample_rate=params.get("rate") or sample_rate,
                 channels=1,
                 bitrate=bitrate,
             )
 
-        # If it's raw PCM (no header), convert directly
-        return self._convert_pcm_to_mp3(
-            pcm_bytes=audio_data,
-            sample_rate=sample_rate,
-            channels=1,
-            bitrate=bitrate,
-        )
+        return bytes(payload)
 
-    def _parse_audio_mime_type(self, mime_type: str) -> dict[str, Optional[int]]:
-        """Parses bits per sample and rate from an audio MIME type string."""
-        bits_per_sample = 16
-        rate = 24000
-
-        if not mime_type:
-            return {"bits_per_sample": bits_per_sample, "rate": rate}
-
-        parts = mime_type.split(";")
-        for param in parts:
-            param = param.strip()
-            if param.lower().startswith("rate="):
-                try:
-                    rate_str = param.split("=", 1)[1]
-                    rate = int(rate_str)
-                except (ValueError, IndexError):
-                    pass
-            elif param.startswith("audio/L"):
-                try:
-                    rest = param.split("L", 1)[1]
-                    bits_per_sample = int(rest)
-                except (ValueError, IndexError):
-                    pass
+    @staticmethod
+    def _parse_audio_mime_type(mime_type: str) -> dict[str, Optional[int]]:
+        """
+        Parses bits per sample and rate from an audio MIME type string.
 
+        The rate is None when the MIME type does not carry one, so callers can
+        apply their own fallback. Each call returns a new dict, so callers may
+        modify it.
+        """
+        bits_per_sample, rate = _parse_mime_params(mime_type)
         return {"bits_per_sample": bits_per_sample, "rate": rate}
@@ -1,24 +1,123 @@
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
+import requests
 import resend
+from requests.adapters import HTTPAdapter
+from resend.http_client import HTTPClient
+
 from app.common.config import Settings
 from app.common.email import render_template
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept open to the Resend API
+RESEND_POOL_SIZE = 16
+
+
+class SessionHTTPClient(HTTPClient):
+    """
+    Resend HTTP client backed by a shared requests.Session.
+
+    Resend's default client calls requests.request() for every email, which
+    opens (and TLS-handshakes) a new connection each time. A session keeps a
+    pool of keep-alive connections that are reused across sends.
+    """
+
+    def __init__(self, timeout: int = 30, pool_size: int = RESEND_POOL_SIZE):
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: Optional[Union[Dict[str, object], List[object]]] = None,
+        **kwargs: Any,
+    ) -> Tuple[bytes, int, Mapping[str, str]]:
+        # Newer Resend versions also pass files/data (None when unused)
+        extra = {key: value for key, value in kwargs.items() if value is not None}
+        try:
+            resp = self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                timeout=self._timeout,
+                **extra,
+            )
+            return resp.content, resp.status_code, resp.headers
+        except requests.RequestException as e:
+            # Resend wraps this in a ResendError, as with its default client
+            raise RuntimeError(f"Request failed: {e}") from e
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._session.close()
+
 
 class EmailService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.api_key = settings.RESEND_API_KEY
+        self.http_client = SessionHTTPClient()
+        resend.default_http_client = self.http_client
         if self.api_key:
             resend.api_key = self.api_key
         else:
             logger.warning("RESEND_API_KEY is not set. Email sending will fail.")
 
-    def send_email(
+    def close(self) -> None:
+        """Release the pooled Resend connections."""
+        self.http_client.close()
+
+    async def send_email(
+        self,
+        to_email: Union[str, List[str]],
+        subject: str,
+        template_name: str,
+        context: Optional[Dict[str, Any]] = None,
+        cc_email: Optional[Union[str, List[str]]] = None,
+        bcc_email: Optional[Union[str, List[str]]] = None,
+    ) -> bool:
+        """
+        Send an email using Resend API without blocking the event loop.
+
+        Template rendering and the HTTP call to Resend are both blocking, so
+        they run in the default executor.
+
+        Args:
+            to_email: Recipient email address(es)
+            subject: Email subject
+            template_name: Name of the Jinja2 template to render
+            context: Context dictionary for template rendering
+            cc_email: CC recipient(s)
+            bcc_email: BCC recipient(s)
+
+        Returns:
+            bool: True if sent successfully, False otherwise
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            None,
+            partial(
+                self._send_email_sync,
+                to_email=to_email,
+                subject=subject,
+                template_name=template_name,
+                context=context,
+                cc_email=cc_email,
+                bcc_email=bcc_email,
+            ),
+        )
+
+    def _send_email_sync(
         self,
         to_email: Union[str, List[str]],
         subject: str,
@@ -28,7 +127,7 @@ class EmailService:
         bcc_email: Optional[Union[str, List[str]]] = None,
     ) -> bool:
         """
-        Send an email using Resend API.
+        Blocking implementation of send_email.
 
         Args:
             to_email: Recipient email address(es)
@@ -1,12 +1,10 @@
 """Service for sending push notifications via Firebase Cloud Messaging."""
 
-import os
-import json
 import logging
 from typing import Optional, Dict, Any, List
 
 import firebase_admin
-from firebase_admin import credentials, messaging
+from firebase_admin import messaging
 
 from app.common.config import Settings
 
@@ -32,15 +30,9 @@ class FirebaseFCMService:
             # If explicit credentials provided in settings, use them
             if self.settings.FIREBASE_CREDENTIALS_JSON:
                 try:
-                    if os.path.exists(self.settings.FIREBASE_CREDENTIALS_JSON):
-                        cred = credentials.Certificate(
-                            self.settings.FIREBASE_CREDENTIALS_JSON
-                        )
-                    else:
-                        cred_info = json.loads(self.settings.FIREBASE_CREDENTIALS_JSON.replace('\n', '\\n'))
-                        cred = credentials.Certificate(cred_info)
-
-                    firebase_admin.initialize_app(cred, options)
+                    firebase_admin.initialize_app(
+                        self.settings.firebase_credentials, options
+                    )
                     return
                 except Exception as e:
                     logger.error(f"Error loading explicit Firebase credentials: {e}")
@@ -180,3 +172,33 @@ class FirebaseFCMService:
         except Exception as e:
             logger.error(f"Error sending multicast FCM message: {e}")
             return None
+
+    def send_many(
+        self, messages: List[messaging.Message]
+    ) -> Optional[messaging.BatchResponse]:
+        """
+        Send several prebuilt messages in one batch.
+
+        Unlike send_multicast, each message may target a different token or
+        topic and carry its own payload. The SDK dispatches the batch
+        concurrently, so total latency is roughly that of the slowest send
+        rather than the sum of all of them.
+
+        Args:
+            messages: Messages built with messaging.Message (max 500).
+
+        Returns:
+            BatchResponse with a result per message, or None on failure.
+        """
+        if not messages:
+            return None
+
+        try:
+            response = messaging.send_each(messages)
+            logger.info(
+                f"Sent FCM batch of {len(messages)}. Success: {response.success_count}, Failure: {response.failure_count}"
+            )
+            return response
+        except Exception as e:
+            logger.error(f"Error sending FCM message batch: {e}")
+            return None
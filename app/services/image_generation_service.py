@@ -1,13 +1,17 @@
 """Service for generating images using Gemini."""
 
 import asyncio
+import logging
 from typing import Optional
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from google.genai.client import AsyncClient
 
 from app.common.config import Settings
 
+logger = logging.getLogger(__name__)
+
 
 class ImageGenerationService:
     """Service for generating image content."""
@@ -16,7 +20,64 @@ class ImageGenerationService:
         self.settings = settings
         self.api_key = settings.GEMINI_API_KEY
         if not self.api_key:
-            print("Warning: GEMINI_API_KEY not set")
+            logger.warning("GEMINI_API_KEY not set")
+
+        # One client per service so its HTTP connection pool is reused
+        self._client: Optional[AsyncClient] = (
+            self._create_client() if self.api_key else None
+        )
+
+    def _create_client(self) -> Optional[AsyncClient]:
+        """Create the google-genai async client (``Client.aio``)."""
+        try:
+            client = genai.Client(
+                api_key=self.api_key,
+                vertexai=False,
+                http_options=types.HttpOptions(
+                    timeout=int(self.settings.IMAGE_GENERATION_TIMEOUT_S * 1000)
+                ),
+            )
+            logger.debug("Using Google AI (API Key) backend for image generation")
+            return client.aio
+        except Exception as e:
+            logger.exception("Google AI (API Key) initialization failed: %s", e)
+            return None
+
+    def _get_async_client(self) -> Optional[AsyncClient]:
+        """Return the shared client, creating it if a previous attempt failed."""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _reinit_client(self) -> None:
+        """Drop the shared client so the next request builds a fresh one."""
+        self._client = None
+
+    @staticmethod
+    def _extract_image(response: types.GenerateContentResponse) -> Optional[bytes]:
+        """
+        Return the first inline image in the response, or None.
+
+        The model may answer with text alongside the image, so every part of
+        the first candidate is checked, not only the first one.
+        """
+        candidates = response.candidates
+        content = candidates[0].content if candidates else None
+        parts = content.parts if content is not None else None
+        if not parts:
+            return None
+
+        for part in parts:
+            inline_data = getattr(part, "inline_data", None)
+            data = inline_data.data if inline_data is not None else None
+            if data:
+                return data
+
+        for part in parts:
+            text = getattr(part, "text", None)
+            if text:
+                logger.debug("Image generation text response: %s", text)
+        return None
 
     async def generate_image(self, prompt: str) -> Optional[bytes]:
         """
@@ -28,21 +89,13 @@ class ImageGenerationService:
         Returns:
             The generated image data as bytes, or None if generation fails.
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._generate_image_sync, prompt
-        )
-
-    def _generate_image_sync(self, prompt: str) -> Optional[bytes]:
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY is not set")
 
         model = "gemini-3-pro-image-preview"
 
-        try:
-            client = genai.Client(api_key=self.api_key, vertexai=False)
-            print("Using Google AI (API Key) backend for image generation")
-        except Exception as e:
-            print(f"Google AI (API Key) initialization failed: {e}")
+        client = self._get_async_client()
+        if client is None:
             return None
 
         contents = [
@@ -64,31 +117,26 @@ class ImageGenerationService:
             ),
         )
 
+        timeout_s = self.settings.IMAGE_GENERATION_TIMEOUT_S
         try:
-            # Iterate through the stream and capture the first image found
-            response = client.models.generate_content(
-                model=model,
-                contents=contents,
-                config=generate_content_config,
+            # Allow a little slack over the HTTP timeout for response decoding
+            response = await asyncio.wait_for(
+                client.models.generate_content(
+                    model=model,
+                    contents=contents,
+                    config=generate_content_config,
+                ),
+                timeout=timeout_s + 5,
             )
 
-            if (
-                response.candidates is None
-                or not response.candidates
-                or response.candidates[0].content is None
-                or response.candidates[0].content.parts is None
-                or not response.candidates[0].content.parts
-            ):
-                return None
-
-            part = response.candidates[0].content.parts[0]
-            if part.inline_data and part.inline_data.data:
-                return part.inline_data.data
-
-            if hasattr(part, "text") and part.text:
-                print(f"Image generation text response: {part.text}")
-
-        except Exception as e:
-            print(f"Error during generate_content: {e}")
+            return self._extract_image(response)
+        except asyncio.TimeoutError:
+            logger.warning("Image generation exceeded %ss deadline", timeout_s)
+        except errors.ClientError as e:
+            logger.error("Error during generate_content: %s", e)
+            if e.code in (401, 403):
+                self._reinit_client()
+        except Exception:
+            logger.exception("Error during generate_content")
 
         return None
@@ -1,17 +1,58 @@
 """LangChain service for AI operations with flexible backend support."""
 
-from typing import Any, Optional, Type, TypeVar, List
-from pydantic import BaseModel
+import asyncio
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Optional, Type, TypeVar, List
+from pydantic import BaseModel, ValidationError
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda, RunnableSequence
 from langchain_core.tools import BaseTool
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from app.common.config import Settings
+from app.services.llm_cache import (
+    CacheBackend,
+    CachedResponse,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+    SemanticIndex,
+    cache_key,
+    scope_key,
+)
 
 
 T = TypeVar("T", bound=BaseModel)
 
+# Maximum number of compiled prompt|llm chains kept per service instance
+CHAIN_CACHE_SIZE = 256
+
+# Model tiers selectable per call: "quality" is the configured model, "fast" a
+# smaller, cheaper model for simple templated tasks
+TASK_PROFILES = ("quality", "fast")
+
+
+def _json_output_parser(parser: PydanticOutputParser) -> Runnable:
+    """
+    Parse JSON-mode model output straight into the parser's schema.
+
+    model_validate_json builds the model in a single pass over the raw text;
+    LangChain's parser first materializes a dict and then validates it. Output
+    that is not strict JSON (e.g. wrapped in a markdown fence) falls back to
+    the original parser.
+    """
+    schema = parser.pydantic_object
+
+    def parse(message: BaseMessage) -> BaseModel:
+        try:
+            return schema.model_validate_json(message.text)
+        except ValidationError:
+            return parser.invoke(message)
+
+    return RunnableLambda(parse)
+
 
 class LangChainService:
     """
@@ -23,6 +64,8 @@ class LangChainService:
     - Custom system and user prompts
     - Tool integration support
     - Async operations
+    - Exact and semantic response caching for deterministic calls
+    - Per-call routing of simple tasks to a smaller model (task_profile)
     """
 
     def __init__(
@@ -31,6 +74,8 @@ class LangChainService:
         backend: str = "gemini",
         model: Optional[str] = None,
         temperature: float = 0.7,
+        cache_backend: Optional[CacheBackend] = None,
+        semantic_index: Optional[SemanticIndex] = None,
     ):
         """
         Initialize LangChain service with specified backend.
@@ -40,11 +85,24 @@ class LangChainService:
             backend: Backend to use ("gemini" or "openai")
             model: Model name (defaults to backend-specific default)
             temperature: Model temperature (0.0-1.0)
+            cache_backend: Response store (defaults to SQLite at LLM_CACHE_PATH
+                if set, otherwise the in-process cache)
+            semantic_index: Embedding index for near-duplicate prompts
+                (defaults to one built from settings when enabled)
         """
         self.settings = settings
         self.backend = backend
         self.temperature = temperature
         self.llm = self._initialize_llm(backend, model, temperature)
+        self.model_name = self._model_name(self.llm)
+        self._llm_fast: Optional[BaseChatModel] = None
+
+        self.cache_enabled = settings.LLM_CACHE_ENABLED
+        self.cache_backend: CacheBackend = cache_backend or self._initialize_cache_backend()
+        self.semantic_index = semantic_index or self._initialize_semantic_index()
+        self.stats = {"hits": 0, "misses": 0}
+        self._chain_cache: OrderedDict[tuple, Runnable] = OrderedDict()
+        self._bound_llm_cache: Dict[tuple, Runnable] = {}
 
     def _initialize_llm(
         self,
@@ -76,12 +134,167 @@ class LangChainService:
         else:
             raise ValueError(f"Unsupported backend: {backend}")
 
+    @staticmethod
+    def _model_name(llm: BaseChatModel) -> str:
+        return getattr(llm, "model", None) or getattr(llm, "model_name", "")
+
+    def _get_llm(self, task_profile: str) -> BaseChatModel:
+        """
+        Return the model for a task profile.
+
+        The "fast" model is built on first use from LLM_FAST_MODEL_* settings.
+        """
+        if task_profile == "quality":
+            return self.llm
+        if task_profile != "fast":
+            raise ValueError(
+                f"Unsupported task_profile: {task_profile} (expected one of {TASK_PROFILES})"
+            )
+
+        if self._llm_fast is None:
+            fast_model = (
+                self.settings.LLM_FAST_MODEL_GEMINI
+                if self.backend == "gemini"
+                else self.settings.LLM_FAST_MODEL_OPENAI
+            )
+            self._llm_fast = self._initialize_llm(
+                self.backend, fast_model, self.temperature
+            )
+        return self._llm_fast
+
+    def _initialize_cache_backend(self) -> CacheBackend:
+        """Pick the response store configured in settings."""
+        if self.settings.LLM_CACHE_PATH:
+            return SQLiteCacheBackend(self.settings.LLM_CACHE_PATH)
+        return InMemoryCacheBackend()
+
+    def _initialize_semantic_index(self) -> Optional[SemanticIndex]:
+        """Build the semantic cache index if enabled in settings."""
+        if not (self.settings.LLM_CACHE_ENABLED and self.settings.LLM_SEMANTIC_CACHE_ENABLED):
+            return None
+
+        if self.backend == "gemini":
+            embeddings: Any = GoogleGenerativeAIEmbeddings(
+                model="models/gemini-embedding-001",
+                google_api_key=self.settings.GEMINI_API_KEY,  # ty:ignore[invalid-argument-type]
+            )
+        else:
+            embeddings = OpenAIEmbeddings(
+                api_key=self.settings.OPENAI_API_KEY,  # ty:ignore[invalid-argument-type]
+            )
+
+        return SemanticIndex(
+            embeddings, threshold=self.settings.LLM_SEMANTIC_CACHE_THRESHOLD
+        )
+
+    def _get_chain(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        tools: Optional[List[BaseTool]],
+        response_schema: Optional[Type[BaseModel]],
+        context_prompt: Optional[str] = None,
+        task_profile: str = "quality",
+    ) -> Runnable:
+        """
+        Return the prompt|llm chain for this call shape, building it on first use.
+
+        Templating is only paid once per (prompts, tools, schema) combination;
+        tool binding and structured-output schema conversion are shared across
+        prompts via _get_bound_llm.
+
+        When context_prompt is given it is sent as its own user message between
+        the system prompt and the user prompt.
+        """
+        tools_key = tuple(sorted(tool.name for tool in tools)) if tools else ()
+        key = (
+            system_prompt,
+            user_prompt,
+            tools_key,
+            response_schema,
+            context_prompt,
+            task_profile,
+        )
+
+        chain = self._chain_cache.get(key)
+        if chain is not None:
+            self._chain_cache.move_to_end(key)
+            return chain
+
+        # Create prompt template
+        messages = [("system", system_prompt)]
+        if context_prompt is not None:
+            messages.append(("user", context_prompt))
+        messages.append(("user", user_prompt))
+        template = ChatPromptTemplate.from_messages(messages)
+
+        llm = self._get_bound_llm(task_profile, tools, tools_key, response_schema)
+
+        chain = template | llm
+        self._chain_cache[key] = chain
+        if len(self._chain_cache) > CHAIN_CACHE_SIZE:
+            self._chain_cache.popitem(last=False)
+        return chain
+
+    def _get_bound_llm(
+        self,
+        task_profile: str,
+        tools: Optional[List[BaseTool]],
+        tools_key: tuple,
+        response_schema: Optional[Type[BaseModel]],
+    ) -> Runnable:
+        """
+        Return the model with tools and structured output bound.
+
+        Cached separately from the prompt chains: prompts that embed request
+        data (e.g. course generation) rarely repeat, but the schema does, and
+        with_structured_output() regenerates its JSON schema on every call.
+        """
+        key = (task_profile, tools_key, response_schema)
+        llm = self._bound_llm_cache.get(key)
+        if llm is not None:
+            return llm
+
+        llm = self._get_llm(task_profile)
+
+        # Bind tools if provided
+        if tools:
+            llm = llm.bind_tools(tools)
+
+        # Add structured output if schema provided
+        if response_schema:
+            llm = llm.with_structured_output(response_schema)
+            # JSON-mode backends (Gemini) end in a PydanticOutputParser
+            if isinstance(llm, RunnableSequence) and isinstance(
+                llm.last, PydanticOutputParser
+            ):
+                llm = RunnableSequence(
+                    *llm.steps[:-1], _json_output_parser(llm.last)
+                )
+
+        self._bound_llm_cache[key] = llm
+        return llm
+
+    def _read_cached(
+        self,
+        cached: Optional[CachedResponse],
+        schema_name: Optional[str],
+        response_schema: Optional[Type[BaseModel]],
+    ) -> Any:
+        """Decode a cache entry, or return None if it does not fit this call."""
+        if cached is None or cached.schema_name != schema_name:
+            return None
+        if response_schema:
+            return response_schema.model_validate_json(cached.response_json)
+        return cached.response_json
+
     async def invoke(
         self,
         system_prompt: str,
         user_prompt: str,
         response_schema: Optional[Type[T]] = None,
         tools: Optional[List[BaseTool]] = None,
+        task_profile: str = "quality",
         **kwargs: Any,
     ) -> T | str:
         """
@@ -92,6 +305,8 @@ class LangChainService:
             user_prompt: User's input prompt
             response_schema: Optional Pydantic model for structured output
             tools: Optional list of LangChain tools to attach
+            task_profile: "quality" for the configured model, or "fast" to
+                route simple tasks to a smaller, cheaper model
             **kwargs: Additional variables for prompt formatting
 
         Returns:
@@ -110,42 +325,223 @@ class LangChainService:
             )
             ```
         """
-        # Create prompt template
-        template = ChatPromptTemplate.from_messages(
-            [
-                ("system", system_prompt),
-                ("user", user_prompt),
-            ]
+        return await self._invoke(
+            system_prompt,
+            user_prompt,
+            response_schema,
+            tools,
+            kwargs,
+            task_profile=task_profile,
         )
 
-        # Build the chain
-        llm: Any = self.llm
+    async def _invoke(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_schema: Optional[Type[T]],
+        tools: Optional[List[BaseTool]],
+        variables: Dict[str, Any],
+        context_prompt: Optional[str] = None,
+        task_profile: str = "quality",
+    ) -> T | str:
+        """Shared implementation of invoke() and invoke_with_context()."""
+        model_name = self._model_name(self._get_llm(task_profile))
+        schema_name = (
+            f"{response_schema.__module__}.{response_schema.__qualname__}"
+            if response_schema
+            else None
+        )
 
-        # Bind tools if provided
-        if tools:
-            llm = llm.bind_tools(tools)
+        # Tool-calling responses are messages, not final answers; never cache them
+        key = None
+        if self.cache_enabled and not tools:
+            key = cache_key(
+                backend=self.backend,
+                model=model_name,
+                temperature=self.temperature,
+                system_prompt=system_prompt,
+                user_prompt="\n\n".join(filter(None, [context_prompt, user_prompt])),
+                schema_name=schema_name,
+                variables=variables,
+            )
 
-        # Add structured output if schema provided
-        if response_schema:
-            llm = llm.with_structured_output(response_schema)
+        scope = None
+        embedding = None
+        if key is not None:
+            hit = self._read_cached(
+                await self._cache_get(key), schema_name, response_schema
+            )
 
-        # Create and invoke chain
-        chain = template | llm
+            # Prompt variables change the final prompt, so only plain prompts
+            # are eligible for semantic matching
+            if hit is None and self.semantic_index is not None and not variables:
+                scope = scope_key(
+                    backend=self.backend,
+                    model=model_name,
+                    system_prompt=system_prompt,
+                    schema_name=schema_name,
+                )
+                embedding = await self.semantic_index.embed(user_prompt)
+                match = self.semantic_index.search(scope, embedding)
+                if match is not None:
+                    hit = self._read_cached(
+                        await self._cache_get(match), schema_name, response_schema
+                    )
 
-        # Invoke with any additional kwargs for prompt variables
-        response: Any = await chain.ainvoke(kwargs if kwargs else {})
+            if hit is not None:
+                self.stats["hits"] += 1
+                return hit
+            self.stats["misses"] += 1
+
+        chain = self._get_chain(
+            system_prompt,
+            user_prompt,
+            tools,
+            response_schema,
+            context_prompt,
+            task_profile,
+        )
+
+        # Invoke with any additional variables for the prompt templates
+        response: Any = await chain.ainvoke(variables)
 
         # Return structured response or content
         if response_schema:
-            return response  # type: ignore[return-value]
+            result = response
         else:
             # For non-structured responses, extract content
-            return (
-                response.content
-                if hasattr(response, "content")
-                else str(response)  # ty:ignore[invalid-return-type]
+            result = response.content if hasattr(response, "content") else str(response)
+
+        if key is not None:
+            await self._store_cached(key, result, schema_name, scope, embedding)
+
+        return result  # type: ignore[return-value]
+
+    async def _cache_get(self, key: str) -> Optional[CachedResponse]:
+        """Read from the cache backend in a worker thread (it may hit disk)."""
+        return await asyncio.to_thread(self.cache_backend.get, key)
+
+    async def _store_cached(
+        self,
+        key: str,
+        result: Any,
+        schema_name: Optional[str],
+        scope: Optional[str],
+        embedding: Any,
+    ) -> None:
+        """Persist a fresh response and index it for semantic lookups."""
+        if isinstance(result, BaseModel):
+            response_json = result.model_dump_json()
+        elif isinstance(result, str):
+            response_json = result
+        else:
+            # Multi-part content blocks; not worth caching
+            return
+
+        await asyncio.to_thread(
+            self.cache_backend.set,
+            key,
+            CachedResponse(
+                key=key,
+                response_json=response_json,
+                schema_name=schema_name,
+                embedding=embedding.tolist() if embedding is not None else None,
+            ),
+        )
+        if scope is not None and embedding is not None and self.semantic_index:
+            self.semantic_index.add(scope, key, embedding)
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a plain-text response chunk by chunk.
+
+        Structured output cannot be streamed, so this only supports free-text
+        responses. Cached responses are yielded as a single chunk, and a fully
+        streamed response is cached like a regular invoke() result.
+
+        Args:
+            system_prompt: System/master prompt defining AI behavior
+            user_prompt: User's input prompt
+            **kwargs: Additional variables for prompt formatting
+
+        Yields:
+            Text chunks as they arrive from the model
+        """
+        key = None
+        if self.cache_enabled:
+            key = cache_key(
+                backend=self.backend,
+                model=self.model_name,
+                temperature=self.temperature,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                schema_name=None,
+                variables=kwargs,
             )
 
+        if key is not None:
+            hit = self._read_cached(await self._cache_get(key), None, None)
+            if hit is not None:
+                self.stats["hits"] += 1
+                yield hit
+                return
+            self.stats["misses"] += 1
+
+        chain = self._get_chain(system_prompt, user_prompt, None, None) | StrOutputParser()
+
+        chunks: List[str] = []
+        async for chunk in chain.astream(kwargs if kwargs else {}):
+            chunks.append(chunk)
+            yield chunk
+
+        if key is not None:
+            await self._store_cached(key, "".join(chunks), None, None, None)
+
+    async def ainvoke_many(
+        self,
+        system_prompt: str,
+        user_prompts: List[str],
+        response_schema: Optional[Type[T]] = None,
+        tools: Optional[List[BaseTool]] = None,
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[T | str]:
+        """
+        Invoke the LLM for several user prompts concurrently.
+
+        Each prompt goes through invoke(), so chain reuse and response caching
+        still apply; at most ``max_concurrency`` requests are in flight.
+
+        Args:
+            system_prompt: System/master prompt shared by every call
+            user_prompts: User prompts to run
+            response_schema: Optional Pydantic model for structured output
+            tools: Optional list of LangChain tools to attach
+            max_concurrency: Maximum number of concurrent LLM requests
+            **kwargs: Prompt variables shared by every call
+
+        Returns:
+            Responses in the same order as ``user_prompts``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(user_prompt: str) -> T | str:
+            async with semaphore:
+                return await self.invoke(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    response_schema=response_schema,
+                    tools=tools,
+                    **kwargs,
+                )
+
+        return list(await asyncio.gather(*(run(p) for p in user_prompts)))
+
     async def invoke_with_context(
         self,
         system_prompt: str,
@@ -167,12 +563,14 @@ class LangChainService:
         Returns:
             Structured response or string
         """
-        # Combine context with user prompt
-        full_user_prompt = f"Context:\n{context}\n\nQuery:\n{user_prompt}"
-
-        return await self.invoke(
-            system_prompt=system_prompt,
-            user_prompt=full_user_prompt,
-            response_schema=response_schema,
-            tools=tools,
+        # The context travels as a prompt variable in its own message, so the
+        # system prompt stays a stable prefix for provider-side prompt caching
+        # and the compiled chain is shared by every call with this query shape.
+        return await self._invoke(
+            system_prompt,
+            f"Query:\n{user_prompt}",
+            response_schema,
+            tools,
+            {"context": context},
+            context_prompt="Context:\n{context}",
         )
@@ -0,0 +1,215 @@
+"""Response caching for LangChainService.
+
+Two tiers are supported:
+
+- Exact: a SHA-256 key over everything that determines the model output
+  (backend, model, temperature, prompts, schema and prompt variables).
+- Semantic: cosine similarity between embedded user prompts, restricted to
+  calls that share the same backend, model, system prompt and schema.
+
+Only deterministic calls (temperature == 0) are cached; sampling at a higher
+temperature is expected to produce different output on every call.
+
+Responses live in the in-process cache_service by default; SQLiteCacheBackend
+persists them on disk so repeated runs of scripts and demos reuse them.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.common.cache import cache_service
+
+LLM_RESPONSE_CACHE = "llm_responses"
+
+cache_service.register(LLM_RESPONSE_CACHE, maxsize=1024, ttl=3600)
+
+
+@dataclass
+class CachedResponse:
+    """A stored LLM response."""
+
+    key: str
+    response_json: str
+    schema_name: Optional[str]
+    embedding: Optional[List[float]] = None
+
+
+class CacheBackend(Protocol):
+    """
+    Storage for cached responses (e.g. in-process LRU, Redis).
+
+    Methods may block (disk or network I/O); LangChainService calls them from
+    a worker thread, so implementations must be thread-safe.
+    """
+
+    def get(self, key: str) -> Optional[CachedResponse]: ...
+
+    def set(self, key: str, value: CachedResponse) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """CacheBackend on top of a cache_service TTL/LRU namespace."""
+
+    def __init__(self, namespace: str = LLM_RESPONSE_CACHE):
+        self.namespace = namespace
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        return cache_service.get(self.namespace, key)
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        cache_service.set(self.namespace, key, value)
+
+
+class SQLiteCacheBackend:
+    """CacheBackend persisted to a local SQLite file."""
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite file path; parent directories are created
+            ttl: Seconds an entry stays valid (None keeps entries forever)
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses ("
+            " key TEXT PRIMARY KEY,"
+            " response_json TEXT NOT NULL,"
+            " schema_name TEXT,"
+            " embedding TEXT,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json, schema_name, embedding, created_at"
+                " FROM llm_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        response_json, schema_name, embedding, created_at = row
+        if self.ttl is not None and time.time() - created_at > self.ttl:
+            return None
+        return CachedResponse(
+            key=key,
+            response_json=response_json,
+            schema_name=schema_name,
+            embedding=json.loads(embedding) if embedding else None,
+        )
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        embedding = json.dumps(value.embedding) if value.embedding is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses"
+                " (key, response_json, schema_name, embedding, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value.response_json, value.schema_name, embedding, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _digest(parts: List[Any]) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(
+    *,
+    backend: str,
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    schema_name: Optional[str],
+    variables: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """
+    Build the exact-match cache key for an LLM call.
+
+    Returns:
+        The hex digest, or None when the call is non-deterministic
+        (temperature != 0) and must not be cached.
+    """
+    if temperature != 0:
+        return None
+    return _digest(
+        [backend, model, temperature, system_prompt, user_prompt, schema_name, variables or {}]
+    )
+
+
+def scope_key(
+    *, backend: str, model: str, system_prompt: str, schema_name: Optional[str]
+) -> str:
+    """Key for the set of calls a semantic match may be drawn from."""
+    return _digest([backend, model, system_prompt, schema_name])
+
+
+class SemanticIndex:
+    """Cosine top-1 lookup over embedded user prompts."""
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold: float = 0.92,
+        max_entries_per_scope: int = 512,
+    ):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries_per_scope = max_entries_per_scope
+        self._keys: Dict[str, List[str]] = {}
+        self._vectors: Dict[str, np.ndarray] = {}
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed and L2-normalize *text* so dot products are cosine similarities."""
+        vector = np.asarray(await self.embeddings.aembed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def search(self, scope: str, vector: np.ndarray) -> Optional[str]:
+        """Return the key of the closest stored prompt above the threshold."""
+        matrix = self._vectors.get(scope)
+        if matrix is None or not len(matrix):
+            return None
+
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._keys[scope][best]
+        return None
+
+    def add(self, scope: str, key: str, vector: np.ndarray) -> None:
+        """Index *vector* under *scope*, evicting the oldest entry when full."""
+        keys = self._keys.setdefault(scope, [])
+        matrix = self._vectors.get(scope)
+        row = vector.reshape(1, -1)
+
+        keys.append(key)
+        matrix = row if matrix is None else np.vstack([matrix, row])
+
+        if len(keys) > self.max_entries_per_scope:
+            del keys[0]
+            matrix = matrix[1:]
+
+        self._vectors[scope] = matrix
@@ -1,8 +1,10 @@
 """Service for database maintenance and cleanup tasks."""
 
+import asyncio
 import logging
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import AsyncRetrying, retry_if_result, stop_after_attempt, wait_exponential
 from app.features.lessons.repository import LessonAudioRepository
 from app.features.courses.repository import CourseRepository
 from app.services.storage_service import FirebaseStorageService
@@ -10,6 +12,10 @@ from app.common.service import Commitable
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for files whose batched storage delete failed
+STORAGE_DELETE_ATTEMPTS = 3
+STORAGE_RETRY_WAIT = wait_exponential(multiplier=0.25, max=2)
+
 
 class DBMaintenanceService(Commitable):
     """Service for cross-feature database maintenance operations."""
@@ -30,37 +36,68 @@ class DBMaintenanceService(Commitable):
         await self.audio_repo.session.commit()
         await self.course_repo.session.commit()
 
+    async def _delete_files(self, urls: List[str]) -> List[bool]:
+        """
+        Delete files from storage in batched requests.
+
+        The Firebase SDK is blocking, so the batches run in a worker thread.
+        Files that still fail are retried individually with backoff. Results
+        are returned in the same order as *urls*.
+        """
+        if not urls:
+            return []
+        results = await asyncio.to_thread(self.storage_service.delete_files, urls)
+        deleted = [results.get(url, False) for url in urls]
+
+        failed = [i for i, ok in enumerate(deleted) if not ok]
+        if failed:
+            retried = await asyncio.gather(
+                *(self._retry_delete(urls[i]) for i in failed)
+            )
+            for i, ok in zip(failed, retried):
+                deleted[i] = ok
+        return deleted
+
+    async def _retry_delete(self, url: str) -> bool:
+        """Retry a single storage delete with exponential backoff."""
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(STORAGE_DELETE_ATTEMPTS),
+            wait=STORAGE_RETRY_WAIT,
+            retry=retry_if_result(lambda ok: not ok),
+            retry_error_callback=lambda state: False,
+        )
+        return await retrying(asyncio.to_thread, self.storage_service.delete_file, url)
+
     async def cleanup_orphaned_audios(self) -> dict:
         """
         Identify and delete LessonAudio records that are no longer linked to a lesson.
 
         Process:
-        1. Fetch all LessonAudio records where lesson_id is NULL.
+        1. Fetch (id, audio_url) for LessonAudio rows where lesson_id is NULL.
         2. Delete the files from Firebase Storage using their audio_url.
-        3. Delete the records from the database.
+        3. Delete the records from the database in one bulk DELETE, skipping
+           any whose file could not be removed.
         """
         logger.info("Starting orphaned audios cleanup...")
-        orphaned_audios = await self.audio_repo.get_orphaned_audios()
+        orphaned_audios = await self.audio_repo.get_orphaned_audio_ids_and_urls()
 
         if not orphaned_audios:
             logger.info("No orphaned audios found.")
             return {"deleted_count": 0, "storage_deleted": 0}
 
         logger.info(f"Found {len(orphaned_audios)} orphaned audios.")
-        deleted_from_storage = 0
-        deleted_from_db = 0
 
-        for audio in orphaned_audios:
-            if audio.audio_url:
-                if self.storage_service.delete_file(audio.audio_url):
-                    deleted_from_storage += 1
-                else:
-                    logger.warning(
-                        f"Failed to delete audio file from storage: {audio.audio_url}"
-                    )
+        urls = [url for _, url in orphaned_audios if url]
+        storage_results = await self._delete_files(urls)
+        deleted_from_storage = sum(storage_results)
+        failed_urls = {url for url, deleted in zip(urls, storage_results) if not deleted}
+        for url in failed_urls:
+            logger.warning(f"Failed to delete audio file from storage: {url}")
 
-            await self.audio_repo.delete(audio)
-            deleted_from_db += 1
+        # Keep rows whose file is still in storage so the next run retries it
+        deleted_from_db = await self.audio_repo.delete_by_ids(
+            [audio_id for audio_id, url in orphaned_audios if url not in failed_urls]
+        )
 
         await self.audio_repo.session.commit()
 
@@ -77,32 +114,32 @@ class DBMaintenanceService(Commitable):
         Identify and delete Course records that have no creator and are not public.
 
         Process:
-        1. Fetch courses where user_id is NULL and is_public is FALSE.
+        1. Fetch (id, image_url) for courses where user_id is NULL and
+           is_public is FALSE.
         2. Delete the course image from Firebase Storage.
-        3. Delete the record from the database.
+        3. Delete the records from the database in one bulk DELETE, skipping
+           any whose image could not be removed.
         """
         logger.info("Starting orphaned courses cleanup...")
-        orphaned_courses = await self.course_repo.get_orphaned_courses()
+        orphaned_courses = await self.course_repo.get_orphaned_course_ids_and_urls()
 
         if not orphaned_courses:
             logger.info("No orphaned courses found.")
             return {"deleted_count": 0, "storage_deleted": 0}
 
         logger.info(f"Found {len(orphaned_courses)} orphaned courses.")
-        deleted_from_storage = 0
-        deleted_from_db = 0
-
-        for course in orphaned_courses:
-            if course.image_url:
-                if self.storage_service.delete_file(course.image_url):
-                    deleted_from_storage += 1
-                else:
-                    logger.warning(
-                        f"Failed to delete course image from storage: {course.image_url}"
-                    )
-
-            await self.course_repo.delete(course)
-            deleted_from_db += 1
+
+        urls = [url for _, url in orphaned_courses if url]
+        storage_results = await self._delete_files(urls)
+        deleted_from_storage = sum(storage_results)
+        failed_urls = {url for url, deleted in zip(urls, storage_results) if not deleted}
+        for url in failed_urls:
+            logger.warning(f"Failed to delete course image from storage: {url}")
+
+        # Keep rows whose file is still in storage so the next run retries it
+        deleted_from_db = await self.course_repo.delete_by_ids(
+            [course_id for course_id, url in orphaned_courses if url not in failed_urls]
+        )
 
         await self.course_repo.session.commit()
 
@@ -1,20 +1,74 @@
 """Service for uploading files to Firebase Storage."""
 
-import os
+import asyncio
+import threading
 import uuid
-import json
+import urllib.parse
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import datetime
 
 import firebase_admin
-from firebase_admin import credentials, storage
+from firebase_admin import storage
 
 from app.common.config import Settings
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of operations Cloud Storage accepts in one batch request
+STORAGE_BATCH_SIZE = 100
+
+# (header prefix, extension, content type), checked in order.
+_AUDIO_MAGICS = (
+    (b"RIFF", "wav", "audio/wav"),
+    (b"ID3", "mp3", "audio/mpeg"),
+    (b"fLaC", "flac", "audio/flac"),
+    (b"OggS", "ogg", "audio/ogg"),
+)
+_DEFAULT_AUDIO_FORMAT = ("wav", "audio/wav")
+_MP3_FORMAT = ("mp3", "audio/mpeg")
+
+
+def sniff_audio_format(audio_data: bytes) -> Optional[Tuple[str, str]]:
+    """
+    Identify the audio container from its leading bytes.
+
+    Args:
+        audio_data: Bytes of the audio file.
+
+    Returns:
+        An (extension, content_type) tuple, or None when the header is not
+        recognised.
+    """
+    if len(audio_data) < 4:
+        return None
+
+    for magic, extension, content_type in _AUDIO_MAGICS:
+        if audio_data.startswith(magic):
+            return extension, content_type
+
+    # Headerless MP3 starts with an MPEG frame sync word (11 set bits)
+    header = memoryview(audio_data)
+    if header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        return _MP3_FORMAT
+
+    return None
+
+
+def detect_audio_format(audio_data: bytes) -> Tuple[str, str]:
+    """
+    Detect the audio container from its leading bytes.
+
+    Args:
+        audio_data: Bytes of the audio file.
+
+    Returns:
+        An (extension, content_type) tuple. Defaults to WAV when the header
+        is not recognised.
+    """
+    return sniff_audio_format(audio_data) or _DEFAULT_AUDIO_FORMAT
+
 
 class FirebaseStorageService:
     """Service for interacting with Firebase Storage."""
@@ -22,7 +76,23 @@ class FirebaseStorageService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.bucket_name = settings.FIREBASE_STORAGE_BUCKET
-        self._initialize_app()
+        self._bucket = None
+        self._init_lock = threading.Lock()
+
+    def initialize(self) -> None:
+        """
+        Initialize the Firebase app and resolve the storage bucket.
+
+        Called once at application startup (see app.common.startup) so that
+        credential parsing and bucket lookup stay off the request path.
+        Safe to call more than once, including from several threads.
+        """
+        if self._bucket is not None:
+            return
+        with self._init_lock:
+            if self._bucket is None:
+                self._initialize_app()
+                self._bucket = storage.bucket()
 
     def _initialize_app(self):
         """Initialize Firebase Admin SDK if not already initialized."""
@@ -32,15 +102,9 @@ class FirebaseStorageService:
             # If explicit credentials provided in settings, use them
             if self.settings.FIREBASE_CREDENTIALS_JSON:
                 try:
-                    if os.path.exists(self.settings.FIREBASE_CREDENTIALS_JSON):
-                        cred = credentials.Certificate(
-                            self.settings.FIREBASE_CREDENTIALS_JSON
-                        )
-                    else:
-                        cred_info = json.loads(self.settings.FIREBASE_CREDENTIALS_JSON.replace('\n', '\\n'))
-                        cred = credentials.Certificate(cred_info)
-
-                    firebase_admin.initialize_app(cred, options)
+                    firebase_admin.initialize_app(
+                        self.settings.firebase_credentials, options
+                    )
                     return
                 except Exception as e:
                     logger.error(f"Error loading explicit Firebase credentials: {e}")
@@ -52,6 +116,24 @@ class FirebaseStorageService:
             except Exception as e:
                 logger.error(f"Firebase default initialization fallback: {e}")
 
+    @property
+    def bucket(self):
+        """
+        The default bucket handle resolved by initialize().
+
+        If startup initialization failed (e.g. a transient credential or
+        network error), initialization is retried here so storage recovers
+        without a restart.
+        """
+        if self._bucket is None:
+            try:
+                self.initialize()
+            except Exception as e:
+                raise RuntimeError(
+                    f"FirebaseStorageService could not be initialized: {e}"
+                ) from e
+        return self._bucket
+
     def upload_bytes(
         self,
         data: bytes,
@@ -69,62 +151,63 @@ class FirebaseStorageService:
         Returns:
             The public download URL of the uploaded file.
         """
-        bucket = storage.bucket()
-        blob = bucket.blob(destination_path)
+        blob = self.bucket.blob(destination_path)
 
-        blob.upload_from_string(data, content_type=content_type)
-
-        # Make the blob public. This typically requires the bucket to allow it
+        # Apply the public-read ACL as part of the upload instead of a separate
+        # make_public() request. This typically requires the bucket to allow it
         # or specific IAM permissions.
-        # Alternatively we can generte a long-lived signed URL.
-        # But 'internet downloadable url' usually implies a direct link.
-
-        # Method 1: Signed URL (safer default if public access config is unknown)
+        # Alternatively we can generte a long-lived signed URL:
         # url = blob.generate_signed_url(expiration=datetime.timedelta(days=3650), method='GET')
-
-        # Method 2: Public URL (requires blob.make_public())
-        blob.make_public()
+        blob.upload_from_string(
+            data, content_type=content_type, predefined_acl="publicRead"
+        )
         return blob.public_url
 
+    async def upload_bytes_async(
+        self,
+        data: bytes,
+        destination_path: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Async variant of upload_bytes that runs the upload in a worker thread.
+
+        Args:
+            data: The bytes to upload.
+            destination_path: The path in the bucket (e.g., 'images/pic.jpg').
+            content_type: The MIME type of the file.
+
+        Returns:
+            The public download URL of the uploaded file.
+        """
+        return await asyncio.to_thread(
+            self.upload_bytes, data, destination_path, content_type
+        )
+
     def upload_audio(
         self,
         audio_data: bytes,
         filename_prefix: str = "audio",
         folder: str = "generated_audio",
+        audio_format: Optional[Tuple[str, str]] = None,
     ) -> str:
         """
         Helper to upload audio data specifically.
 
-        Auto-detects audio format (WAV or MP3) based on file headers.
+        Auto-detects audio format based on file headers unless the caller
+        already knows it.
 
         Args:
             audio_data: Bytes of the audio file (WAV or MP3).
             filename_prefix: Prefix for the filename.
             folder: The subfolder to save the file in.
+            audio_format: Optional (extension, content_type) pair, e.g. from
+                detect_audio_format(), to skip header detection.
 
         Returns:
             Public URL.
         """
-        # Detect audio format based on file header
-        if len(audio_data) >= 4:
-            # Check for WAV (RIFF header)
-            if audio_data[:4] == b"RIFF":
-                extension = "wav"
-                content_type = "audio/wav"
-            # Check for MP3 (ID3 tag or sync word)
-            elif audio_data[:3] == b"ID3" or (
-                audio_data[0] == 0xFF and audio_data[1] & 0xE0 == 0xE0
-            ):
-                extension = "mp3"
-                content_type = "audio/mpeg"
-            else:
-                # Default to WAV if unknown
-                extension = "wav"
-                content_type = "audio/wav"
-        else:
-            # Default to WAV for very small files
-            extension = "wav"
-            content_type = "audio/wav"
+        extension, content_type = audio_format or detect_audio_format(audio_data)
 
         filename = f"{filename_prefix}_{uuid.uuid4()}.{extension}"
         # Ensure proper path formation without double slashes if folder is empty
@@ -135,6 +218,46 @@ class FirebaseStorageService:
 
         return self.upload_bytes(audio_data, destination, content_type)
 
+    async def upload_audio_async(
+        self,
+        audio_data: bytes,
+        filename_prefix: str = "audio",
+        folder: str = "generated_audio",
+        audio_format: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """
+        Async variant of upload_audio that runs the upload in a worker thread.
+
+        Uploads share the bucket's client, and with it one authorized HTTP
+        session, so concurrent calls reuse its pooled connections.
+
+        Args:
+            audio_data: Bytes of the audio file (WAV or MP3).
+            filename_prefix: Prefix for the filename.
+            folder: The subfolder to save the file in.
+            audio_format: Optional (extension, content_type) pair.
+
+        Returns:
+            Public URL.
+        """
+        return await asyncio.to_thread(
+            self.upload_audio, audio_data, filename_prefix, folder, audio_format
+        )
+
+    def _blob_path(self, file_url: str) -> str:
+        """Resolve a public storage URL to its blob path within the bucket."""
+        # Public URL format is usually: https://storage.googleapis.com/{bucket}/{path}
+        # Or: https://firebasestorage.googleapis.com/v0/b/{bucket}/o/{path}?alt=media
+
+        # Simple path extraction for storage.googleapis.com URLs
+        if "storage.googleapis.com" in file_url:
+            return file_url.split(f"{self.bucket_name}/")[-1]
+        # Extraction for firebasestorage.googleapis.com URLs
+        if "firebasestorage.googleapis.com" in file_url:
+            return urllib.parse.unquote(file_url.split("/o/")[-1].split("?")[0])
+        # Fallback: try to see if it's just a path
+        return file_url
+
     def delete_file(self, file_url: str) -> bool:
         """
         Deletes a file from Firebase Storage given its public URL.
@@ -146,33 +269,50 @@ class FirebaseStorageService:
             True if deleted, False otherwise.
         """
         try:
-            # Extract path from URL (e.g. https://storage.googleapis.com/bucket/folder/file.mp3)
-            # Public URL format is usually: https://storage.googleapis.com/{bucket}/{path}
-            # Or: https://firebasestorage.googleapis.com/v0/b/{bucket}/o/{path}?alt=media
-
-            bucket = storage.bucket()
-
-            # Simple path extraction for storage.googleapis.com URLs
-            if "storage.googleapis.com" in file_url:
-                path = file_url.split(f"{self.bucket_name}/")[-1]
-            # Extraction for firebasestorage.googleapis.com URLs
-            elif "firebasestorage.googleapis.com" in file_url:
-                path = file_url.split("/o/")[-1].split("?")[0]
-                import urllib.parse
-
-                path = urllib.parse.unquote(path)
-            else:
-                # Fallback: try to see if it's just a path
-                path = file_url
-
-            blob = bucket.blob(path)
+            path = self._blob_path(file_url)
+            blob = self.bucket.blob(path)
             if blob.exists():
                 blob.delete()
-                logger.info(f"Successfully deleted {path} from storage.")
+                logger.debug("Successfully deleted %s from storage.", path)
                 return True
             else:
-                logger.info(f"File {path} does not exist in storage.")
+                logger.debug("File %s does not exist in storage.", path)
                 return True
         except Exception as e:
             logger.error(f"Error deleting file from storage: {e}")
             return False
+
+    def delete_files(self, file_urls: List[str]) -> Dict[str, bool]:
+        """
+        Deletes many files from Firebase Storage using batched requests.
+
+        Up to STORAGE_BATCH_SIZE deletes are sent per HTTP request. If a batch
+        fails (e.g. one of its files no longer exists), its files are retried
+        one by one with delete_file so a single bad entry does not fail the rest.
+
+        Args:
+            file_urls: The public URLs of the files.
+
+        Returns:
+            A mapping of each URL to True if deleted, False otherwise.
+        """
+        results: Dict[str, bool] = {}
+        bucket = self.bucket
+
+        for start in range(0, len(file_urls), STORAGE_BATCH_SIZE):
+            chunk = file_urls[start : start + STORAGE_BATCH_SIZE]
+            try:
+                with bucket.client.batch():
+                    for url in chunk:
+                        bucket.blob(self._blob_path(url)).delete()
+            except Exception as e:
+                logger.warning(
+                    f"Batch delete of {len(chunk)} files failed, retrying individually: {e}"
+                )
+                for url in chunk:
+                    results[url] = self.delete_file(url)
+            else:
+                logger.debug("Successfully deleted %d files from storage.", len(chunk))
+                results.update(dict.fromkeys(chunk, True))
+
+        return results
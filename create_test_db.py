@@ -1,26 +1,22 @@
-import asyncio
-import aiomysql
 from app.common.config import settings
+from app.common.database.admin import close_admin_pool, get_admin_pool
+from app.common.runner import run
 
 
 async def create_test_db():
     db_name = f"test_{settings.DB_NAME}"
     print(f"Connecting to MySQL to create database: {db_name}...")
 
-    conn = await aiomysql.connect(
-        host=settings.DB_HOST,
-        port=settings.DB_PORT,
-        user=settings.DB_USER,
-        password=settings.DB_PASSWORD,
-    )
-
-    async with conn.cursor() as cursor:
-        await cursor.execute(f"DROP DATABASE IF EXISTS {db_name}")
-        await cursor.execute(f"CREATE DATABASE {db_name}")
-        print(f"Database {db_name} dropped and created successfully.")
-
-    conn.close()
+    pool = await get_admin_pool()
+    try:
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(f"DROP DATABASE IF EXISTS {db_name}")
+                await cursor.execute(f"CREATE DATABASE {db_name}")
+                print(f"Database {db_name} dropped and created successfully.")
+    finally:
+        await close_admin_pool()
 
 
 if __name__ == "__main__":
-    asyncio.run(create_test_db())
+    run(create_test_db())
@@ -12,6 +12,9 @@ def demo():
     print("Generic API Response Structure Demo")
     print("=" * 60)
     
+    # One timestamp is enough for the placeholder records below
+    now = datetime.now(timezone.utc)
+    
     # Test 1: Success response with user data
     print("\n1. Success Response with User Data:")
     print("-" * 40)
@@ -23,7 +26,7 @@ def demo():
         full_name="John Doe",
         is_active=True,
         is_superuser=False,
-        created_at=datetime.now(timezone.utc),
+        created_at=now,
         updated_at=None
     )
     
@@ -8,17 +8,26 @@ This file demonstrates how to use the LangChainService with:
 - Context-based invocation
 """
 import asyncio
+from functools import lru_cache
 from typing import List
 from pydantic import BaseModel, Field
 from langchain_core.tools import tool
 
+from app.common.config import settings
 from app.services.langchain_service import LangChainService
+from app.common.runner import run
+
+
+@lru_cache()
+def get_service(temperature: float = 0.7) -> LangChainService:
+    """Shared Gemini service per temperature, so the examples reuse one client."""
+    return LangChainService(settings, backend="gemini", temperature=temperature)
 
 
 # Example 1: Basic text generation
 async def example_basic_usage():
     """Basic usage without structured output."""
-    service = LangChainService(backend="gemini")
+    service = get_service()
     
     response = await service.invoke(
         system_prompt="You are a helpful educational assistant for LearnItIn platform.",
@@ -40,7 +49,7 @@ class LearningPlan(BaseModel):
 
 async def example_structured_output():
     """Using structured output with Pydantic models."""
-    service = LangChainService(backend="gemini", temperature=0.5)
+    service = get_service(0.5)
     
     response: LearningPlan = await service.invoke(
         system_prompt="You are an expert curriculum designer.",
@@ -65,7 +74,7 @@ def calculate_study_hours(hours_per_day: int, days: int) -> int:
 
 async def example_with_tools():
     """Using LangChain tools with the service."""
-    service = LangChainService(backend="gemini")
+    service = get_service()
     
     response = await service.invoke(
         system_prompt="You are a study planner. Use the available tools to help users.",
@@ -79,7 +88,7 @@ async def example_with_tools():
 # Example 4: Context-based invocation
 async def example_with_context():
     """Using context for more informed responses."""
-    service = LangChainService(backend="gemini")
+    service = get_service()
     
     context = """
     User Profile:
@@ -102,10 +111,10 @@ async def example_with_context():
 async def example_multiple_backends():
     """Demonstrate using different backends."""
     # Using Gemini (default)
-    gemini_service = LangChainService(backend="gemini")
+    gemini_service = get_service()
     
     # Using OpenAI (if API key is configured)
-    # openai_service = LangChainService(backend="openai", model="gpt-4")
+    # openai_service = LangChainService(settings, backend="openai", model="gpt-4")
     
     response = await gemini_service.invoke(
         system_prompt="You are a helpful assistant.",
@@ -133,7 +142,7 @@ class Quiz(BaseModel):
 
 async def example_complex_structured_output():
     """Generate a quiz with complex structured output."""
-    service = LangChainService(backend="gemini", temperature=0.7)
+    service = get_service()
     
     quiz: Quiz = await service.invoke(
         system_prompt="You are an expert quiz creator for educational platforms.",
@@ -160,16 +169,19 @@ async def main():
     print("=" * 60)
     
     try:
-        await example_basic_usage()
-        await example_structured_output()
-        # await example_with_tools()  # Uncomment if tools are needed
-        await example_with_context()
-        await example_multiple_backends()
-        await example_complex_structured_output()
+        # The examples are independent LLM calls; run them concurrently
+        await asyncio.gather(
+            example_basic_usage(),
+            example_structured_output(),
+            # example_with_tools(),  # Uncomment if tools are needed
+            example_with_context(),
+            example_multiple_backends(),
+            example_complex_structured_output(),
+        )
     except Exception as e:
         print(f"\nError: {e}")
         print("Make sure GEMINI_API_KEY is set in your .env file")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
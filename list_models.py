@@ -1,7 +1,8 @@
 """List available Gemini models."""
 import os
 from dotenv import load_dotenv
-from google import genai
+
+from app.common.runner import run
 
 # Load environment variables
 load_dotenv()
@@ -12,17 +13,29 @@ if not api_key:
     print("Error: GEMINI_API_KEY not found in environment")
     exit(1)
 
-# Initialize client
-client = genai.Client(api_key=api_key)
+# Imported only once the key check has passed; google-genai is slow to import
+from google import genai
+
+
+async def main():
+    """Print every model with its supported actions."""
+    client = genai.Client(api_key=api_key)
+
+    print("Available Gemini models:")
+    print("=" * 60)
+
+    try:
+        # The list response already carries each model's metadata; the async
+        # pager fetches further pages as iteration reaches them
+        async for model in await client.aio.models.list(config={"page_size": 100}):
+            print(f"- {model.name}")
+            if model.supported_actions:
+                print(f"  Methods: {model.supported_actions}")
+    except Exception as e:
+        print(f"Error listing models: {e}")
+    finally:
+        await client.aio.aclose()
 
-print("Available Gemini models:")
-print("=" * 60)
 
-try:
-    models = client.models.list()
-    for model in models:
-        print(f"- {model.name}")
-        if hasattr(model, 'supported_generation_methods'):
-            print(f"  Methods: {model.supported_generation_methods}")
-except Exception as e:
-    print(f"Error listing models: {e}")
+if __name__ == "__main__":
+    run(main())
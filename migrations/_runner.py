@@ -0,0 +1,68 @@
+"""Command-line entry point shared by the migration scripts.
+
+A migration ends with:
+
+    if __name__ == "__main__":
+        from migrations._runner import main
+
+        main(upgrade, downgrade, __doc__)
+
+and is run as ``python migrations/<name>.py upgrade|downgrade``. The action is
+required, so running a script bare only prints usage; scripts that have always
+upgraded when run bare keep doing so by passing ``default_action="upgrade"``.
+"""
+
+import argparse
+import logging
+import sys
+from typing import Optional
+
+from app.common.database.session import engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_step(step, action: str) -> None:
+    """Run a migration step, then close the shared engine's connections."""
+    try:
+        await step()
+        logger.info(f"{action.capitalize()} completed successfully!")
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+def main(
+    upgrade,
+    downgrade,
+    description: Optional[str] = None,
+    default_action: Optional[str] = None,
+) -> None:
+    """Parse the action from the command line and run the matching step."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    if default_action is None:
+        parser.add_argument(
+            "action",
+            choices=["upgrade", "downgrade"],
+            help="Action to perform",
+        )
+    else:
+        parser.add_argument(
+            "action",
+            nargs="?",
+            default=default_action,
+            choices=["upgrade", "downgrade"],
+            help=f"Action to perform (default: {default_action})",
+        )
+    args = parser.parse_args()
+
+    step = upgrade if args.action == "upgrade" else downgrade
+    run(_run_step(step, args.action))
@@ -1,7 +1,6 @@
 """Migration: Add credit_cost to courses and credit_cost/audio_credit_cost to lessons tables.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -9,126 +8,64 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine
+
+
+async def check_column_exists(conn, table_name: str, column_name: str) -> bool:
+    """Check if a column already exists in a given table."""
+    query = text(
+        """
+        SELECT 1
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = :table_name
+        AND COLUMN_NAME = :col_name
+        LIMIT 1
+    """
+    )
+    result = await conn.execute(query, {"table_name": table_name, "col_name": column_name})
+    return result.scalar() is not None
+
+
+async def add_column(conn, table_name: str, column_name: str, definition: str):
+    """Add a column unless it already exists (no DDL is issued in that case)."""
+    if await check_column_exists(conn, table_name, column_name):
+        print(f"✓ Column {column_name} already exists in {table_name}")
+        return
+    await conn.execute(
+        text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {definition}")
+    )
+    print(f"✓ Added {column_name} column to {table_name} table")
+
+
+async def drop_column(conn, table_name: str, column_name: str):
+    """Drop a column if it exists (no DDL is issued otherwise)."""
+    if not await check_column_exists(conn, table_name, column_name):
+        print(f"✓ Column {column_name} does not exist in {table_name}")
+        return
+    await conn.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column_name}"))
+    print(f"✓ Dropped {column_name} from {table_name}")
 
 
 async def upgrade():
     """Add credit-related columns to courses and lessons tables."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Migrating courses and lessons tables...")
-
-        # 1. Add credit_cost to courses
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE courses 
-                ADD COLUMN credit_cost INT NOT NULL DEFAULT 0
-                """
-                )
-            )
-            print("✓ Added credit_cost column to courses table")
-        except Exception as e:
-            print(f"Skipped adding credit_cost to courses (already exists?): {e}")
-
-        # 2. Add credit_cost to lessons
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                ADD COLUMN credit_cost INT NOT NULL DEFAULT 0
-                """
-                )
-            )
-            print("✓ Added credit_cost column to lessons table")
-        except Exception as e:
-            print(f"Skipped adding credit_cost to lessons (already exists?): {e}")
-
-        # 3. Add audio_credit_cost to lessons
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                ADD COLUMN audio_credit_cost INT NOT NULL DEFAULT 0
-                """
-                )
-            )
-            print("✓ Added audio_credit_cost column to lessons table")
-        except Exception as e:
-            print(f"Skipped adding audio_credit_cost to lessons (already exists?): {e}")
+        await add_column(conn, "courses", "credit_cost", "INT NOT NULL DEFAULT 0")
+        await add_column(conn, "lessons", "credit_cost", "INT NOT NULL DEFAULT 0")
+        await add_column(conn, "lessons", "audio_credit_cost", "INT NOT NULL DEFAULT 0")
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Reverting credit cost columns...")
-
-        # 1. Drop credit_cost from courses
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE courses 
-                DROP COLUMN credit_cost
-                """
-                )
-            )
-            print("✓ Dropped credit_cost from courses")
-        except Exception as e:
-            print(f"Skipped dropping credit_cost from courses: {e}")
-
-        # 2. Drop credit_cost from lessons
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                DROP COLUMN credit_cost
-                """
-                )
-            )
-            print("✓ Dropped credit_cost from lessons")
-        except Exception as e:
-            print(f"Skipped dropping credit_cost from lessons: {e}")
-
-        # 3. Drop audio_credit_cost from lessons
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                DROP COLUMN audio_credit_cost
-                """
-                )
-            )
-            print("✓ Dropped audio_credit_cost from lessons")
-        except Exception as e:
-            print(f"Skipped dropping audio_credit_cost from lessons: {e}")
-
-
-async def main():
-    action = "upgrade"
-    if len(sys.argv) > 1:
-        action = sys.argv[1]
-
-    try:
-        if action == "upgrade":
-            await upgrade()
-            print("Migration completed successfully!")
-        elif action == "downgrade":
-            await downgrade()
-            print("Downgrade completed successfully!")
-        else:
-            print(f"Unknown action: {action}")
-            sys.exit(1)
-    except Exception as e:
-        print(f"Migration failed: {e}")
-        sys.exit(1)
-    finally:
-        await engine.dispose()
+        await drop_column(conn, "courses", "credit_cost")
+        await drop_column(conn, "lessons", "credit_cost")
+        await drop_column(conn, "lessons", "audio_credit_cost")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from migrations._runner import main
+
+    main(upgrade, downgrade, __doc__, default_action="upgrade")
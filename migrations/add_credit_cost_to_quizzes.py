@@ -1,7 +1,6 @@
 """Migration: Add credit_cost to quizzes table.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -9,70 +8,60 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine
+
+
+async def check_column_exists(conn, table_name: str, column_name: str) -> bool:
+    """Check if a column already exists in a given table."""
+    query = text(
+        """
+        SELECT 1
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = :table_name
+        AND COLUMN_NAME = :col_name
+        LIMIT 1
+    """
+    )
+    result = await conn.execute(query, {"table_name": table_name, "col_name": column_name})
+    return result.scalar() is not None
+
+
+async def add_column(conn, table_name: str, column_name: str, definition: str):
+    """Add a column unless it already exists (no DDL is issued in that case)."""
+    if await check_column_exists(conn, table_name, column_name):
+        print(f"✓ Column {column_name} already exists in {table_name}")
+        return
+    await conn.execute(
+        text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {definition}")
+    )
+    print(f"✓ Added {column_name} column to {table_name} table")
+
+
+async def drop_column(conn, table_name: str, column_name: str):
+    """Drop a column if it exists (no DDL is issued otherwise)."""
+    if not await check_column_exists(conn, table_name, column_name):
+        print(f"✓ Column {column_name} does not exist in {table_name}")
+        return
+    await conn.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column_name}"))
+    print(f"✓ Dropped {column_name} from {table_name}")
 
 
 async def upgrade():
     """Add credit_cost column to quizzes table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Migrating quizzes table...")
-
-        # Add credit_cost to quizzes
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE quizzes 
-                ADD COLUMN credit_cost INT NOT NULL DEFAULT 0
-                """
-                )
-            )
-            print("✓ Added credit_cost column to quizzes table")
-        except Exception as e:
-            print(f"Skipped adding credit_cost to quizzes (already exists?): {e}")
+        await add_column(conn, "quizzes", "credit_cost", "INT NOT NULL DEFAULT 0")
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Reverting credit cost column in quizzes...")
-
-        # Drop credit_cost from quizzes
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE quizzes 
-                DROP COLUMN credit_cost
-                """
-                )
-            )
-            print("✓ Dropped credit_cost from quizzes")
-        except Exception as e:
-            print(f"Skipped dropping credit_cost from quizzes: {e}")
-
-
-async def main():
-    action = "upgrade"
-    if len(sys.argv) > 1:
-        action = sys.argv[1]
-
-    try:
-        if action == "upgrade":
-            await upgrade()
-            print("Migration completed successfully!")
-        elif action == "downgrade":
-            await downgrade()
-            print("Downgrade completed successfully!")
-        else:
-            print(f"Unknown action: {action}")
-            sys.exit(1)
-    except Exception as e:
-        print(f"Migration failed: {e}")
-        sys.exit(1)
-    finally:
-        await engine.dispose()
+        await drop_column(conn, "quizzes", "credit_cost")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from migrations._runner import main
+
+    main(upgrade, downgrade, __doc__, default_action="upgrade")
@@ -5,7 +5,6 @@ Run this migration with:
     python migrations/add_image_url_to_categories_and_subcategories.py upgrade
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -13,29 +12,30 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
 
 
 async def check_column_exists(table_name: str, column_name: str) -> bool:
     """Check if a column already exists in a given table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         query = text(
             """
-            SELECT COUNT(*) as count
+            SELECT 1
             FROM information_schema.COLUMNS
             WHERE TABLE_SCHEMA = DATABASE()
             AND TABLE_NAME = :table_name
             AND COLUMN_NAME = :col_name
+            LIMIT 1
         """
         )
         result = await conn.execute(query, {"table_name": table_name, "col_name": column_name})
-        row = result.fetchone()
-        return row and row[0] > 0
+        return result.scalar() is not None
 
 
 async def upgrade():
     """Add image_url column to categories and sub_categories."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check and add image_url to categories
         if await check_column_exists("categories", "image_url"):
             print("SUCCESS: Column 'image_url' already exists in categories")
@@ -59,7 +59,7 @@ async def upgrade():
 
 async def downgrade():
     """Remove image_url column from categories and sub_categories."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check and remove image_url from sub_categories
         if not await check_column_exists("sub_categories", "image_url"):
             print("SUCCESS: Column 'image_url' does not exist in sub_categories")
@@ -120,4 +120,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
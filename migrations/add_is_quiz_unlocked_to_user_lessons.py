@@ -5,7 +5,6 @@ Run this migration with:
     python migrations/add_is_quiz_unlocked_to_user_lessons.py upgrade
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -15,35 +14,38 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 from app.common.config import settings
+from app.common.runner import run
 
 async def check_column_exists(engine, table_name: str, column_name: str) -> bool:
     """Check if a column already exists in a given table."""
-    async with engine.begin() as conn:
+    async with engine.connect() as conn:
         query = text(
             """
-            SELECT COUNT(*) as count
+            SELECT 1
             FROM information_schema.COLUMNS
             WHERE TABLE_SCHEMA = DATABASE()
             AND TABLE_NAME = :table_name
             AND COLUMN_NAME = :col_name
+            LIMIT 1
         """
         )
         result = await conn.execute(query, {"table_name": table_name, "col_name": column_name})
-        row = result.fetchone()
-        return row and row[0] > 0
+        return result.scalar() is not None
 
 async def migrate_db(db_name: str, action: str):
-    # Construct connection URL for the target database using the same mysql+aiomysql driver
-    db_url = f"mysql+aiomysql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{db_name}"
+    # Construct connection URL for the target database using the app's driver
+    db_url = f"mysql+{settings.DB_DRIVER}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{db_name}"
     print(f"Connecting to {db_name} database...")
-    engine = create_async_engine(db_url, echo=True)
+    engine = create_async_engine(
+        db_url, echo=settings.DB_ECHO, isolation_level="AUTOCOMMIT"
+    )
 
     try:
         if action == "upgrade":
             if await check_column_exists(engine, "user_lessons", "is_quiz_unlocked"):
                 print(f"SUCCESS: Column 'is_quiz_unlocked' already exists in {db_name}.user_lessons")
             else:
-                async with engine.begin() as conn:
+                async with engine.connect() as conn:
                     print(f"Adding 'is_quiz_unlocked' column to {db_name}.user_lessons...")
                     await conn.execute(
                         text("ALTER TABLE user_lessons ADD COLUMN is_quiz_unlocked BOOLEAN NOT NULL DEFAULT FALSE")
@@ -53,7 +55,7 @@ async def migrate_db(db_name: str, action: str):
             if not await check_column_exists(engine, "user_lessons", "is_quiz_unlocked"):
                 print(f"SUCCESS: Column 'is_quiz_unlocked' does not exist in {db_name}.user_lessons")
             else:
-                async with engine.begin() as conn:
+                async with engine.connect() as conn:
                     print(f"Removing 'is_quiz_unlocked' column from {db_name}.user_lessons...")
                     await conn.execute(
                         text("ALTER TABLE user_lessons DROP COLUMN is_quiz_unlocked")
@@ -109,4 +111,4 @@ async def main():
             print(f"WARNING: Migration for {db} skipped or failed: {e}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -10,15 +10,35 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
 
 
-async def upgrade():
-    """Add lesson_audios table and modify lessons table."""
-    async with engine.begin() as conn:
+async def index_exists(conn, table_name: str, index_name: str) -> bool:
+    """Check if an index already exists on a given table."""
+    result = await conn.execute(
+        text(
+            """
+            SELECT 1
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = :table_name
+            AND INDEX_NAME = :index_name
+            LIMIT 1
+        """
+        ),
+        {"table_name": table_name, "index_name": index_name},
+    )
+    return result.scalar() is not None
+
+
+async def create_audios_table():
+    """Create the lesson_audios table and its lesson_id index."""
+    async with ddl_engine.connect() as conn:
         print("Creating lesson_audios table...")
 
-        # 1. Create lesson_audios table
+        # 1. Create lesson_audios table with its lesson_id index in the same
+        # statement, so a fresh install needs one round trip for both
         # Using MySQL dialect types roughly
         await conn.execute(
             text(
@@ -34,6 +54,7 @@ async def upgrade():
                 created_at DATETIME NOT NULL,
                 updated_at DATETIME,
                 PRIMARY KEY (id),
+                INDEX ix_lesson_audios_lesson_id (lesson_id),
                 FOREIGN KEY (lesson_id) REFERENCES lessons(id)
             );
             """
@@ -41,11 +62,11 @@ async def upgrade():
         )
         print("✓ Created lesson_audios table")
 
-        # 2. Add index on lesson_id
-        # Check if index exists first or handle error?
-        # MySQL usually gives warning if it exists or error.
-        # Using simple CREATE INDEX.
-        try:
+        # 2. Tables created before the index was inlined may still lack it
+        # (MySQL has no CREATE INDEX IF NOT EXISTS)
+        if await index_exists(conn, "lesson_audios", "ix_lesson_audios_lesson_id"):
+            print("✓ Index ix_lesson_audios_lesson_id present")
+        else:
             await conn.execute(
                 text(
                     """
@@ -54,48 +75,47 @@ async def upgrade():
                 )
             )
             print("✓ Added index on lesson_id")
-        except Exception:
-            # ignore if already exists
-            print("  (Index ix_lesson_audios_lesson_id might already exist)")
 
-        # 3. Remove columns from lessons table
-        print("Removing columns from lessons table...")
 
-        # We need to check if columns exist before dropping to avoid errors if re-run
-        # But for new features, usually we just try dropping.
+async def drop_lesson_columns():
+    """Remove the audio columns that moved to lesson_audios from lessons."""
+    async with ddl_engine.connect() as conn:
+        print("Removing columns from lessons table...")
 
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                DROP COLUMN audio_transcript_url
+        # Look up which of the columns still exist, then drop them all in a
+        # single ALTER so the table is rebuilt at most once
+        result = await conn.execute(
+            text(
                 """
-                )
-            )
-            print("✓ Dropped audio_transcript_url")
-        except Exception as e:
-            print(
-                f"  Note: Could not drop audio_transcript_url (it might not exist): {e}"
+            SELECT COLUMN_NAME
+            FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = 'lessons'
+            AND COLUMN_NAME IN ('audio_transcript_url', 'has_quiz')
+            """
             )
+        )
+        existing = [row[0] for row in result.fetchall()]
 
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                DROP COLUMN has_quiz
-                """
-                )
-            )
-            print("✓ Dropped has_quiz")
-        except Exception as e:
-            print(f"  Note: Could not drop has_quiz (it might not exist): {e}")
+        if existing:
+            drops = ", ".join(f"DROP COLUMN {column}" for column in existing)
+            await conn.execute(text(f"ALTER TABLE lessons {drops}"))
+            print(f"✓ Dropped {', '.join(existing)}")
+        else:
+            print("✓ Columns already removed from lessons table")
+
+
+async def upgrade():
+    """Add lesson_audios table and modify lessons table."""
+    # The two steps touch different tables and MySQL DDL is not transactional,
+    # so they run concurrently on separate pooled connections. The index is
+    # created with the table inside create_audios_table.
+    await asyncio.gather(create_audios_table(), drop_lesson_columns())
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Reverting changes...")
 
         # 1. Re-add columns to lessons table
@@ -137,4 +157,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
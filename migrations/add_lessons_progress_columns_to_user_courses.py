@@ -5,7 +5,6 @@ Run this migration with:
     python migrations/add_lessons_progress_columns_to_user_courses.py upgrade
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -13,29 +12,30 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
 
 
 async def check_column_exists(column_name: str) -> bool:
     """Check if a column already exists in the user_courses table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         query = text(
             """
-            SELECT COUNT(*) as count
+            SELECT 1
             FROM information_schema.COLUMNS
             WHERE TABLE_SCHEMA = DATABASE()
             AND TABLE_NAME = 'user_courses'
             AND COLUMN_NAME = :col_name
+            LIMIT 1
         """
         )
         result = await conn.execute(query, {"col_name": column_name})
-        row = result.fetchone()
-        return row and row[0] > 0
+        return result.scalar() is not None
 
 
 async def upgrade():
     """Add total_lessons and completed_lessons columns to user_courses."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check and add total_lessons
         if await check_column_exists("total_lessons"):
             print("SUCCESS: Column 'total_lessons' already exists in user_courses")
@@ -59,7 +59,7 @@ async def upgrade():
 
 async def downgrade():
     """Remove total_lessons and completed_lessons columns from user_courses."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check and remove completed_lessons
         if not await check_column_exists("completed_lessons"):
             print("SUCCESS: Column 'completed_lessons' does not exist in user_courses")
@@ -120,4 +120,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,7 +5,6 @@ Run this migration with:
     python migrations/add_popularity_score_to_subcategories.py upgrade
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -15,35 +14,38 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 from app.common.config import settings
+from app.common.runner import run
 
 async def check_column_exists(engine, table_name: str, column_name: str) -> bool:
     """Check if a column already exists in a given table."""
-    async with engine.begin() as conn:
+    async with engine.connect() as conn:
         query = text(
             """
-            SELECT COUNT(*) as count
+            SELECT 1
             FROM information_schema.COLUMNS
             WHERE TABLE_SCHEMA = DATABASE()
             AND TABLE_NAME = :table_name
             AND COLUMN_NAME = :col_name
+            LIMIT 1
         """
         )
         result = await conn.execute(query, {"table_name": table_name, "col_name": column_name})
-        row = result.fetchone()
-        return row and row[0] > 0
+        return result.scalar() is not None
 
 async def migrate_db(db_name: str, action: str):
-    # Construct connection URL for the target database using the same mysql+aiomysql driver
-    db_url = f"mysql+aiomysql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{db_name}"
+    # Construct connection URL for the target database using the app's driver
+    db_url = f"mysql+{settings.DB_DRIVER}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{db_name}"
     print(f"Connecting to {db_name} database...")
-    engine = create_async_engine(db_url, echo=True)
+    engine = create_async_engine(
+        db_url, echo=settings.DB_ECHO, isolation_level="AUTOCOMMIT"
+    )
 
     try:
         if action == "upgrade":
             if await check_column_exists(engine, "sub_categories", "popularity_score"):
                 print(f"SUCCESS: Column 'popularity_score' already exists in {db_name}.sub_categories")
             else:
-                async with engine.begin() as conn:
+                async with engine.connect() as conn:
                     print(f"Adding 'popularity_score' column to {db_name}.sub_categories...")
                     await conn.execute(
                         text("ALTER TABLE sub_categories ADD COLUMN popularity_score DOUBLE NOT NULL DEFAULT 0.0")
@@ -53,7 +55,7 @@ async def migrate_db(db_name: str, action: str):
             if not await check_column_exists(engine, "sub_categories", "popularity_score"):
                 print(f"SUCCESS: Column 'popularity_score' does not exist in {db_name}.sub_categories")
             else:
-                async with engine.begin() as conn:
+                async with engine.connect() as conn:
                     print(f"Removing 'popularity_score' column from {db_name}.sub_categories...")
                     await conn.execute(
                         text("ALTER TABLE sub_categories DROP COLUMN popularity_score")
@@ -93,4 +95,4 @@ async def main():
             sys.exit(1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
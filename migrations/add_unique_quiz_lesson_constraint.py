@@ -8,7 +8,6 @@ Run this migration with:
     python migrations/add_unique_quiz_lesson_constraint.py upgrade
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -16,36 +15,43 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+
+_CHECK_INDEX_SQL = text(
+    """
+    SELECT INDEX_NAME
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE()
+    AND TABLE_NAME = 'quizzes'
+    AND COLUMN_NAME = 'lesson_id'
+    AND NON_UNIQUE = 0
+    LIMIT 1
+"""
+)
+
+_ADD_CONSTRAINT_SQL = text(
+    """
+    ALTER TABLE quizzes
+    ADD CONSTRAINT unique_quiz_lesson UNIQUE (lesson_id)
+"""
+)
 
 
 async def upgrade():
     """Add unique constraint to quizzes table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check if any unique index on lesson_id already exists
-        check_index_query = text(
-            """
-            SHOW INDEX FROM quizzes WHERE Column_name = 'lesson_id' AND Non_unique = 0
-        """
-        )
-
-        result = await conn.execute(check_index_query)
-        exists = result.fetchone()
+        index_name = (await conn.execute(_CHECK_INDEX_SQL)).scalar()
 
-        if exists:
-            print(f"✓ A unique index on 'lesson_id' already exists ({exists[2]})")
+        if index_name:
+            print(f"✓ A unique index on 'lesson_id' already exists ({index_name})")
             return
 
         # Add the unique constraint
-        add_constraint_query = text(
-            """
-            ALTER TABLE quizzes
-            ADD CONSTRAINT unique_quiz_lesson UNIQUE (lesson_id)
-        """
-        )
-
         try:
-            await conn.execute(add_constraint_query)
+            await conn.execute(_ADD_CONSTRAINT_SQL)
             print(
                 "✓ Successfully added unique constraint 'unique_quiz_lesson' to quizzes table"
             )
@@ -56,23 +62,14 @@ async def upgrade():
 
 async def downgrade():
     """Remove unique constraint from quizzes table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check if any unique index on lesson_id exists
-        check_index_query = text(
-            """
-            SHOW INDEX FROM quizzes WHERE Column_name = 'lesson_id' AND Non_unique = 0
-        """
-        )
-
-        result = await conn.execute(check_index_query)
-        exists = result.fetchone()
+        index_name = (await conn.execute(_CHECK_INDEX_SQL)).scalar()
 
-        if not exists:
+        if not index_name:
             print("✓ No unique index on 'lesson_id' exists")
             return
 
-        index_name = exists[2]
-
         # Remove the unique constraint
         drop_constraint_query = text(f"ALTER TABLE quizzes DROP INDEX {index_name}")
 
@@ -123,4 +120,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -8,7 +8,6 @@ Run this migration with:
     python migrations/add_unique_user_course_constraint.py
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -16,41 +15,49 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+
+_CHECK_CONSTRAINT_SQL = text(
+    """
+    SELECT 1
+    FROM information_schema.TABLE_CONSTRAINTS
+    WHERE CONSTRAINT_SCHEMA = DATABASE()
+    AND TABLE_NAME = 'user_courses'
+    AND CONSTRAINT_NAME = 'unique_user_course'
+    AND CONSTRAINT_TYPE = 'UNIQUE'
+    LIMIT 1
+"""
+)
+
+_ADD_CONSTRAINT_SQL = text(
+    """
+    ALTER TABLE user_courses
+    ADD CONSTRAINT unique_user_course UNIQUE (user_id, course_id)
+"""
+)
+
+_DROP_CONSTRAINT_SQL = text(
+    """
+    ALTER TABLE user_courses
+    DROP INDEX unique_user_course
+"""
+)
 
 
 async def upgrade():
     """Add unique constraint to user_courses table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check if constraint already exists
-        check_constraint_query = text(
-            """
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLE_CONSTRAINTS
-            WHERE CONSTRAINT_SCHEMA = DATABASE()
-            AND TABLE_NAME = 'user_courses'
-            AND CONSTRAINT_NAME = 'unique_user_course'
-            AND CONSTRAINT_TYPE = 'UNIQUE'
-        """
-        )
-
-        result = await conn.execute(check_constraint_query)
-        row = result.fetchone()
-
-        if row and row[0] > 0:
+        result = await conn.execute(_CHECK_CONSTRAINT_SQL)
+        if result.scalar() is not None:
             print("✓ Unique constraint 'unique_user_course' already exists")
             return
 
         # Add the unique constraint
-        add_constraint_query = text(
-            """
-            ALTER TABLE user_courses
-            ADD CONSTRAINT unique_user_course UNIQUE (user_id, course_id)
-        """
-        )
-
         try:
-            await conn.execute(add_constraint_query)
+            await conn.execute(_ADD_CONSTRAINT_SQL)
             print(
                 "✓ Successfully added unique constraint 'unique_user_course' to user_courses table"
             )
@@ -61,36 +68,16 @@ async def upgrade():
 
 async def downgrade():
     """Remove unique constraint from user_courses table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Check if constraint exists
-        check_constraint_query = text(
-            """
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLE_CONSTRAINTS
-            WHERE CONSTRAINT_SCHEMA = DATABASE()
-            AND TABLE_NAME = 'user_courses'
-            AND CONSTRAINT_NAME = 'unique_user_course'
-            AND CONSTRAINT_TYPE = 'UNIQUE'
-        """
-        )
-
-        result = await conn.execute(check_constraint_query)
-        row = result.fetchone()
-
-        if row and row[0] == 0:
+        result = await conn.execute(_CHECK_CONSTRAINT_SQL)
+        if result.scalar() is None:
             print("✓ Unique constraint 'unique_user_course' does not exist")
             return
 
         # Remove the unique constraint
-        drop_constraint_query = text(
-            """
-            ALTER TABLE user_courses
-            DROP INDEX unique_user_course
-        """
-        )
-
         try:
-            await conn.execute(drop_constraint_query)
+            await conn.execute(_DROP_CONSTRAINT_SQL)
             print(
                 "✓ Successfully removed unique constraint 'unique_user_course' from user_courses table"
             )
@@ -138,4 +125,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -10,6 +10,7 @@ Run this migration with:
 """
 
 import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -17,173 +18,91 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from sqlalchemy.exc import OperationalError
+from app.common.database.ddl import (
+    ER_CANT_DROP_FIELD_OR_KEY,
+    ER_DUP_KEYNAME,
+    mysql_error_code,
+)
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
+
+
+# (table, constraint name, columns)
+CONSTRAINTS = [
+    ("user_modules", "unique_user_module", "user_id, module_id"),
+    ("user_lessons", "unique_user_lesson", "user_id, lesson_id"),
+]
+
+# Statements keyed by constraint name, built once
+ADD_CONSTRAINT_SQL = {
+    name: text(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE ({columns})")
+    for table, name, columns in CONSTRAINTS
+}
+DROP_CONSTRAINT_SQL = {
+    name: text(f"ALTER TABLE {table} DROP INDEX {name}")
+    for table, name, _columns in CONSTRAINTS
+}
+
+
+async def add_constraint(table: str, name: str):
+    """Add one unique constraint on its own connection."""
+    logger.info(f"--- Processing {table} table ---")
+
+    async with ddl_engine.connect() as conn:
+        # No information_schema pre-check: the ADD itself reports an
+        # existing constraint as a duplicate key name
+        try:
+            await conn.execute(ADD_CONSTRAINT_SQL[name])
+            logger.info(f"✓ Successfully added unique constraint '{name}' to {table} table")
+        except OperationalError as e:
+            if mysql_error_code(e) == ER_DUP_KEYNAME:
+                logger.info(f"✓ Unique constraint '{name}' already exists")
+                return
+            logger.error(f"✗ Error adding constraint to {table}: {e}")
+            raise
+
+
+async def drop_constraint(table: str, name: str):
+    """Drop one unique constraint on its own connection."""
+    logger.info(f"--- Processing {table} table ---")
+
+    async with ddl_engine.connect() as conn:
+        try:
+            await conn.execute(DROP_CONSTRAINT_SQL[name])
+            logger.info(f"✓ Successfully removed unique constraint '{name}' from {table} table")
+        except OperationalError as e:
+            if mysql_error_code(e) == ER_CANT_DROP_FIELD_OR_KEY:
+                logger.info(f"✓ Unique constraint '{name}' does not exist")
+                return
+            logger.error(f"✗ Error removing constraint from {table}: {e}")
+            raise
 
 
 async def upgrade():
     """Add unique constraints to user_modules and user_lessons tables."""
-    async with engine.begin() as conn:
-        # Add constraint to user_modules
-        print("\n--- Processing user_modules table ---")
-
-        # Check if constraint already exists
-        check_module_constraint = text(
-            """
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLE_CONSTRAINTS
-            WHERE CONSTRAINT_SCHEMA = DATABASE()
-            AND TABLE_NAME = 'user_modules'
-            AND CONSTRAINT_NAME = 'unique_user_module'
-            AND CONSTRAINT_TYPE = 'UNIQUE'
-        """
-        )
-
-        result = await conn.execute(check_module_constraint)
-        row = result.fetchone()
-
-        if row and row[0] > 0:
-            print("✓ Unique constraint 'unique_user_module' already exists")
-        else:
-            # Add the unique constraint
-            add_module_constraint = text(
-                """
-                ALTER TABLE user_modules
-                ADD CONSTRAINT unique_user_module UNIQUE (user_id, module_id)
-            """
-            )
-
-            try:
-                await conn.execute(add_module_constraint)
-                print(
-                    "✓ Successfully added unique constraint 'unique_user_module' to user_modules table"
-                )
-            except Exception as e:
-                print(f"✗ Error adding constraint to user_modules: {e}")
-                raise
-
-        # Add constraint to user_lessons
-        print("\n--- Processing user_lessons table ---")
-
-        # Check if constraint already exists
-        check_lesson_constraint = text(
-            """
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLE_CONSTRAINTS
-            WHERE CONSTRAINT_SCHEMA = DATABASE()
-            AND TABLE_NAME = 'user_lessons'
-            AND CONSTRAINT_NAME = 'unique_user_lesson'
-            AND CONSTRAINT_TYPE = 'UNIQUE'
-        """
-        )
-
-        result = await conn.execute(check_lesson_constraint)
-        row = result.fetchone()
-
-        if row and row[0] > 0:
-            print("✓ Unique constraint 'unique_user_lesson' already exists")
-        else:
-            # Add the unique constraint
-            add_lesson_constraint = text(
-                """
-                ALTER TABLE user_lessons
-                ADD CONSTRAINT unique_user_lesson UNIQUE (user_id, lesson_id)
-            """
-            )
-
-            try:
-                await conn.execute(add_lesson_constraint)
-                print(
-                    "✓ Successfully added unique constraint 'unique_user_lesson' to user_lessons table"
-                )
-            except Exception as e:
-                print(f"✗ Error adding constraint to user_lessons: {e}")
-                raise
+    # Each table's ALTER is independent and MySQL DDL commits implicitly, so
+    # the two index builds run concurrently on separate pooled connections
+    await asyncio.gather(
+        *(add_constraint(table, name) for table, name, _columns in CONSTRAINTS)
+    )
 
 
 async def downgrade():
     """Remove unique constraints from user_modules and user_lessons tables."""
-    async with engine.begin() as conn:
-        # Remove constraint from user_modules
-        print("\n--- Processing user_modules table ---")
-
-        # Check if constraint exists
-        check_module_constraint = text(
-            """
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLE_CONSTRAINTS
-            WHERE CONSTRAINT_SCHEMA = DATABASE()
-            AND TABLE_NAME = 'user_modules'
-            AND CONSTRAINT_NAME = 'unique_user_module'
-            AND CONSTRAINT_TYPE = 'UNIQUE'
-        """
-        )
-
-        result = await conn.execute(check_module_constraint)
-        row = result.fetchone()
-
-        if row and row[0] == 0:
-            print("✓ Unique constraint 'unique_user_module' does not exist")
-        else:
-            # Remove the unique constraint
-            drop_module_constraint = text(
-                """
-                ALTER TABLE user_modules
-                DROP INDEX unique_user_module
-            """
-            )
-
-            try:
-                await conn.execute(drop_module_constraint)
-                print(
-                    "✓ Successfully removed unique constraint 'unique_user_module' from user_modules table"
-                )
-            except Exception as e:
-                print(f"✗ Error removing constraint from user_modules: {e}")
-                raise
-
-        # Remove constraint from user_lessons
-        print("\n--- Processing user_lessons table ---")
-
-        # Check if constraint exists
-        check_lesson_constraint = text(
-            """
-            SELECT COUNT(*) as count
-            FROM information_schema.TABLE_CONSTRAINTS
-            WHERE CONSTRAINT_SCHEMA = DATABASE()
-            AND TABLE_NAME = 'user_lessons'
-            AND CONSTRAINT_NAME = 'unique_user_lesson'
-            AND CONSTRAINT_TYPE = 'UNIQUE'
-        """
-        )
-
-        result = await conn.execute(check_lesson_constraint)
-        row = result.fetchone()
-
-        if row and row[0] == 0:
-            print("✓ Unique constraint 'unique_user_lesson' does not exist")
-        else:
-            # Remove the unique constraint
-            drop_lesson_constraint = text(
-                """
-                ALTER TABLE user_lessons
-                DROP INDEX unique_user_lesson
-            """
-            )
-
-            try:
-                await conn.execute(drop_lesson_constraint)
-                print(
-                    "✓ Successfully removed unique constraint 'unique_user_lesson' from user_lessons table"
-                )
-            except Exception as e:
-                print(f"✗ Error removing constraint from user_lessons: {e}")
-                raise
+    await asyncio.gather(
+        *(drop_constraint(table, name) for table, name, _columns in CONSTRAINTS)
+    )
 
 
 async def main():
     """Run the migration."""
     import argparse
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
     parser = argparse.ArgumentParser(
         description="Manage user_modules and user_lessons unique constraints"
     )
@@ -195,10 +114,10 @@ async def main():
 
     args = parser.parse_args()
 
-    print(f"\n{'='*60}")
-    print(f"Migration: Add unique constraints to user_modules & user_lessons")
-    print(f"Action: {args.action}")
-    print(f"{'='*60}\n")
+    logger.info("=" * 60)
+    logger.info("Migration: Add unique constraints to user_modules & user_lessons")
+    logger.info(f"Action: {args.action}")
+    logger.info("=" * 60)
 
     try:
         if args.action == "upgrade":
@@ -206,17 +125,17 @@ async def main():
         else:
             await downgrade()
 
-        print(f"\n{'='*60}")
-        print("Migration completed successfully!")
-        print(f"{'='*60}\n")
+        logger.info("=" * 60)
+        logger.info("Migration completed successfully!")
+        logger.info("=" * 60)
     except Exception as e:
-        print(f"\n{'='*60}")
-        print(f"Migration failed: {e}")
-        print(f"{'='*60}\n")
+        logger.info("=" * 60)
+        logger.error(f"Migration failed: {e}")
+        logger.info("=" * 60)
         sys.exit(1)
     finally:
         await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -9,51 +9,68 @@ This script modifies the 'questions' table to use TEXT columns for:
 - explanation
 """
 
-import asyncio
+import logging
+
 from sqlalchemy import text, Column, Text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
 
+logger = logging.getLogger(__name__)
 
-async def upgrade():
-    """Apply the migration."""
-    async with engine.begin() as conn:
-        print("Changing question columns to TEXT...")
 
-        # MySQL syntax for changing column types
-        queries = [
-            "ALTER TABLE questions MODIFY COLUMN question TEXT NOT NULL",
-            "ALTER TABLE questions MODIFY COLUMN option_1 TEXT",
-            "ALTER TABLE questions MODIFY COLUMN option_2 TEXT",
-            "ALTER TABLE questions MODIFY COLUMN option_3 TEXT",
-            "ALTER TABLE questions MODIFY COLUMN option_4 TEXT",
-            "ALTER TABLE questions MODIFY COLUMN explanation TEXT",
-        ]
+# MySQL syntax for changing column types. All columns go in one ALTER: each
+# MODIFY to TEXT rebuilds the table, so separate statements would copy it
+# once per column.
+UPGRADE_SQL = text(
+    """
+    ALTER TABLE questions
+    MODIFY COLUMN question TEXT NOT NULL,
+    MODIFY COLUMN option_1 TEXT,
+    MODIFY COLUMN option_2 TEXT,
+    MODIFY COLUMN option_3 TEXT,
+    MODIFY COLUMN option_4 TEXT,
+    MODIFY COLUMN explanation TEXT
+"""
+)
+
+# Assuming original was VARCHAR(255) as is default for SQLModel/SQLAlchemy if not specified
+DOWNGRADE_SQL = text(
+    """
+    ALTER TABLE questions
+    MODIFY COLUMN question VARCHAR(255) NOT NULL,
+    MODIFY COLUMN option_1 VARCHAR(255),
+    MODIFY COLUMN option_2 VARCHAR(255),
+    MODIFY COLUMN option_3 VARCHAR(255),
+    MODIFY COLUMN option_4 VARCHAR(255),
+    MODIFY COLUMN explanation VARCHAR(255)
+"""
+)
 
-        for query in queries:
-            await conn.execute(text(query))
 
-        print("✓ Successfully updated questions table columns to TEXT.")
+async def upgrade():
+    """Apply the migration."""
+    async with ddl_engine.connect() as conn:
+        logger.info("Changing question columns to TEXT...")
+        await conn.execute(UPGRADE_SQL)
+        logger.info("✓ Successfully updated questions table columns to TEXT.")
 
 
 async def downgrade():
     """Reverse the migration."""
-    async with engine.begin() as conn:
-        print("Changing question columns back to VARCHAR(255)...")
-        # Assuming original was VARCHAR(255) as is default for SQLModel/SQLAlchemy if not specified
-        queries = [
-            "ALTER TABLE questions MODIFY COLUMN question VARCHAR(255) NOT NULL",
-            "ALTER TABLE questions MODIFY COLUMN option_1 VARCHAR(255)",
-            "ALTER TABLE questions MODIFY COLUMN option_2 VARCHAR(255)",
-            "ALTER TABLE questions MODIFY COLUMN option_3 VARCHAR(255)",
-            "ALTER TABLE questions MODIFY COLUMN option_4 VARCHAR(255)",
-            "ALTER TABLE questions MODIFY COLUMN explanation VARCHAR(255)",
-        ]
+    async with ddl_engine.connect() as conn:
+        logger.info("Changing question columns back to VARCHAR(255)...")
+        await conn.execute(DOWNGRADE_SQL)
+        logger.info("✓ Successfully reverted questions table columns.")
 
-        for query in queries:
-            await conn.execute(text(query))
 
-        print("✓ Successfully reverted questions table columns.")
+async def main():
+    """Run the upgrade, then close the shared engine's connections."""
+    try:
+        await upgrade()
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(upgrade())
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    run(main())
@@ -2,14 +2,24 @@
 
 This creates the SubscriptionUsage table with a unique FK constraint
 to enforce one-to-one relationship with Subscription.
+
+Foreign key checks are switched off for this migration's session only, which
+lets CREATE TABLE succeed even if the subscriptions table does not exist yet
+(e.g. when run alongside other migrations). Other connections are unaffected,
+and the index build does not validate foreign keys either way. The constraint
+is enforced for rows written once subscriptions exists.
 """
 
-import asyncio
 import logging
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import bindparam, text
+from app.common.database.session import ddl_engine
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -33,61 +43,76 @@ CREATE TABLE IF NOT EXISTS subscription_usages (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 """
 
-CREATE_INDEXES_SQL = [
-    "CREATE INDEX IF NOT EXISTS idx_subscription_usage_subscription_id ON subscription_usages(subscription_id);",
-    "CREATE INDEX IF NOT EXISTS idx_subscription_usage_year_month ON subscription_usages(year, month);",
+# Secondary indexes as (index name, columns). They are added in one ALTER so
+# InnoDB builds both from a single scan of the table, online (INPLACE without
+# blocking writes); MySQL has no CREATE INDEX IF NOT EXISTS, so existing ones
+# are looked up first
+INDEXES = [
+    ("idx_subscription_usage_subscription_id", "subscription_id"),
+    ("idx_subscription_usage_year_month", "year, month"),
 ]
 
+EXISTING_INDEXES_SQL = """
+SELECT DISTINCT INDEX_NAME
+FROM information_schema.STATISTICS
+WHERE TABLE_SCHEMA = DATABASE()
+AND TABLE_NAME = 'subscription_usages'
+AND INDEX_NAME IN :index_names;
+"""
+
 # Rollback SQL
 DROP_TABLE_SQL = "DROP TABLE IF EXISTS subscription_usages;"
 
 
-async def upgrade(database_url: str) -> None:
+async def _create_table(conn) -> None:
+    """Create the table and any missing secondary indexes."""
+    logger.info("Creating subscription_usages table...")
+    await conn.execute(text(CREATE_TABLE_SQL))
+
+    result = await conn.execute(
+        text(EXISTING_INDEXES_SQL).bindparams(
+            bindparam("index_names", expanding=True)
+        ),
+        {"index_names": [name for name, _ in INDEXES]},
+    )
+    existing = {row[0] for row in result.fetchall()}
+    for name in sorted(existing):
+        logger.info(f"Index {name} already exists")
+
+    missing = [(name, columns) for name, columns in INDEXES if name not in existing]
+    if missing:
+        adds = ", ".join(f"ADD INDEX {name} ({columns})" for name, columns in missing)
+        await conn.execute(
+            text(
+                f"ALTER TABLE subscription_usages {adds}, "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        )
+
+
+async def upgrade() -> None:
     """Apply the migration."""
-    engine = create_async_engine(database_url, echo=True)
-
-    async with engine.begin() as conn:
-        logger.info("Creating subscription_usages table...")
-        await conn.execute(text(CREATE_TABLE_SQL))
-
-        for index_sql in CREATE_INDEXES_SQL:
-            try:
-                await conn.execute(text(index_sql))
-            except Exception as e:
-                # Index might already exist
-                logger.warning(f"Index creation note: {e}")
+    async with ddl_engine.connect() as conn:
+        # Session-scoped; restored below since the connection goes back to
+        # the shared pool
+        await conn.execute(text("SET SESSION foreign_key_checks = 0"))
+        try:
+            await _create_table(conn)
+        finally:
+            await conn.execute(text("SET SESSION foreign_key_checks = 1"))
 
         logger.info("Migration completed successfully!")
 
-    await engine.dispose()
-
 
-async def downgrade(database_url: str) -> None:
+async def downgrade() -> None:
     """Rollback the migration."""
-    engine = create_async_engine(database_url, echo=True)
-
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         logger.info("Dropping subscription_usages table...")
         await conn.execute(text(DROP_TABLE_SQL))
         logger.info("Rollback completed successfully!")
 
-    await engine.dispose()
-
 
 if __name__ == "__main__":
-    import sys
-    from app.common.config import settings
-
-    if len(sys.argv) < 2:
-        print("Usage: python create_subscription_usage_table.py [upgrade|downgrade]")
-        sys.exit(1)
-
-    action = sys.argv[1]
-
-    if action == "upgrade":
-        asyncio.run(upgrade(settings.DATABASE_URL))
-    elif action == "downgrade":
-        asyncio.run(downgrade(settings.DATABASE_URL))
-    else:
-        print(f"Unknown action: {action}")
-        sys.exit(1)
+    from migrations._runner import main
+
+    main(upgrade, downgrade, __doc__)
@@ -2,90 +2,72 @@
 Migration: Make script and audio_url columns nullable in lesson_audios table
 """
 
-import asyncio
+import logging
 import sys
 from pathlib import Path
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.ddl import backfill_nulls, exec_alter
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
 
 
 async def upgrade():
     """Make script and audio_url columns nullable."""
-    async with engine.begin() as conn:
-        print("Modifying lesson_audios table...")
+    async with ddl_engine.connect() as conn:
+        logger.info("Modifying lesson_audios table...")
 
-        # 1. Modify script column to be nullable
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE lesson_audios 
-            MODIFY COLUMN script LONGTEXT NULL
+        # Both columns in one ALTER so the table is rebuilt only once
+        await exec_alter(
+            conn,
             """
-            )
-        )
-        print("✓ Modified script to be nullable")
-
-        # 2. Modify audio_url column to be nullable
-        await conn.execute(
-            text(
-                """
             ALTER TABLE lesson_audios 
+            MODIFY COLUMN script LONGTEXT NULL,
             MODIFY COLUMN audio_url TEXT NULL
-            """
-            )
+            """,
         )
-        print("✓ Modified audio_url to be nullable")
+        logger.info("✓ Modified script to be nullable")
+        logger.info("✓ Modified audio_url to be nullable")
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
-        print("Reverting changes...")
+    async with ddl_engine.connect() as conn:
+        logger.info("Reverting changes...")
 
-        # 1. Revert script column to be NOT NULL
-        # Note: This might fail if there are NULL values
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lesson_audios 
-                MODIFY COLUMN script LONGTEXT NOT NULL
-                """
-                )
-            )
-            print("✓ Reverted script to be NOT NULL")
-        except Exception as e:
-            print(f"Warning: Could not revert script column: {e}")
+        # NOT NULL fails on existing NULLs, so fill them with empty strings
+        # first, in batches that commit separately
+        for column in ("script", "audio_url"):
+            count = await backfill_nulls(conn, "lesson_audios", column, "")
+            logger.info(f"✓ Backfilled {count} NULL {column} values")
 
-        # 2. Revert audio_url column to be NOT NULL
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lesson_audios 
-                MODIFY COLUMN audio_url TEXT NOT NULL
-                """
-                )
-            )
-            print("✓ Reverted audio_url to be NOT NULL")
-        except Exception as e:
-            print(f"Warning: Could not revert audio_url column: {e}")
+        await exec_alter(
+            conn,
+            """
+            ALTER TABLE lesson_audios 
+            MODIFY COLUMN script LONGTEXT NOT NULL,
+            MODIFY COLUMN audio_url TEXT NOT NULL
+            """,
+        )
+        logger.info("✓ Reverted script to be NOT NULL")
+        logger.info("✓ Reverted audio_url to be NOT NULL")
 
 
 async def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     try:
         await upgrade()
-        print("Migration completed successfully!")
+        logger.info("Migration completed successfully!")
     except Exception as e:
-        print(f"Migration failed: {e}")
+        logger.error(f"Migration failed: {e}")
         sys.exit(1)
     finally:
         await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,11 +1,15 @@
 """Migration to make hashed_password nullable in users table."""
 
-import asyncio
 import logging
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+import sys
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.common.database.ddl import backfill_nulls, exec_alter
+from app.common.database.session import ddl_engine
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -22,50 +26,27 @@ MODIFY COLUMN hashed_password VARCHAR(255) NOT NULL;
 """
 
 
-async def upgrade(database_url: str) -> None:
+async def upgrade() -> None:
     """Apply the migration."""
-    engine = create_async_engine(database_url, echo=True)
-
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         logger.info("Making hashed_password nullable...")
-        await conn.execute(text(ALTER_COLUMN_SQL))
+        await exec_alter(conn, ALTER_COLUMN_SQL)
         logger.info("Migration completed successfully!")
 
-    await engine.dispose()
 
-
-async def downgrade(database_url: str) -> None:
+async def downgrade() -> None:
     """Rollback the migration."""
-    engine = create_async_engine(database_url, echo=True)
-
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         logger.info("Making hashed_password NOT NULL...")
-        await conn.execute(text(ROLLBACK_SQL))
+        # Users without a password (e.g. Google sign-ins) get an empty hash,
+        # which login already treats as having no password
+        count = await backfill_nulls(conn, "users", "hashed_password", "")
+        logger.info(f"Backfilled {count} NULL hashed_password values")
+        await exec_alter(conn, ROLLBACK_SQL)
         logger.info("Rollback completed successfully!")
 
-    await engine.dispose()
-
 
 if __name__ == "__main__":
-    import sys
-    import os
-
-    # Add the current directory to sys.path to allow importing from app
-    sys.path.append(os.getcwd())
-    from app.common.config import settings
-
-    if len(sys.argv) < 2:
-        print(
-            "Usage: python migrations/make_hashed_password_nullable.py [upgrade|downgrade]"
-        )
-        sys.exit(1)
-
-    action = sys.argv[1]
+    from migrations._runner import main
 
-    if action == "upgrade":
-        asyncio.run(upgrade(settings.DATABASE_URL))
-    elif action == "downgrade":
-        asyncio.run(downgrade(settings.DATABASE_URL))
-    else:
-        print(f"Unknown action: {action}")
-        sys.exit(1)
+    main(upgrade, downgrade, __doc__)
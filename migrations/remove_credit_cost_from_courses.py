@@ -1,7 +1,6 @@
 """Migration: Remove credit_cost from courses table.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -9,12 +8,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine
 
 
 async def upgrade():
     """Drop credit_cost column from courses table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Migrating courses table...")
 
         # Drop credit_cost from courses
@@ -34,7 +33,7 @@ async def upgrade():
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Reverting credit_cost column in courses...")
 
         # Add credit_cost back to courses
@@ -52,27 +51,7 @@ async def downgrade():
             print(f"Skipped adding credit_cost back to courses: {e}")
 
 
-async def main():
-    action = "upgrade"
-    if len(sys.argv) > 1:
-        action = sys.argv[1]
-
-    try:
-        if action == "upgrade":
-            await upgrade()
-            print("Migration completed successfully!")
-        elif action == "downgrade":
-            await downgrade()
-            print("Downgrade completed successfully!")
-        else:
-            print(f"Unknown action: {action}")
-            sys.exit(1)
-    except Exception as e:
-        print(f"Migration failed: {e}")
-        sys.exit(1)
-    finally:
-        await engine.dispose()
-
-
 if __name__ == "__main__":
-    asyncio.run(main())
+    from migrations._runner import main
+
+    main(upgrade, downgrade, __doc__, default_action="upgrade")
@@ -2,7 +2,7 @@
 Migration: Remove credits feature from users and lessons tables
 """
 
-import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -10,104 +10,97 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.ddl import (
+    exec_alter,
+    is_applied,
+    mark_applied,
+    mark_unapplied,
+)
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
+
+# Recorded in schema_migrations once applied
+MIGRATION_NAME = Path(__file__).stem
+
+
+# Credit columns per table; each table is altered with a single statement
+CREDIT_COLUMNS = {
+    "users": ["credits"],
+    "lessons": ["credit_cost", "audio_credit_cost"],
+}
+
+
+async def existing_credit_columns(conn) -> set[tuple[str, str]]:
+    """Return the (table, column) pairs from CREDIT_COLUMNS that exist."""
+    result = await conn.execute(
+        text(
+            """
+        SELECT TABLE_NAME, COLUMN_NAME
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME IN ('users', 'lessons')
+        AND COLUMN_NAME IN ('credits', 'credit_cost', 'audio_credit_cost')
+        """
+        )
+    )
+    return {(row[0], row[1]) for row in result.fetchall()}
 
 
 async def upgrade():
     """Remove credit-related columns from users and lessons tables."""
-    async with engine.begin() as conn:
-        print("Migrating users and lessons tables...")
-
-        # 1. Remove credits from users
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE users 
-                DROP COLUMN credits
-                """
-                )
-            )
-            print("✓ Dropped credits column from users table")
-        except Exception as e:
-            print(f"Skipped dropping credits from users: {e}")
-
-        # 2. Remove credit_cost from lessons
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                DROP COLUMN credit_cost
-                """
-                )
-            )
-            print("✓ Dropped credit_cost column from lessons table")
-        except Exception as e:
-            print(f"Skipped dropping credit_cost from lessons: {e}")
-
-        # 3. Remove audio_credit_cost from lessons
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE lessons 
-                DROP COLUMN audio_credit_cost
-                """
-                )
-            )
-            print("✓ Dropped audio_credit_cost column from lessons table")
-        except Exception as e:
-            print(f"Skipped dropping audio_credit_cost from lessons: {e}")
+    async with ddl_engine.connect() as conn:
+        if await is_applied(conn, MIGRATION_NAME):
+            logger.info("✓ Already applied")
+            return
+
+        logger.info("Migrating users and lessons tables...")
+
+        existing = await existing_credit_columns(conn)
+
+        for table, columns in CREDIT_COLUMNS.items():
+            present = [column for column in columns if (table, column) in existing]
+            if not present:
+                logger.info(f"Skipped {table}: {', '.join(columns)} already removed")
+                continue
+
+            drops = ", ".join(f"DROP COLUMN {column}" for column in present)
+            await exec_alter(conn, f"ALTER TABLE {table} {drops}")
+            logger.info(f"✓ Dropped {', '.join(present)} from {table} table")
+
+        await mark_applied(conn, MIGRATION_NAME)
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
-        print("Reverting credits feature columns...")
-
-        # 1. Add credits back to users
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE users 
-            ADD COLUMN credits INT DEFAULT 0
-            """
-            )
-        )
+    async with ddl_engine.connect() as conn:
+        logger.info("Reverting credits feature columns...")
 
-        # 2. Add credit_cost back to lessons
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE lessons 
-            ADD COLUMN credit_cost INT DEFAULT 0
-            """
-            )
-        )
+        existing = await existing_credit_columns(conn)
 
-        # 3. Add audio_credit_cost back to lessons
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE lessons 
-            ADD COLUMN audio_credit_cost INT DEFAULT 0
-            """
-            )
-        )
-        print("✓ Reverted all columns")
+        for table, columns in CREDIT_COLUMNS.items():
+            missing = [column for column in columns if (table, column) not in existing]
+            if not missing:
+                continue
+
+            adds = ", ".join(f"ADD COLUMN {column} INT DEFAULT 0" for column in missing)
+            await exec_alter(conn, f"ALTER TABLE {table} {adds}")
+        await mark_unapplied(conn, MIGRATION_NAME)
+        logger.info("✓ Reverted all columns")
 
 
 async def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     try:
         await upgrade()
-        print("Migration completed successfully!")
+        logger.info("Migration completed successfully!")
     except Exception as e:
-        print(f"Migration failed: {e}")
+        logger.error(f"Migration failed: {e}")
         sys.exit(1)
     finally:
         await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -2,55 +2,81 @@
 Migration: Remove is_unlocked from user_lessons table
 """
 
-import asyncio
+import logging
 import sys
 from pathlib import Path
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import text
-from app.common.database.session import engine
+from sqlalchemy.exc import OperationalError
+from app.common.database.ddl import (
+    ER_CANT_DROP_FIELD_OR_KEY,
+    exec_alter,
+    is_applied,
+    mark_applied,
+    mark_unapplied,
+    mysql_error_code,
+)
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
+
+# Recorded in schema_migrations once applied
+MIGRATION_NAME = Path(__file__).stem
 
 
 async def upgrade():
     """Remove is_unlocked column from user_lessons table."""
-    async with engine.begin() as conn:
-        print("Migrating user_lessons table...")
+    async with ddl_engine.connect() as conn:
+        if await is_applied(conn, MIGRATION_NAME):
+            logger.info("✓ Already applied")
+            return
+
+        logger.info("Migrating user_lessons table...")
 
-        # Drop the is_unlocked column
-        await conn.execute(
-            text(
+        # Drop the is_unlocked column. A missing column means an earlier run
+        # dropped it before migrations were recorded
+        try:
+            await exec_alter(
+                conn,
                 """
-            ALTER TABLE user_lessons 
-            DROP COLUMN is_unlocked
-            """
+                ALTER TABLE user_lessons 
+                DROP COLUMN is_unlocked
+                """,
             )
-        )
-        print("✓ Dropped is_unlocked column")
+            logger.info("✓ Dropped is_unlocked column")
+        except OperationalError as e:
+            if mysql_error_code(e) != ER_CANT_DROP_FIELD_OR_KEY:
+                raise
+            logger.info("✓ is_unlocked column already dropped")
+
+        await mark_applied(conn, MIGRATION_NAME)
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Add the column back
-        await conn.execute(
-            text(
-                """
+        await exec_alter(
+            conn,
+            """
             ALTER TABLE user_lessons 
             ADD COLUMN is_unlocked BOOLEAN DEFAULT FALSE
-            """
-            )
+            """,
         )
-        print("✓ Added is_unlocked column back")
+        await mark_unapplied(conn, MIGRATION_NAME)
+        logger.info("✓ Added is_unlocked column back")
 
 
 async def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     try:
         await upgrade()
-        print("Migration completed successfully!")
+        logger.info("Migration completed successfully!")
     except Exception as e:
-        print(f"Migration failed: {e}")
+        logger.error(f"Migration failed: {e}")
         # If it failed likely because column doesn't exist, we can ignore or print warning
         # But for now strict failure
         sys.exit(1)
@@ -59,4 +85,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
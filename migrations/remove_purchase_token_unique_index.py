@@ -4,80 +4,56 @@ This allows multiple subscription records with the same purchase_token,
 which is needed for maintaining subscription history when renewals occur.
 """
 
-import asyncio
 import logging
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
+import sys
+from pathlib import Path
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import text
+from app.common.database.session import ddl_engine
 
-# Migration SQL - drop the unique index and create a regular index
-DROP_UNIQUE_INDEX_SQL = """
-DROP INDEX ix_subscriptions_purchase_token ON subscriptions;
-"""
+logger = logging.getLogger(__name__)
 
-CREATE_REGULAR_INDEX_SQL = """
-CREATE INDEX ix_subscriptions_purchase_token ON subscriptions(purchase_token);
-"""
 
-# Rollback SQL - drop regular index and recreate unique index
-ROLLBACK_DROP_INDEX_SQL = """
-DROP INDEX ix_subscriptions_purchase_token ON subscriptions;
+# Migration SQL - swap the unique index for a regular one under the same
+# name. Both changes go in one ALTER so the table's metadata lock is taken once.
+# Index changes cannot be INSTANT, so the online INPLACE algorithm is requested
+# directly rather than through exec_alter's INSTANT attempt
+REPLACE_WITH_REGULAR_INDEX_SQL = """
+ALTER TABLE subscriptions
+DROP INDEX ix_subscriptions_purchase_token,
+ADD INDEX ix_subscriptions_purchase_token (purchase_token),
+ALGORITHM=INPLACE, LOCK=NONE;
 """
 
-ROLLBACK_CREATE_UNIQUE_INDEX_SQL = """
-CREATE UNIQUE INDEX ix_subscriptions_purchase_token ON subscriptions(purchase_token);
+# Rollback SQL - swap the regular index back for a unique one
+REPLACE_WITH_UNIQUE_INDEX_SQL = """
+ALTER TABLE subscriptions
+DROP INDEX ix_subscriptions_purchase_token,
+ADD UNIQUE INDEX ix_subscriptions_purchase_token (purchase_token),
+ALGORITHM=INPLACE, LOCK=NONE;
 """
 
 
-async def upgrade(database_url: str) -> None:
+async def upgrade() -> None:
     """Apply the migration."""
-    engine = create_async_engine(database_url, echo=True)
-
-    async with engine.begin() as conn:
-        logger.info("Dropping unique index on purchase_token...")
-        await conn.execute(text(DROP_UNIQUE_INDEX_SQL))
-
-        logger.info("Creating regular index on purchase_token...")
-        await conn.execute(text(CREATE_REGULAR_INDEX_SQL))
-
+    async with ddl_engine.connect() as conn:
+        logger.info("Replacing unique index on purchase_token with a regular index...")
+        await conn.execute(text(REPLACE_WITH_REGULAR_INDEX_SQL))
         logger.info("Migration completed successfully!")
 
-    await engine.dispose()
-
 
-async def downgrade(database_url: str) -> None:
+async def downgrade() -> None:
     """Rollback the migration."""
-    engine = create_async_engine(database_url, echo=True)
-
-    async with engine.begin() as conn:
-        logger.info("Dropping regular index on purchase_token...")
-        await conn.execute(text(ROLLBACK_DROP_INDEX_SQL))
-
-        logger.info("Creating unique index on purchase_token...")
-        await conn.execute(text(ROLLBACK_CREATE_UNIQUE_INDEX_SQL))
-
+    async with ddl_engine.connect() as conn:
+        logger.info("Replacing regular index on purchase_token with a unique index...")
+        await conn.execute(text(REPLACE_WITH_UNIQUE_INDEX_SQL))
         logger.info("Rollback completed successfully!")
 
-    await engine.dispose()
-
 
 if __name__ == "__main__":
-    import sys
-    from app.common.config import settings
-
-    if len(sys.argv) < 2:
-        print("Usage: python remove_purchase_token_unique_index.py [upgrade|downgrade]")
-        sys.exit(1)
-
-    action = sys.argv[1]
+    from migrations._runner import main
 
-    if action == "upgrade":
-        asyncio.run(upgrade(settings.DATABASE_URL))
-    elif action == "downgrade":
-        asyncio.run(downgrade(settings.DATABASE_URL))
-    else:
-        print(f"Unknown action: {action}")
-        sys.exit(1)
+    main(upgrade, downgrade, __doc__)
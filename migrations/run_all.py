@@ -0,0 +1,105 @@
+"""Run several migrations in one process.
+
+Each named migration module's upgrade() (or downgrade() with --downgrade) is
+awaited in turn against the shared application engine, which is disposed once
+at the end instead of after every migration, so the whole batch reuses the
+same connection pool.
+
+Migrations carry no ordering metadata, so the order is the one given on the
+command line; downgrades run in reverse. Migrations that touch different
+tables can instead run together with --concurrent, each on its own pooled
+connection.
+
+Run with:
+    python migrations/run_all.py create_subscription_usage_table make_purchase_token_nullable
+    python migrations/run_all.py --downgrade make_purchase_token_nullable
+    python migrations/run_all.py --concurrent change_question_columns_to_text make_audio_fields_nullable
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import sys
+from pathlib import Path
+
+# Add the project root to the path, and this directory so migrations can be
+# imported by their module name
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.common.config import settings
+from app.common.database.session import engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
+
+
+def load_steps(names, action):
+    """Import each migration and return its step coroutine functions in run order."""
+    steps = []
+    for name in names:
+        module = importlib.import_module(name.removesuffix(".py"))
+        step = getattr(module, action, None)
+        if step is None:
+            raise SystemExit(
+                f"{name} has no shared-engine {action}(); run it on its own instead"
+            )
+        steps.append((name, step))
+
+    if action == "downgrade":
+        steps.reverse()
+    return steps
+
+
+async def run_concurrently(steps) -> None:
+    """Run the steps together, never more at once than the pool can serve."""
+    limit = asyncio.Semaphore(settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+
+    async def run_step(name, step):
+        async with limit:
+            logger.info(f"Running {name}...")
+            await step()
+
+    await asyncio.gather(*(run_step(name, step) for name, step in steps))
+
+
+async def main(names, action, concurrent=False):
+    """Run the migrations, then close the shared engine's connections once."""
+    try:
+        steps = load_steps(names, action)
+        if concurrent:
+            await run_concurrently(steps)
+        else:
+            for name, step in steps:
+                logger.info(f"Running {name} {action}...")
+                await step()
+        logger.info(f"All {len(names)} migrations completed successfully!")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    parser = argparse.ArgumentParser(description="Run several migrations in one process")
+    parser.add_argument("migrations", nargs="+", help="Migration module names, in order")
+    parser.add_argument(
+        "--downgrade",
+        action="store_true",
+        help="Run downgrade() of each migration, in reverse order",
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Run the migrations at the same time; only for independent tables",
+    )
+    args = parser.parse_args()
+
+    run(
+        main(
+            args.migrations,
+            "downgrade" if args.downgrade else "upgrade",
+            concurrent=args.concurrent,
+        )
+    )
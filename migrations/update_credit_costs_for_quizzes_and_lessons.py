@@ -1,7 +1,6 @@
 """Migration: Add quiz_credit_cost to lessons table and remove credit_cost from quizzes table.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -9,12 +8,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine
 
 
 async def upgrade():
     """Apply the migration."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Migrating lessons and quizzes tables...")
 
         # 1. Add quiz_credit_cost to lessons table
@@ -48,7 +47,7 @@ async def upgrade():
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Reverting quiz credit cost changes...")
 
         # 1. Drop quiz_credit_cost from lessons table
@@ -80,27 +79,7 @@ async def downgrade():
             print(f"Skipped adding credit_cost back to quizzes: {e}")
 
 
-async def main():
-    action = "upgrade"
-    if len(sys.argv) > 1:
-        action = sys.argv[1]
-
-    try:
-        if action == "upgrade":
-            await upgrade()
-            print("Migration completed successfully!")
-        elif action == "downgrade":
-            await downgrade()
-            print("Downgrade completed successfully!")
-        else:
-            print(f"Unknown action: {action}")
-            sys.exit(1)
-    except Exception as e:
-        print(f"Migration failed: {e}")
-        sys.exit(1)
-    finally:
-        await engine.dispose()
-
-
 if __name__ == "__main__":
-    asyncio.run(main())
+    from migrations._runner import main
+
+    main(upgrade, downgrade, __doc__, default_action="upgrade")
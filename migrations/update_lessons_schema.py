@@ -2,7 +2,7 @@
 Migration: Update lessons table with correct text column types
 """
 
-import asyncio
+import logging
 import sys
 from pathlib import Path
 
@@ -10,43 +10,37 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+logger = logging.getLogger(__name__)
 
 
 async def upgrade():
     """Update lessons table column types."""
-    async with engine.begin() as conn:
-        print("Modifying lessons table...")
+    async with ddl_engine.connect() as conn:
+        logger.info("Modifying lessons table...")
 
         # We need to execute ALTER TABLE statements to change column types
         # Note: MySQL syntax
 
-        # 1. Change audio_transcript_url to TEXT
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE lessons 
-            MODIFY COLUMN audio_transcript_url TEXT
-            """
-            )
-        )
-        print("✓ Modified audio_transcript_url to TEXT")
-
-        # 2. Change content to LONGTEXT
+        # Both changes in one ALTER so the table is rebuilt only once
         await conn.execute(
             text(
                 """
             ALTER TABLE lessons 
+            MODIFY COLUMN audio_transcript_url TEXT,
             MODIFY COLUMN content LONGTEXT
             """
             )
         )
-        print("✓ Modified content to LONGTEXT")
+        logger.info("✓ Modified audio_transcript_url to TEXT")
+        logger.info("✓ Modified content to LONGTEXT")
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         # Revert back to reasonable defaults if needed
         # Assuming they were roughly VARCHAR or TEXT before
         # This is a best-effort revert
@@ -55,32 +49,25 @@ async def downgrade():
             text(
                 """
             ALTER TABLE lessons 
-            MODIFY COLUMN audio_transcript_url VARCHAR(255)
-            """
-            )
-        )
-
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE lessons 
+            MODIFY COLUMN audio_transcript_url VARCHAR(255),
             MODIFY COLUMN content TEXT
             """
             )
         )
-        print("✓ Reverted column types")
+        logger.info("✓ Reverted column types")
 
 
 async def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     try:
         await upgrade()
-        print("Migration completed successfully!")
+        logger.info("Migration completed successfully!")
     except Exception as e:
-        print(f"Migration failed: {e}")
+        logger.error(f"Migration failed: {e}")
         sys.exit(1)
     finally:
         await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
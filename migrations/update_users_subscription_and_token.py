@@ -10,91 +10,82 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.common.database.session import engine
+from app.common.database.ddl import exec_alter
+from app.common.database.session import ddl_engine, engine
+from app.common.runner import run
+
+# Seconds to wait for the connection pool to close on exit
+DISPOSE_TIMEOUT = 2.0
+
+
+# Column definitions on users: dropped by upgrade / restored by downgrade,
+# and added by upgrade / dropped by downgrade
+SUBSCRIPTION_COLUMNS = {
+    "current_plan": "VARCHAR(255) DEFAULT 'free'",
+    "last_subscribed_at": "DATETIME",
+}
+TOKEN_COLUMNS = {
+    "device_reg_token": "TEXT",
+}
+
+_EXISTING_COLUMNS_SQL = text(
+    """
+    SELECT COLUMN_NAME
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+    AND TABLE_NAME = 'users'
+    AND COLUMN_NAME IN ('current_plan', 'last_subscribed_at', 'device_reg_token')
+"""
+)
+
+
+async def existing_columns(conn) -> set[str]:
+    """Return which of the columns this migration touches exist on users."""
+    result = await conn.execute(_EXISTING_COLUMNS_SQL)
+    return {row[0] for row in result.fetchall()}
+
+
+async def alter_users(conn, changes: list[str]) -> None:
+    """Apply all column changes to users in a single ALTER."""
+    if not changes:
+        print("Skipped: users table already up to date")
+        return
+
+    await exec_alter(conn, f"ALTER TABLE users {', '.join(changes)}")
+    for change in changes:
+        print(f"✓ {change}")
 
 
 async def upgrade():
     """Remove subscription columns and add device_reg_token to users table."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Migrating users table...")
 
-        # 1. Remove current_plan from users
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE users 
-                DROP COLUMN current_plan
-                """
-                )
-            )
-            print("✓ Dropped current_plan column from users table")
-        except Exception as e:
-            print(f"Skipped dropping current_plan from users: {e}")
-
-        # 2. Remove last_subscribed_at from users
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE users 
-                DROP COLUMN last_subscribed_at
-                """
-                )
-            )
-            print("✓ Dropped last_subscribed_at column from users table")
-        except Exception as e:
-            print(f"Skipped dropping last_subscribed_at from users: {e}")
-
-        # 3. Add device_reg_token to users
-        try:
-            await conn.execute(
-                text(
-                    """
-                ALTER TABLE users 
-                ADD COLUMN device_reg_token TEXT
-                """
-                )
-            )
-            print("✓ Added device_reg_token column to users table")
-        except Exception as e:
-            print(f"Skipped adding device_reg_token to users: {e}")
+        # One probe decides which changes are still needed, so re-runs skip
+        # what is already done
+        existing = await existing_columns(conn)
+        changes = [
+            f"DROP COLUMN {column}" for column in SUBSCRIPTION_COLUMNS if column in existing
+        ] + [
+            f"ADD COLUMN {column} {definition}"
+            for column, definition in TOKEN_COLUMNS.items()
+            if column not in existing
+        ]
+        await alter_users(conn, changes)
 
 
 async def downgrade():
     """Revert changes."""
-    async with engine.begin() as conn:
+    async with ddl_engine.connect() as conn:
         print("Reverting users table changes...")
 
-        # 1. Add current_plan back
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE users 
-            ADD COLUMN current_plan VARCHAR(255) DEFAULT 'free'
-            """
-            )
-        )
-
-        # 2. Add last_subscribed_at back
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE users 
-            ADD COLUMN last_subscribed_at DATETIME
-            """
-            )
-        )
-
-        # 3. Remove device_reg_token
-        await conn.execute(
-            text(
-                """
-            ALTER TABLE users 
-            DROP COLUMN device_reg_token
-            """
-            )
-        )
+        existing = await existing_columns(conn)
+        changes = [
+            f"ADD COLUMN {column} {definition}"
+            for column, definition in SUBSCRIPTION_COLUMNS.items()
+            if column not in existing
+        ] + [f"DROP COLUMN {column}" for column in TOKEN_COLUMNS if column in existing]
+        await alter_users(conn, changes)
         print("✓ Reverted all changes")
 
 
@@ -106,8 +97,13 @@ async def main():
         print(f"Migration failed: {e}")
         sys.exit(1)
     finally:
-        await engine.dispose()
+        # The process exits next, so don't wait long on slow connection
+        # teardown (e.g. over an SSH tunnel)
+        try:
+            await asyncio.wait_for(engine.dispose(), timeout=DISPOSE_TIMEOUT)
+        except TimeoutError:
+            print("Timed out closing database connections")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
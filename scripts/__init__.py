@@ -0,0 +1,6 @@
+"""Developer scripts.
+
+Run them as modules from the project root so ``app`` is importable, e.g.:
+
+    python -m scripts.test_audio_generation
+"""
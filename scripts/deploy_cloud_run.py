@@ -1,25 +1,25 @@
+import json
 import os
 import subprocess
-import yaml
 from dotenv import dotenv_values
 
+QUOTES = "'\""
+
 
 def deploy():
     # Load environment variables from .env
     env_vars = dotenv_values(".env")
 
-    # Filter out empty values and clean them
-    filtered_vars = {}
-    for key, value in env_vars.items():
-        if value is not None and value != "":
-            # Remove any existing quotes from the value
-            clean_value = value.strip("'").strip('"')
-            filtered_vars[key] = clean_value
-
-    # Write to a temporary yaml file
+    # Write non-empty values to a temporary yaml file, removing any existing
+    # quotes from them. JSON strings are valid YAML double-quoted scalars, so
+    # a flat string map needs no YAML emitter
     env_file_path = "env_vars.yaml"
     with open(env_file_path, "w") as f:
-        yaml.dump(filtered_vars, f, default_flow_style=False)
+        f.writelines(
+            f"{json.dumps(key)}: {json.dumps(value.strip(QUOTES))}\n"
+            for key, value in sorted(env_vars.items())
+            if value
+        )
 
     # Construct the gcloud command
     import shutil
@@ -1,14 +1,11 @@
-import asyncio
 import os
-import sys
+import traceback
 
-# Ensure the app module can be found
-from pathlib import Path
+from app.common.dependencies import get_audio_generation_service
+from app.common.runner import run
+from app.services.storage_service import sniff_audio_format
 
-project_root = str(Path(__file__).parent.parent)
-sys.path.append(project_root)
-
-from app.services.audio_generation_service import audio_generation_service
+audio_generation_service = get_audio_generation_service()
 
 
 async def test_wav_generation():
@@ -37,7 +34,8 @@ Speaker 2: Where you can direct a voice, create realistic dialog, and so much mo
         print(f"✅ Received {len(audio_bytes)} bytes of audio data.")
 
         # Verify it's a WAV file
-        if audio_bytes[:4] == b"RIFF":
+        audio_format = sniff_audio_format(audio_bytes)
+        if audio_format and audio_format[0] == "wav":
             print("✅ Valid WAV file format detected")
         else:
             print("⚠️  Warning: File may not be a valid WAV")
@@ -50,8 +48,6 @@ Speaker 2: Where you can direct a voice, create realistic dialog, and so much mo
 
     except Exception as e:
         print(f"❌ An error occurred: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -83,10 +79,8 @@ Speaker 2: The audio should be encoded in MP3 format with 128k bitrate.
         print(f"✅ Received {len(mp3_bytes)} bytes of MP3 data.")
 
         # Verify it's an MP3 file
-        # MP3 files typically start with ID3 tag or sync word (0xFF 0xFB/0xFA)
-        if mp3_bytes[:3] == b"ID3" or (
-            mp3_bytes[0] == 0xFF and mp3_bytes[1] & 0xE0 == 0xE0
-        ):
+        audio_format = sniff_audio_format(mp3_bytes)
+        if audio_format and audio_format[0] == "mp3":
             print("✅ Valid MP3 file format detected")
         else:
             print("⚠️  Warning: File may not be a valid MP3")
@@ -99,8 +93,6 @@ Speaker 2: The audio should be encoded in MP3 format with 128k bitrate.
 
     except Exception as e:
         print(f"❌ An error occurred: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -139,4 +131,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,15 +1,22 @@
 import asyncio
 import os
-import sys
+import traceback
 
-# Ensure the app module can be found
-from pathlib import Path
+from app.common.dependencies import (
+    get_audio_generation_service,
+    get_firebase_storage_service,
+)
+from app.common.runner import run
+from app.services.storage_service import sniff_audio_format
 
-project_root = str(Path(__file__).parent.parent)
-sys.path.append(project_root)
+audio_generation_service = get_audio_generation_service()
+firebase_storage_service = get_firebase_storage_service()
 
-from app.services.audio_generation_service import audio_generation_service
-from app.services.storage_service import firebase_storage_service
+
+def save_locally(path: str, data: bytes) -> None:
+    """Write audio bytes to a local file."""
+    with open(path, "wb") as f:
+        f.write(data)
 
 
 async def test_mp3_generation_and_upload():
@@ -30,7 +37,7 @@ Speaker 1: This audio will be generated as MP3 and uploaded to Firebase Storage.
 
     try:
         # Step 1: Generate MP3 audio
-        print("\n[Step 1/3] Generating MP3 audio...")
+        print("\n[Step 1/2] Generating MP3 audio...")
         mp3_bytes = await audio_generation_service.generate_audio_mp3(
             text=text, sample_rate=24000, bitrate="128k"
         )
@@ -42,27 +49,30 @@ Speaker 1: This audio will be generated as MP3 and uploaded to Firebase Storage.
         print(f"✅ Generated {len(mp3_bytes)} bytes of MP3 data.")
 
         # Verify it's an MP3 file
-        if mp3_bytes[:3] == b"ID3" or (
-            mp3_bytes[0] == 0xFF and mp3_bytes[1] & 0xE0 == 0xE0
-        ):
+        audio_format = sniff_audio_format(mp3_bytes)
+        if audio_format and audio_format[0] == "mp3":
             print("✅ Valid MP3 file format detected")
         else:
             print("⚠️  Warning: File may not be a valid MP3")
 
-        # Step 2: Save locally (optional, for verification)
-        print(f"\n[Step 2/3] Saving MP3 locally to {local_filename}...")
-        with open(local_filename, "wb") as f:
-            f.write(mp3_bytes)
-        print(f"✅ MP3 saved to: {os.path.abspath(local_filename)}")
-
-        # Step 3: Upload to Firebase Storage
-        print("\n[Step 3/3] Uploading MP3 to Firebase Storage...")
+        # Step 2: Save locally (for verification) and upload to Firebase
+        # Storage at the same time; both read the same bytes object, so
+        # neither makes a copy
+        print(
+            f"\n[Step 2/2] Saving MP3 to {local_filename} and uploading to Firebase Storage..."
+        )
         folder_name = "test_audio_uploads"
 
-        url = firebase_storage_service.upload_audio(
-            audio_data=mp3_bytes, filename_prefix="test_generation", folder=folder_name
+        _, url = await asyncio.gather(
+            asyncio.to_thread(save_locally, local_filename, mp3_bytes),
+            firebase_storage_service.upload_audio_async(
+                audio_data=mp3_bytes,
+                filename_prefix="test_generation",
+                folder=folder_name,
+                audio_format=audio_format,
+            ),
         )
-
+        print(f"✅ MP3 saved to: {os.path.abspath(local_filename)}")
         print(f"✅ Success! MP3 uploaded to Firebase Storage")
         print(f"📎 Public URL: {url}")
 
@@ -70,8 +80,6 @@ Speaker 1: This audio will be generated as MP3 and uploaded to Firebase Storage.
 
     except Exception as e:
         print(f"❌ An error occurred: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -100,7 +108,8 @@ Speaker 2: WAV files are uncompressed and larger than MP3.
         print(f"✅ Received {len(audio_bytes)} bytes of audio data.")
 
         # Verify it's a WAV file
-        if audio_bytes[:4] == b"RIFF":
+        audio_format = sniff_audio_format(audio_bytes)
+        if audio_format and audio_format[0] == "wav":
             print("✅ Valid WAV file format detected")
         else:
             print("⚠️  Warning: File may not be a valid WAV")
@@ -113,8 +122,6 @@ Speaker 2: WAV files are uncompressed and larger than MP3.
 
     except Exception as e:
         print(f"❌ An error occurred: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -125,6 +132,7 @@ async def main():
     print("AUDIO GENERATION & UPLOAD TEST SUITE")
     print("=" * 60)
 
+    firebase_storage_service.initialize()
     results = []
 
     # Test 1: MP3 generation and upload (primary test)
@@ -153,4 +161,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,32 +1,50 @@
-import asyncio
 import os
-import sys
-
-# Ensure the app module can be found
-from pathlib import Path
-
-project_root = str(Path(__file__).parent.parent)
-sys.path.append(project_root)
-
-from app.services.audio_generation_service import audio_generation_service
-
-
-from app.services.storage_service import firebase_storage_service
-import uuid
+import struct
+
+from app.common.dependencies import get_firebase_storage_service
+from app.common.runner import run
+
+firebase_storage_service = get_firebase_storage_service()
+
+# RIFF/WAVE header for 16-bit mono PCM at 44.1 kHz
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def dummy_wav(data_size: int) -> bytes:
+    """Build a silent WAV file whose header sizes match its data."""
+    buffer = bytearray(WAV_HEADER.size + data_size)
+    WAV_HEADER.pack_into(
+        buffer,
+        0,
+        b"RIFF",  # ChunkID
+        36 + data_size,  # ChunkSize
+        b"WAVE",  # Format
+        b"fmt ",  # Subchunk1ID
+        16,  # Subchunk1Size (16 for PCM)
+        1,  # AudioFormat (1 for PCM)
+        1,  # NumChannels
+        44100,  # SampleRate
+        88200,  # ByteRate
+        2,  # BlockAlign
+        16,  # BitsPerSample
+        b"data",  # Subchunk2ID
+        data_size,  # Subchunk2Size
+    )
+    return bytes(buffer)
 
 
 async def main():
     print("Starting audio upload test...")
 
-    # Create dummy audio data (1kb of silence/noise)
-    dummy_wav_header = b"RIFF\x24\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00D\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x00\x00\x00"
-    audio_bytes = dummy_wav_header + b"\x00" * 1000
+    # Create dummy audio data (1kb of silence)
+    audio_bytes = dummy_wav(1000)
 
     try:
         folder_name = "test_custom_folder"
         print(f"Uploading to folder: {folder_name}...")
 
-        url = firebase_storage_service.upload_audio(
+        firebase_storage_service.initialize()
+        url = await firebase_storage_service.upload_audio_async(
             audio_data=audio_bytes, filename_prefix="test_upload", folder=folder_name
         )
 
@@ -37,4 +55,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,19 +1,22 @@
 """Test content length validation for audio generation."""
 
 import asyncio
-import sys
-from pathlib import Path
-
-project_root = str(Path(__file__).parent.parent)
-sys.path.append(project_root)
 
+from app.common.dependencies import get_audio_generation_service
+from app.common.runner import run
 from app.services.audio_generation_service import (
-    audio_generation_service,
     ContentTooLongError,
     MAX_WORDS_SAFE,
     MAX_WORDS_ABSOLUTE,
 )
 
+audio_generation_service = get_audio_generation_service()
+
+
+def words(n: int) -> str:
+    """Return n space-separated words, built by one string repeat."""
+    return ("word " * n)[:-1]
+
 
 async def test_content_validation():
     """Test content length validation."""
@@ -23,7 +26,7 @@ async def test_content_validation():
 
     # Test 1: Valid short content
     print("\n[Test 1] Valid short content (50 words)...")
-    short_text = " ".join(["word"] * 50)
+    short_text = words(50)
     try:
         audio_generation_service.validate_content_length(short_text, strict=True)
         print("✅ Short content passed validation")
@@ -33,7 +36,7 @@ async def test_content_validation():
 
     # Test 2: Content at safe limit
     print(f"\n[Test 2] Content at safe limit ({MAX_WORDS_SAFE} words)...")
-    safe_limit_text = " ".join(["word"] * MAX_WORDS_SAFE)
+    safe_limit_text = words(MAX_WORDS_SAFE)
     try:
         audio_generation_service.validate_content_length(safe_limit_text, strict=True)
         print("✅ Safe limit content passed validation")
@@ -45,7 +48,7 @@ async def test_content_validation():
     print(
         f"\n[Test 3] Content exceeding safe limit ({MAX_WORDS_SAFE + 100} words, strict mode)..."
     )
-    over_safe_text = " ".join(["word"] * (MAX_WORDS_SAFE + 100))
+    over_safe_text = words(MAX_WORDS_SAFE + 100)
     try:
         audio_generation_service.validate_content_length(over_safe_text, strict=True)
         print("❌ Should have raised ContentTooLongError")
@@ -58,7 +61,7 @@ async def test_content_validation():
     print(
         f"\n[Test 4] Content at absolute limit ({MAX_WORDS_ABSOLUTE} words, non-strict mode)..."
     )
-    absolute_limit_text = " ".join(["word"] * MAX_WORDS_ABSOLUTE)
+    absolute_limit_text = words(MAX_WORDS_ABSOLUTE)
     try:
         audio_generation_service.validate_content_length(
             absolute_limit_text, strict=False
@@ -72,7 +75,7 @@ async def test_content_validation():
     print(
         f"\n[Test 5] Content exceeding absolute limit ({MAX_WORDS_ABSOLUTE + 100} words)..."
     )
-    over_absolute_text = " ".join(["word"] * (MAX_WORDS_ABSOLUTE + 100))
+    over_absolute_text = words(MAX_WORDS_ABSOLUTE + 100)
     try:
         audio_generation_service.validate_content_length(
             over_absolute_text, strict=False
@@ -126,7 +129,7 @@ Speaker 1: Perfect for testing!
 
     # Test 2: Try to generate with content that's too long
     print(f"\n[Test 2] Try to generate audio with {MAX_WORDS_ABSOLUTE + 200} words...")
-    too_long_text = " ".join(["word"] * (MAX_WORDS_ABSOLUTE + 200))
+    too_long_text = words(MAX_WORDS_ABSOLUTE + 200)
     try:
         audio_bytes = await audio_generation_service.generate_audio_mp3(
             text=too_long_text, validate=True
@@ -156,15 +159,16 @@ async def main():
     print("AUDIO GENERATION VALIDATION TEST SUITE")
     print("=" * 60)
 
-    results = []
-
-    # Test 1: Content validation
-    validation_success = await test_content_validation()
-    results.append(("Content Validation", validation_success))
-
-    # Test 2: Audio generation with validation
-    generation_success = await test_audio_generation_with_validation()
-    results.append(("Audio Generation with Validation", generation_success))
+    # The generation test goes first so its Gemini request is in flight
+    # while the (CPU-only) validation checks run
+    generation_success, validation_success = await asyncio.gather(
+        test_audio_generation_with_validation(),
+        test_content_validation(),
+    )
+    results = [
+        ("Content Validation", validation_success),
+        ("Audio Generation with Validation", generation_success),
+    ]
 
     # Print summary
     print("\n" + "=" * 60)
@@ -184,4 +188,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,12 +1,10 @@
-import asyncio
 import os
-import sys
-from pathlib import Path
+import traceback
 
-# Add the project root to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.common.dependencies import get_image_generation_service
+from app.common.runner import run
 
-from app.services.image_generation_service import image_generation_service
+image_generation_service = get_image_generation_service()
 
 
 async def main():
@@ -31,10 +29,8 @@ async def main():
 
     except Exception as e:
         print(f"Error generating image: {e}")
-        import traceback
-
         traceback.print_exc()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,18 +1,10 @@
-import asyncio
 import os
-import sys
-
-# Ensure the app module can be found
 from pathlib import Path
 
-project_root = str(Path(__file__).parent.parent)
-sys.path.append(project_root)
-
-from app.services.audio_generation_service import audio_generation_service
-
+from app.common.dependencies import get_firebase_storage_service
+from app.common.runner import run
 
-from app.services.storage_service import firebase_storage_service
-import uuid
+firebase_storage_service = get_firebase_storage_service()
 
 
 async def main():
@@ -31,7 +23,8 @@ async def main():
         folder_name = "generated_test_files"
         print(f"Uploading to folder: {folder_name}...")
 
-        url = firebase_storage_service.upload_audio(
+        firebase_storage_service.initialize()
+        url = await firebase_storage_service.upload_audio_async(
             audio_data=audio_bytes,
             filename_prefix="real_audio_test",
             folder=folder_name,
@@ -44,4 +37,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,29 +1,37 @@
-"""Quick test to verify imageio-ffmpeg is working."""
+"""Quick test to verify imageio-ffmpeg is working.
+
+Run with ``--version`` to also spawn FFmpeg and print its version.
+"""
+
+import os
+import sys
+from functools import lru_cache
 
 import imageio_ffmpeg as iio
 
+
+@lru_cache(maxsize=None)
+def ffmpeg_version() -> str:
+    """Run ``ffmpeg -version`` once and cache the version string."""
+    return iio.get_ffmpeg_version()
+
+
 # Test that we can get the FFmpeg executable
 ffmpeg_path = iio.get_ffmpeg_exe()
 print(f"✅ FFmpeg executable found at: {ffmpeg_path}")
+print(f"✅ imageio-ffmpeg {iio.__version__}")
 
-# Test that the executable exists and is accessible
-import os
-
-if os.path.exists(ffmpeg_path):
-    print("✅ FFmpeg binary exists and is accessible")
+# Test that the executable exists and can be run
+if os.path.isfile(ffmpeg_path) and os.access(ffmpeg_path, os.X_OK):
+    print("✅ FFmpeg binary exists and is executable")
 else:
-    print("❌ FFmpeg binary not found")
-
-# Get FFmpeg version
-import subprocess
-
-try:
-    result = subprocess.run(
-        [ffmpeg_path, "-version"], capture_output=True, text=True, timeout=5
-    )
-    version_line = result.stdout.split("\n")[0]
-    print(f"✅ {version_line}")
-except Exception as e:
-    print(f"❌ Error getting FFmpeg version: {e}")
+    print("❌ FFmpeg binary not found or not executable")
+
+# Getting the FFmpeg version starts a process, so it is opt-in
+if "--version" in sys.argv[1:]:
+    try:
+        print(f"✅ FFmpeg version {ffmpeg_version()}")
+    except Exception as e:
+        print(f"❌ Error getting FFmpeg version: {e}")
 
 print("\n🎉 imageio-ffmpeg is ready to use!")
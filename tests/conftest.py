@@ -1,32 +1,48 @@
 """Pytest configuration and shared fixtures."""
 
-import asyncio
-from typing import AsyncGenerator, Generator
+import os
+from typing import AsyncGenerator
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlmodel import SQLModel
 
 from app.main import app
 from app.common.config import settings
 from app.common.database.session import get_async_session
+from app.common.security import create_access_token, get_password_hash
+from app.features.users.models import User
+from app.features.users.schemas import UserResponse
 
 
-# Test database URL - use a separate test database
-TEST_DATABASE_URL = f"mysql+aiomysql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/test_{settings.DB_NAME}"
+# Test database URL - use a separate test database. Under pytest-xdist each
+# worker (PYTEST_XDIST_WORKER is gw0, gw1, ...) gets its own database so
+# parallel workers don't contend on the same rows and unique keys
+TEST_SERVER_URL = f"mysql+aiomysql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}"
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DB_NAME = f"test_{settings.DB_NAME}" + (f"_{XDIST_WORKER}" if XDIST_WORKER else "")
+TEST_DATABASE_URL = f"{TEST_SERVER_URL}/{TEST_DB_NAME}"
 
-
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+TEST_PASSWORD = "TestPassword123!"
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once for the whole session.
+
+    Tests are isolated by rolling back their transaction in ``db_session``
+    rather than by recreating the tables, so the schema DDL runs once per run.
+    """
+    if XDIST_WORKER:
+        # Worker databases are created on demand; the shared one is expected
+        # to exist already
+        server = create_async_engine(TEST_SERVER_URL, isolation_level="AUTOCOMMIT")
+        async with server.connect() as conn:
+            await conn.execute(text(f"CREATE DATABASE IF NOT EXISTS `{TEST_DB_NAME}`"))
+        await server.dispose()
+
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
@@ -47,7 +63,7 @@ async def test_engine():
 
     yield engine
 
-    # Drop all tables after tests
+    # Drop all tables after the test session
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
 
@@ -56,18 +72,26 @@ async def test_engine():
 
 @pytest.fixture(scope="function")
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a new database session for each test."""
-    async_session = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
-    )
+    """Create a new database session for each test.
+
+    The session is bound to a connection inside an outer transaction, and
+    commits made by the test or the app only release a savepoint, so
+    everything the test wrote is rolled back when it finishes.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        async_session = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+        async with async_session() as session:
+            yield session
+
+        await trans.rollback()
 
 
 @pytest.fixture(scope="function")
@@ -87,39 +111,44 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+def cached_password_hash() -> str:
+    """Hash the test password once; Argon2 is deliberately slow."""
+    return get_password_hash(TEST_PASSWORD)
+
+
 @pytest.fixture
 def test_user_data() -> dict:
     """Sample user data for testing."""
     return {
         "email": "test@example.com",
         "username": "testuser",
-        "password": "TestPassword123!",
+        "password": TEST_PASSWORD,
         "full_name": "Test User",
     }
 
 
 @pytest.fixture
-async def created_user(client: AsyncClient, test_user_data: dict) -> dict:
-    """Create a test user and return the response."""
-    response = await client.post("/api/v1/auth/register", json=test_user_data)
-    assert response.status_code == 201
-    return response.json()
+async def created_user(
+    db_session: AsyncSession, test_user_data: dict, cached_password_hash: str
+) -> dict:
+    """Create an active test user directly in the database.
+
+    Registration itself is covered by test_register_new_user; going through
+    the endpoint here would hash the password and run the ASGI stack for
+    every test that needs a user.
+    """
+    user_data = {k: v for k, v in test_user_data.items() if k != "password"}
+    user = User(**user_data, hashed_password=cached_password_hash, is_active=True)
+    db_session.add(user)
+    await db_session.flush()
+    return UserResponse.model_validate(user).model_dump(mode="json")
 
 
 @pytest.fixture
-async def auth_token(
-    client: AsyncClient, test_user_data: dict, created_user: dict
-) -> str:
-    """Get an authentication token for a test user."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        data={
-            "username": test_user_data["username"],
-            "password": test_user_data["password"],
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+def auth_token(created_user: dict) -> str:
+    """Get an authentication token for the test user."""
+    return create_access_token({"sub": str(created_user["id"])})
 
 
 @pytest.fixture
@@ -6,6 +6,7 @@ from app.features.modules.models import Module
 from app.features.lessons.models import Lesson
 from app.features.users.models import User
 from sqlalchemy import select
+from tests.utils.factories import bulk_create
 
 
 @pytest.mark.asyncio
@@ -33,17 +34,11 @@ async def test_user_course_response_includes_current_position(
     db_session.add(course)
     await db_session.flush()
 
-    # 3. Create Module and Lesson
-    module = Module(
-        title="Test Module", course_id=course.id, module_slug="test-mod", order=1
-    )
-    db_session.add(module)
-    await db_session.flush()
-
-    lesson = Lesson(
-        title="Test Lesson", course_id=course.id, module_id=module.id, order=1
-    )
-    db_session.add(lesson)
+    # 3. Create Module and Lesson. The lesson is linked through the module
+    # relationship, so one flush inserts both in dependency order
+    module = Module(title="Test Module", course=course, module_slug="test-mod", order=1)
+    lesson = Lesson(title="Test Lesson", course_id=course.id, module=module, order=1)
+    db_session.add_all([module, lesson])
     await db_session.flush()
 
     # 4. Create UserCourse enrollment with current position
@@ -232,15 +227,15 @@ async def test_get_user_course_detail_triggers_lessons_count_update(
     db_session.add(module)
     await db_session.flush()
 
-    lesson1 = Lesson(
-        title="Test Lesson 1", course_id=course.id, module_id=module.id, order=1
-    )
-    lesson2 = Lesson(
-        title="Test Lesson 2", course_id=course.id, module_id=module.id, order=2
+    lesson1, lesson2 = await bulk_create(
+        db_session,
+        Lesson,
+        [
+            {"title": f"Test Lesson {order}", "course_id": course.id,
+             "module_id": module.id, "order": order}
+            for order in (1, 2)
+        ],
     )
-    db_session.add(lesson1)
-    db_session.add(lesson2)
-    await db_session.flush()
 
     # 4. Enroll: Create UserCourse with total_lessons and completed_lessons as None
     user_course = UserCourse(
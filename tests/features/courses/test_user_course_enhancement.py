@@ -5,6 +5,7 @@ from app.features.users.models import User
 from app.features.courses.models import Course, UserCourse
 from app.features.lessons.models import Lesson
 from app.features.modules.models import Module
+from tests.utils.factories import bulk_create
 
 @pytest.mark.asyncio
 async def test_user_course_current_lesson(db_session: AsyncSession):
@@ -77,13 +78,18 @@ async def test_update_user_course_lessons_count(db_session: AsyncSession):
     db_session.add(module)
     await db_session.flush()
     
-    lesson1 = Lesson(title="Count Lesson 1", course_id=course.id, module_id=module.id, order=1)
-    lesson2 = Lesson(title="Count Lesson 2", course_id=course.id, module_id=module.id, order=2)
-    db_session.add(lesson1)
-    db_session.add(lesson2)
-    await db_session.flush()
+    lesson1, lesson2 = await bulk_create(
+        db_session,
+        Lesson,
+        [
+            {"title": f"Count Lesson {order}", "course_id": course.id,
+             "module_id": module.id, "order": order}
+            for order in (1, 2)
+        ],
+    )
     
-    # Create UserCourse
+    # Create UserCourse and UserLessons; nothing needs their ids, so they go
+    # out with the commit
     user_course = UserCourse(
         user_id=user.id,
         course_id=course.id,
@@ -91,9 +97,7 @@ async def test_update_user_course_lessons_count(db_session: AsyncSession):
         completed_lessons=0,
     )
     db_session.add(user_course)
-    await db_session.flush()
 
-    # Create UserLessons
     user_lesson1 = UserLesson(
         user_id=user.id,
         course_id=course.id,
@@ -108,8 +112,7 @@ async def test_update_user_course_lessons_count(db_session: AsyncSession):
         lesson_id=lesson2.id,
         status=ProgressStatus.IN_PROGRESS,
     )
-    db_session.add(user_lesson1)
-    db_session.add(user_lesson2)
+    db_session.add_all([user_lesson1, user_lesson2])
     await db_session.commit()
 
     # Instantiate repositories
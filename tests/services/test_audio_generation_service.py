@@ -0,0 +1,108 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.common.config import Settings
+from app.services.audio_generation_service import (
+    MAX_WORDS_SAFE,
+    AudioGenerationService,
+    ContentTooLongError,
+)
+
+
+@pytest.fixture
+def conversion_service():
+    service = MagicMock()
+    service.pcm_to_mp3_bytes.return_value = b"ID3-encoded"
+    return service
+
+
+@pytest.fixture
+def audio_service(conversion_service):
+    return AudioGenerationService(conversion_service, Settings(GEMINI_API_KEY="key"))
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_wraps_pcm_in_wav(audio_service):
+    pcm = bytearray(b"\x01\x02" * 8)
+    audio_service._generate_raw_sync = MagicMock(
+        return_value=(pcm, "pcm", {"bits_per_sample": 16, "rate": 24000})
+    )
+
+    wav = await audio_service.generate_audio("hello")
+
+    assert wav[:4] == b"RIFF"
+    assert wav[44:] == bytes(pcm)
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_mp3_encodes_pcm_without_wav_header(
+    audio_service, conversion_service
+):
+    pcm = bytearray(b"\x01\x02" * 8)
+    audio_service._generate_raw_sync = MagicMock(
+        return_value=(pcm, "pcm", {"bits_per_sample": 16, "rate": 16000})
+    )
+
+    mp3 = await audio_service.generate_audio_mp3("hello")
+
+    assert mp3 == b"ID3-encoded"
+    kwargs = conversion_service.pcm_to_mp3_bytes.call_args.kwargs
+    assert kwargs["pcm_bytes"] == pcm
+    assert kwargs["sample_rate"] == 16000
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_mp3_passes_through_encoded_stream(
+    audio_service, conversion_service
+):
+    audio_service._generate_raw_sync = MagicMock(
+        return_value=(bytearray(b"ID3data"), "mp3", {})
+    )
+
+    assert await audio_service.generate_audio_mp3("hello") == b"ID3data"
+    conversion_service.pcm_to_mp3_bytes.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "mime_type, expected",
+    [
+        ("audio/L16;rate=24000", {"bits_per_sample": 16, "rate": 24000}),
+        ("audio/L24; Rate=48000", {"bits_per_sample": 24, "rate": 48000}),
+        ("audio/L16;codec=pcm;rate=16000", {"bits_per_sample": 16, "rate": 16000}),
+        ("audio/L16", {"bits_per_sample": 16, "rate": None}),
+        ("", {"bits_per_sample": 16, "rate": None}),
+    ],
+)
+def test_parse_audio_mime_type(mime_type, expected):
+    assert AudioGenerationService._parse_audio_mime_type(mime_type) == expected
+
+
+def test_parse_audio_mime_type_returns_independent_dicts():
+    first = AudioGenerationService._parse_audio_mime_type("audio/L16;rate=24000")
+    first["rate"] = 8000
+
+    second = AudioGenerationService._parse_audio_mime_type("audio/L16;rate=24000")
+    assert second == {"bits_per_sample": 16, "rate": 24000}
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_mp3_uses_fallback_rate_when_stream_has_none(
+    audio_service, conversion_service
+):
+    params = AudioGenerationService._parse_audio_mime_type("audio/L16")
+    audio_service._generate_raw_sync = MagicMock(
+        return_value=(bytearray(b"\x00\x01"), "pcm", params)
+    )
+
+    await audio_service.generate_audio_mp3("hello", sample_rate=16000)
+
+    assert conversion_service.pcm_to_mp3_bytes.call_args.kwargs["sample_rate"] == 16000
+
+
+def test_validate_content_length_counts_words_across_newlines(audio_service):
+    audio_service.validate_content_length("a\nb " * (MAX_WORDS_SAFE // 2), strict=True)
+
+    with pytest.raises(ContentTooLongError, match="Word count"):
+        audio_service.validate_content_length(
+            "a\nb " * (MAX_WORDS_SAFE // 2 + 1), strict=True
+        )
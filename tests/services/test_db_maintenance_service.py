@@ -1,8 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from tenacity import wait_none
 from app.services.maintenance_service import DBMaintenanceService
-from app.features.lessons.models import LessonAudio
-from app.features.courses.models import Course
 
 
 @pytest.fixture
@@ -38,12 +37,10 @@ async def test_cleanup_orphaned_audios_success(
     maintenance_service, mock_audio_repo, mock_storage_service
 ):
     # Setup
-    mock_audio = MagicMock(spec=LessonAudio)
-    mock_audio.id = 1
-    mock_audio.audio_url = "https://example.com/audio.mp3"
-
-    mock_audio_repo.get_orphaned_audios.return_value = [mock_audio]
-    mock_storage_service.delete_file.return_value = True
+    audio_url = "https://example.com/audio.mp3"
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.return_value = [(1, audio_url)]
+    mock_audio_repo.delete_by_ids.return_value = 1
+    mock_storage_service.delete_files.return_value = {audio_url: True}
 
     # Execute
     result = await maintenance_service.cleanup_orphaned_audios()
@@ -53,9 +50,9 @@ async def test_cleanup_orphaned_audios_success(
     assert result["storage_deleted"] == 1
     assert result["db_deleted"] == 1
 
-    mock_audio_repo.get_orphaned_audios.assert_called_once()
-    mock_storage_service.delete_file.assert_called_once_with(mock_audio.audio_url)
-    mock_audio_repo.delete.assert_called_once_with(mock_audio)
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.assert_called_once()
+    mock_storage_service.delete_files.assert_called_once_with([audio_url])
+    mock_audio_repo.delete_by_ids.assert_called_once_with([1])
     mock_audio_repo.session.commit.assert_called_once()
 
 
@@ -64,7 +61,7 @@ async def test_cleanup_orphaned_audios_no_orphans(
     maintenance_service, mock_audio_repo, mock_storage_service
 ):
     # Setup
-    mock_audio_repo.get_orphaned_audios.return_value = []
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.return_value = []
 
     # Execute
     result = await maintenance_service.cleanup_orphaned_audios()
@@ -72,9 +69,9 @@ async def test_cleanup_orphaned_audios_no_orphans(
     # Assert
     assert result["deleted_count"] == 0
     assert result["storage_deleted"] == 0
-    mock_audio_repo.get_orphaned_audios.assert_called_once()
-    mock_storage_service.delete_file.assert_not_called()
-    mock_audio_repo.delete.assert_not_called()
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.assert_called_once()
+    mock_storage_service.delete_files.assert_not_called()
+    mock_audio_repo.delete_by_ids.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -82,12 +79,10 @@ async def test_cleanup_orphaned_courses_success(
     maintenance_service, mock_course_repo, mock_storage_service
 ):
     # Setup
-    mock_course = MagicMock(spec=Course)
-    mock_course.id = 1
-    mock_course.image_url = "https://example.com/image.jpg"
-
-    mock_course_repo.get_orphaned_courses.return_value = [mock_course]
-    mock_storage_service.delete_file.return_value = True
+    image_url = "https://example.com/image.jpg"
+    mock_course_repo.get_orphaned_course_ids_and_urls.return_value = [(1, image_url)]
+    mock_course_repo.delete_by_ids.return_value = 1
+    mock_storage_service.delete_files.return_value = {image_url: True}
 
     # Execute
     result = await maintenance_service.cleanup_orphaned_courses()
@@ -97,9 +92,9 @@ async def test_cleanup_orphaned_courses_success(
     assert result["storage_deleted"] == 1
     assert result["db_deleted"] == 1
 
-    mock_course_repo.get_orphaned_courses.assert_called_once()
-    mock_storage_service.delete_file.assert_called_once_with(mock_course.image_url)
-    mock_course_repo.delete.assert_called_once_with(mock_course)
+    mock_course_repo.get_orphaned_course_ids_and_urls.assert_called_once()
+    mock_storage_service.delete_files.assert_called_once_with([image_url])
+    mock_course_repo.delete_by_ids.assert_called_once_with([1])
     mock_course_repo.session.commit.assert_called_once()
 
 
@@ -108,8 +103,8 @@ async def test_run_all_maintenance(
     maintenance_service, mock_audio_repo, mock_course_repo
 ):
     # Setup
-    mock_audio_repo.get_orphaned_audios.return_value = []
-    mock_course_repo.get_orphaned_courses.return_value = []
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.return_value = []
+    mock_course_repo.get_orphaned_course_ids_and_urls.return_value = []
 
     # Execute
     result = await maintenance_service.run_all_maintenance()
@@ -117,5 +112,55 @@ async def test_run_all_maintenance(
     # Assert
     assert "audios" in result
     assert "courses" in result
-    mock_audio_repo.get_orphaned_audios.assert_called_once()
-    mock_course_repo.get_orphaned_courses.assert_called_once()
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.assert_called_once()
+    mock_course_repo.get_orphaned_course_ids_and_urls.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_orphaned_audios_counts_partial_storage_failures(
+    maintenance_service, mock_audio_repo, mock_storage_service
+):
+    # Setup
+    mock_audio_repo.get_orphaned_audio_ids_and_urls.return_value = [
+        (0, "https://a/1.mp3"),
+        (1, "https://a/2.mp3"),
+        (2, None),
+    ]
+    mock_audio_repo.delete_by_ids.return_value = 3
+    mock_storage_service.delete_files.return_value = {
+        "https://a/1.mp3": True,
+        "https://a/2.mp3": False,
+    }
+    mock_storage_service.delete_file.return_value = False
+
+    # Execute
+    with patch("app.services.maintenance_service.STORAGE_RETRY_WAIT", wait_none()):
+        result = await maintenance_service.cleanup_orphaned_audios()
+
+    # Assert
+    assert result["orphans_found"] == 3
+    assert result["storage_deleted"] == 1
+    assert result["db_deleted"] == 3
+    mock_storage_service.delete_files.assert_called_once_with(
+        ["https://a/1.mp3", "https://a/2.mp3"]
+    )
+    assert mock_storage_service.delete_file.call_count == 3
+    # The row whose file is still in storage is kept for the next run
+    mock_audio_repo.delete_by_ids.assert_called_once_with([0, 2])
+
+
+@pytest.mark.asyncio
+async def test_delete_files_retries_failed_deletes_until_success(
+    maintenance_service, mock_storage_service
+):
+    # Setup
+    mock_storage_service.delete_files.return_value = {"https://a/1.mp3": False}
+    mock_storage_service.delete_file.side_effect = [False, True]
+
+    # Execute
+    with patch("app.services.maintenance_service.STORAGE_RETRY_WAIT", wait_none()):
+        result = await maintenance_service._delete_files(["https://a/1.mp3"])
+
+    # Assert
+    assert result == [True]
+    assert mock_storage_service.delete_file.call_count == 2
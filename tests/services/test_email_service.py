@@ -0,0 +1,51 @@
+import pytest
+import resend
+from unittest.mock import patch
+
+from app.common.config import Settings
+from app.services.email_service import EmailService
+
+
+@pytest.mark.asyncio
+async def test_send_email_runs_blocking_send_off_loop():
+    service = EmailService(Settings(RESEND_API_KEY="re_test"))
+
+    with patch(
+        "app.services.email_service.render_template", return_value="<p>hi</p>"
+    ), patch(
+        "app.services.email_service.resend.Emails.send", return_value={"id": "abc"}
+    ) as mock_send:
+        sent = await service.send_email(
+            to_email="user@example.com",
+            subject="Hello",
+            template_name="otp_verification.html",
+            context={"code": "123456"},
+        )
+
+    assert sent is True
+    params = mock_send.call_args[0][0]
+    assert params["to"] == "user@example.com"
+    assert params["html"] == "<p>hi</p>"
+
+
+@pytest.mark.asyncio
+async def test_send_email_without_api_key_returns_false():
+    service = EmailService(Settings(RESEND_API_KEY=""))
+
+    assert await service.send_email("user@example.com", "Hello", "base.html") is False
+
+
+def test_resend_requests_share_one_pooled_session():
+    service = EmailService(Settings(RESEND_API_KEY="re_test"))
+    client = service.http_client
+
+    with patch.object(client._session, "request") as mock_request:
+        mock_request.return_value.content = b"{}"
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.headers = {}
+        client.request("POST", "https://api.resend.com/emails", {}, json={"a": 1})
+        client.request("POST", "https://api.resend.com/emails", {}, json={"b": 2}, files=None)
+
+    assert mock_request.call_count == 2
+    assert "files" not in mock_request.call_args.kwargs
+    assert resend.default_http_client is client
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from app.common.config import Settings
+
+
+def test_firebase_credentials_parses_inline_json_once():
+    raw = '{"type": "service_account", "private_key": "line1\nline2"}'
+    settings = Settings(FIREBASE_CREDENTIALS_JSON=raw)
+
+    with patch("firebase_admin.credentials.Certificate") as mock_cert:
+        first = settings.firebase_credentials
+        second = settings.firebase_credentials
+
+    assert first is second
+    mock_cert.assert_called_once_with(
+        {"type": "service_account", "private_key": "line1\nline2"}
+    )
+
+
+def test_firebase_credentials_treats_non_json_as_path():
+    settings = Settings(FIREBASE_CREDENTIALS_JSON="/secrets/firebase.json")
+
+    with patch("firebase_admin.credentials.Certificate") as mock_cert:
+        settings.firebase_credentials
+
+    mock_cert.assert_called_once_with("/secrets/firebase.json")
+
+
+def test_send_many_uses_single_batch_call():
+    from firebase_admin import messaging
+    from app.services.fcm_service import FirebaseFCMService
+
+    service = FirebaseFCMService.__new__(FirebaseFCMService)
+    messages = [
+        messaging.Message(token="token-a", data={"k": "v"}),
+        messaging.Message(topic="news", data={"k": "v"}),
+    ]
+
+    with patch("app.services.fcm_service.messaging.send_each") as mock_send_each:
+        mock_send_each.return_value.success_count = 2
+        mock_send_each.return_value.failure_count = 0
+        response = service.send_many(messages)
+
+    mock_send_each.assert_called_once_with(messages)
+    assert response is mock_send_each.return_value
+    assert service.send_many([]) is None
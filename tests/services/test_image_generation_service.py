@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from google.genai import types
+
+from app.common.config import Settings
+from app.services.image_generation_service import ImageGenerationService
+
+
+def make_response(data: bytes):
+    part = MagicMock()
+    part.inline_data.data = data
+    response = MagicMock()
+    response.candidates[0].content.parts = [part]
+    return response
+
+
+@pytest.mark.asyncio
+async def test_generate_image_awaits_async_client():
+    service = ImageGenerationService(Settings(GEMINI_API_KEY="key"))
+    client = MagicMock()
+    client.models.generate_content = AsyncMock(return_value=make_response(b"PNG"))
+    service._get_async_client = MagicMock(return_value=client)
+
+    assert await service.generate_image("a cover") == b"PNG"
+    client.models.generate_content.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_generate_image_returns_none_on_error():
+    service = ImageGenerationService(Settings(GEMINI_API_KEY="key"))
+    client = MagicMock()
+    client.models.generate_content = AsyncMock(side_effect=RuntimeError("boom"))
+    service._get_async_client = MagicMock(return_value=client)
+
+    assert await service.generate_image("a cover") is None
+
+
+def test_client_is_created_once_and_reused():
+    service = ImageGenerationService(Settings(GEMINI_API_KEY="key"))
+
+    assert service._get_async_client() is service._get_async_client()
+
+
+@pytest.mark.asyncio
+async def test_auth_error_resets_client():
+    from google.genai import errors
+
+    service = ImageGenerationService(Settings(GEMINI_API_KEY="key"))
+    client = MagicMock()
+    client.models.generate_content = AsyncMock(
+        side_effect=errors.ClientError(401, {"error": {"message": "bad key"}})
+    )
+    service._client = client
+
+    assert await service.generate_image("a cover") is None
+    assert service._client is None
+
+
+def test_extract_image_skips_leading_text_part():
+    text_part = types.Part.from_text(text="Here is your cover")
+    image_part = types.Part.from_bytes(data=b"PNG", mime_type="image/png")
+    response = types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(role="model", parts=[text_part, image_part])
+            )
+        ]
+    )
+
+    assert ImageGenerationService._extract_image(response) == b"PNG"
+    assert ImageGenerationService._extract_image(types.GenerateContentResponse()) is None
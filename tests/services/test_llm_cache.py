@@ -0,0 +1,222 @@
+import asyncio
+
+import numpy as np
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app.common.cache import cache_service
+from app.common.config import Settings
+from app.services.langchain_service import LangChainService
+from app.services.llm_cache import (
+    LLM_RESPONSE_CACHE,
+    SemanticIndex,
+    SQLiteCacheBackend,
+    cache_key,
+)
+
+
+class KeywordEmbeddings(Embeddings):
+    """Deterministic embeddings: one dimension per known keyword."""
+
+    vocabulary = ["python", "variables", "cooking", "pasta"]
+
+    def _vector(self, text: str) -> list[float]:
+        lowered = text.lower()
+        return [float(word in lowered) for word in self.vocabulary]
+
+    def embed_documents(self, texts):
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        return self._vector(text)
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    cache_service.clear(LLM_RESPONSE_CACHE)
+    yield
+    cache_service.clear(LLM_RESPONSE_CACHE)
+
+
+def make_service(temperature: float, semantic_index=None) -> LangChainService:
+    service = LangChainService(
+        Settings(GEMINI_API_KEY="key"),
+        temperature=temperature,
+        semantic_index=semantic_index,
+    )
+    service.llm = FakeListChatModel(responses=["first", "second"])
+    return service
+
+
+def test_cache_key_is_none_for_sampled_calls():
+    common = dict(
+        backend="gemini",
+        model="m",
+        system_prompt="s",
+        user_prompt="u",
+        schema_name=None,
+    )
+    assert cache_key(temperature=0.7, **common) is None
+    assert cache_key(temperature=0, **common) == cache_key(temperature=0, **common)
+
+
+@pytest.mark.asyncio
+async def test_invoke_returns_exact_cache_hit():
+    service = make_service(temperature=0)
+
+    first = await service.invoke(system_prompt="sys", user_prompt="hello")
+    second = await service.invoke(system_prompt="sys", user_prompt="hello")
+
+    assert first == second == "first"
+    assert service.stats == {"hits": 1, "misses": 1}
+
+
+@pytest.fixture
+def make_sqlite_service(tmp_path):
+    """Build services sharing one SQLite cache file, closing them afterwards."""
+    settings = Settings(GEMINI_API_KEY="key", LLM_CACHE_PATH=str(tmp_path / "llm.db"))
+    services = []
+
+    def make() -> LangChainService:
+        service = LangChainService(settings, temperature=0)
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.cache_backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists_across_service_instances(make_sqlite_service):
+    first = make_sqlite_service()
+    assert isinstance(first.cache_backend, SQLiteCacheBackend)
+    first.llm = FakeListChatModel(responses=["first"])
+    assert await first.invoke(system_prompt="sys", user_prompt="hello") == "first"
+
+    second = make_sqlite_service()
+    second.llm = FakeListChatModel(responses=["second"])
+    assert await second.invoke(system_prompt="sys", user_prompt="hello") == "first"
+    assert second.stats == {"hits": 1, "misses": 0}
+
+
+@pytest.mark.asyncio
+async def test_invoke_skips_cache_when_temperature_is_nonzero():
+    service = make_service(temperature=0.7)
+
+    assert await service.invoke(system_prompt="sys", user_prompt="hello") == "first"
+    assert await service.invoke(system_prompt="sys", user_prompt="hello") == "second"
+    assert service.stats == {"hits": 0, "misses": 0}
+
+
+@pytest.mark.asyncio
+async def test_invoke_returns_semantic_cache_hit():
+    service = make_service(
+        temperature=0, semantic_index=SemanticIndex(KeywordEmbeddings())
+    )
+
+    first = await service.invoke(
+        system_prompt="sys", user_prompt="Explain Python variables"
+    )
+    paraphrase = await service.invoke(
+        system_prompt="sys", user_prompt="What are variables in Python?"
+    )
+    unrelated = await service.invoke(system_prompt="sys", user_prompt="Cooking pasta")
+
+    assert first == paraphrase == "first"
+    assert unrelated == "second"
+
+
+def test_semantic_index_evicts_oldest_entry():
+    index = SemanticIndex(KeywordEmbeddings(), max_entries_per_scope=1)
+    index.add("scope", "a", np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32))
+    index.add("scope", "b", np.array([0.0, 1.0, 0.0, 0.0], dtype=np.float32))
+
+    assert index.search("scope", np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)) is None
+    assert index.search("scope", np.array([0.0, 1.0, 0.0, 0.0], dtype=np.float32)) == "b"
+
+
+@pytest.mark.asyncio
+async def test_invoke_reuses_compiled_chain_for_same_prompt_shape():
+    service = make_service(temperature=0.7)
+
+    await service.invoke(system_prompt="sys", user_prompt="Hi {name}", name="a")
+    chain = service._chain_cache[("sys", "Hi {name}", (), None, None, "quality")]
+    await service.invoke(system_prompt="sys", user_prompt="Hi {name}", name="b")
+
+    assert len(service._chain_cache) == 1
+    assert service._chain_cache[("sys", "Hi {name}", (), None, None, "quality")] is chain
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_many_preserves_order_and_bounds_concurrency():
+    service = make_service(temperature=0.7)
+    in_flight = 0
+    peak = 0
+
+    async def fake_invoke(system_prompt, user_prompt, **_):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return user_prompt.upper()
+
+    service.invoke = fake_invoke
+
+    results = await service.ainvoke_many(
+        "sys", ["a", "b", "c", "d", "e"], max_concurrency=2
+    )
+
+    assert results == ["A", "B", "C", "D", "E"]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_chunks_and_caches_full_response():
+    service = make_service(temperature=0)
+
+    streamed = [c async for c in service.stream(system_prompt="sys", user_prompt="hi")]
+    cached = [c async for c in service.stream(system_prompt="sys", user_prompt="hi")]
+
+    assert "".join(streamed) == "first"
+    assert cached == ["first"]
+    assert service.stats == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_invoke_with_context_sends_context_as_separate_message():
+    service = make_service(temperature=0)
+
+    first = await service.invoke_with_context(
+        system_prompt="sys", user_prompt="Summarize", context='{"a": 1}'
+    )
+    second = await service.invoke_with_context(
+        system_prompt="sys", user_prompt="Summarize", context="other notes"
+    )
+
+    assert (first, second) == ("first", "second")
+    assert len(service._chain_cache) == 1
+
+    chain = next(iter(service._chain_cache.values()))
+    messages = chain.first.format_messages(context='{"a": 1}')
+    assert [m.type for m in messages] == ["system", "human", "human"]
+    assert messages[0].content == "sys"
+    assert messages[1].content == 'Context:\n{"a": 1}'
+    assert messages[2].content == "Query:\nSummarize"
+
+
+@pytest.mark.asyncio
+async def test_invoke_routes_fast_profile_to_smaller_model():
+    service = make_service(temperature=0.7)
+    service._llm_fast = FakeListChatModel(responses=["fast"])
+
+    assert await service.invoke(system_prompt="sys", user_prompt="hi") == "first"
+    assert (
+        await service.invoke(system_prompt="sys", user_prompt="hi", task_profile="fast")
+        == "fast"
+    )
+
+    with pytest.raises(ValueError, match="Unsupported task_profile"):
+        await service.invoke(system_prompt="sys", user_prompt="hi", task_profile="cheap")
@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.common.config import Settings
+from app.services.storage_service import (
+    FirebaseStorageService,
+    detect_audio_format,
+    sniff_audio_format,
+)
+
+
+@pytest.fixture
+def storage_service():
+    return FirebaseStorageService(Settings(FIREBASE_STORAGE_BUCKET="bucket"))
+
+
+@pytest.mark.asyncio
+async def test_upload_bytes_async_uploads_public_in_one_call(storage_service):
+    bucket = MagicMock()
+    bucket.blob.return_value.public_url = "https://storage.googleapis.com/bucket/a.png"
+
+    with patch.object(storage_service, "_initialize_app"), patch(
+        "app.services.storage_service.storage.bucket", return_value=bucket
+    ) as mock_bucket:
+        storage_service.initialize()
+        storage_service.initialize()
+        url = await storage_service.upload_bytes_async(b"data", "a.png", "image/png")
+        await storage_service.upload_bytes_async(b"data", "b.png", "image/png")
+
+    assert url == "https://storage.googleapis.com/bucket/a.png"
+    mock_bucket.assert_called_once()
+    blob = bucket.blob.return_value
+    blob.upload_from_string.assert_called_with(
+        b"data", content_type="image/png", predefined_acl="publicRead"
+    )
+    blob.make_public.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_audio_async_names_file_from_detected_format(storage_service):
+    bucket = MagicMock()
+    bucket.blob.return_value.public_url = "https://storage.googleapis.com/bucket/a.mp3"
+
+    with patch.object(storage_service, "_initialize_app"), patch(
+        "app.services.storage_service.storage.bucket", return_value=bucket
+    ):
+        storage_service.initialize()
+        url = await storage_service.upload_audio_async(
+            b"ID3\x04\x00\x00", filename_prefix="part", folder="lesson_audio/1"
+        )
+
+    assert url == "https://storage.googleapis.com/bucket/a.mp3"
+    path = bucket.blob.call_args.args[0]
+    assert path.startswith("lesson_audio/1/part_") and path.endswith(".mp3")
+    bucket.blob.return_value.upload_from_string.assert_called_once_with(
+        b"ID3\x04\x00\x00", content_type="audio/mpeg", predefined_acl="publicRead"
+    )
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b"RIFF\x00\x00\x00\x00WAVE", ("wav", "audio/wav")),
+        (b"ID3\x04\x00\x00", ("mp3", "audio/mpeg")),
+        (b"\xff\xfb\x90\x64", ("mp3", "audio/mpeg")),
+        (b"fLaC\x00\x00", ("flac", "audio/flac")),
+        (b"OggS\x00\x02", ("ogg", "audio/ogg")),
+        (b"\x00\x01\x02\x03", ("wav", "audio/wav")),
+        (b"ID", ("wav", "audio/wav")),
+    ],
+)
+def test_detect_audio_format(data, expected):
+    assert detect_audio_format(data) == expected
+
+
+@pytest.mark.parametrize("data", [b"\x00\x01\x02\x03", b"ID"])
+def test_sniff_audio_format_unrecognised(data):
+    assert sniff_audio_format(data) is None
+
+
+def test_bucket_raises_when_initialize_fails(storage_service):
+    with patch.object(
+        storage_service, "initialize", side_effect=ValueError("no credentials")
+    ):
+        with pytest.raises(RuntimeError):
+            storage_service.upload_bytes(b"data", "a.png")
+
+
+def test_bucket_retries_initialize_after_failed_startup(storage_service):
+    bucket = MagicMock()
+
+    with patch.object(storage_service, "_initialize_app"), patch(
+        "app.services.storage_service.storage.bucket",
+        side_effect=[ValueError("transient"), bucket],
+    ):
+        with pytest.raises(ValueError):
+            storage_service.initialize()
+
+        assert storage_service.bucket is bucket
+
+
+def test_delete_files_batches_and_retries_failed_batch(storage_service):
+    bucket = MagicMock()
+    storage_service._bucket = bucket
+    batch = bucket.client.batch.return_value
+    # First batch succeeds, second one fails on exit
+    batch.__exit__.side_effect = [None, Exception("404 Not Found")]
+    urls = [f"https://storage.googleapis.com/bucket/audio/{i}.mp3" for i in range(101)]
+
+    with patch.object(storage_service, "delete_file", return_value=False) as mock_delete_file:
+        results = storage_service.delete_files(urls)
+
+    assert bucket.client.batch.call_count == 2
+    bucket.blob.assert_any_call("audio/0.mp3")
+    assert all(results[url] for url in urls[:100])
+    assert results[urls[100]] is False
+    mock_delete_file.assert_called_once_with(urls[100])
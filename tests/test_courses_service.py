@@ -1,7 +1,11 @@
 """Tests for course generation service."""
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from app.features.courses.generation_service import CourseGenerationService
+from app.common.cache import cache_service
+from app.features.courses.generation_service import (
+    COURSE_PLAN_CACHE,
+    CourseGenerationService,
+)
 from app.features.courses.schemas import (
     CourseGenerationRequest,
     CourseOutline,
@@ -10,13 +14,22 @@ from app.features.courses.schemas import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_plan_cache():
+    cache_service.clear(COURSE_PLAN_CACHE)
+    yield
+    cache_service.clear(COURSE_PLAN_CACHE)
+
+
 class TestCourseService:
     """Test suite for course generation service."""
     
     @pytest.fixture
     def mock_ai_service(self):
         """Create a mock AI service."""
-        return AsyncMock()
+        ai_service = AsyncMock()
+        ai_service.temperature = 0.7
+        return ai_service
     
     @pytest.fixture
     def service(self, mock_ai_service):
@@ -133,3 +146,114 @@ class TestCourseService:
             user_prompt = call_kwargs["user_prompt"]
             assert "pandas" in user_prompt.lower()
             assert "visualization" in user_prompt.lower()
+
+    @pytest.mark.asyncio
+    async def test_generate_courses_reuses_cached_plan(self, service):
+        """Equivalent requests are served from the plan cache without the LLM."""
+        service.ai_service.temperature = 0
+        outline = CourseOutline(
+            title="Python Basics",
+            description="Learn Python",
+            duration="4 weeks",
+            outline=[],
+        )
+
+        with patch.object(service.ai_service, 'invoke', new_callable=AsyncMock) as mock_invoke:
+            class MockResponse:
+                courses = [outline]
+
+            mock_invoke.return_value = MockResponse()
+
+            first = await service.generate_courses(
+                CourseGenerationRequest(
+                    topic="Python Programming",
+                    level="beginner",
+                    learning_goals=["loops", "functions"],
+                )
+            )
+            first[0].title = "Changed by caller"
+
+            second = await service.generate_courses(
+                CourseGenerationRequest(
+                    topic="python programming ",
+                    level="beginner",
+                    learning_goals=["functions", "loops"],
+                )
+            )
+
+            mock_invoke.assert_called_once()
+            assert second[0].title == "Python Basics"
+
+    @pytest.mark.asyncio
+    async def test_generate_courses_cache_keys_on_duration_text(self, service):
+        """Durations that parse to the same weeks still get their own plans."""
+        service.ai_service.temperature = 0
+        outline = CourseOutline(
+            title="Python Basics",
+            description="Learn Python",
+            duration="4 weeks",
+            outline=[],
+        )
+
+        with patch.object(service.ai_service, 'invoke', new_callable=AsyncMock) as mock_invoke:
+            class MockResponse:
+                courses = [outline]
+
+            mock_invoke.return_value = MockResponse()
+
+            for duration in ("30 hours", "4 weeks"):
+                await service.generate_courses(
+                    CourseGenerationRequest(
+                        topic="Python Programming",
+                        level="beginner",
+                        duration_preference=duration,
+                    )
+                )
+
+            assert mock_invoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_courses_skips_cache_when_sampling(self, service):
+        """Sampled (temperature > 0) plans are generated afresh every time."""
+        service.ai_service.temperature = 0.7
+        outline = CourseOutline(
+            title="Python Basics",
+            description="Learn Python",
+            duration="4 weeks",
+            outline=[],
+        )
+
+        with patch.object(service.ai_service, 'invoke', new_callable=AsyncMock) as mock_invoke:
+            class MockResponse:
+                courses = [outline]
+
+            mock_invoke.return_value = MockResponse()
+
+            request = CourseGenerationRequest(topic="Python Programming", level="beginner")
+            await service.generate_courses(request)
+            await service.generate_courses(request)
+
+            assert mock_invoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_courses_caches_when_enabled(self, mock_ai_service):
+        """cache_plans reuses outlines even when the AI service samples."""
+        service = CourseGenerationService(mock_ai_service, cache_plans=True)
+        outline = CourseOutline(
+            title="Python Basics",
+            description="Learn Python",
+            duration="4 weeks",
+            outline=[],
+        )
+
+        with patch.object(service.ai_service, 'invoke', new_callable=AsyncMock) as mock_invoke:
+            class MockResponse:
+                courses = [outline]
+
+            mock_invoke.return_value = MockResponse()
+
+            request = CourseGenerationRequest(topic="Python Programming", level="beginner")
+            await service.generate_courses(request)
+            await service.generate_courses(request)
+
+            mock_invoke.assert_called_once()
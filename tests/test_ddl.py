@@ -0,0 +1,92 @@
+"""Tests for the migration DDL helpers."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from pymysql.err import OperationalError as PyMySQLOperationalError
+from pymysql.err import ProgrammingError as PyMySQLProgrammingError
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.common.database.ddl import (
+    ER_DUP_KEYNAME,
+    backfill_nulls,
+    exec_alter,
+    is_applied,
+    mysql_error_code,
+)
+
+
+def unsupported(code: int = 1845) -> OperationalError:
+    return OperationalError(
+        "ALTER", {}, PyMySQLOperationalError(code, "ALGORITHM is not supported")
+    )
+
+
+def executed_sql(conn: AsyncMock) -> list[str]:
+    return [str(call.args[0]) for call in conn.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_exec_alter_uses_instant_when_supported():
+    conn = AsyncMock()
+
+    assert await exec_alter(conn, "ALTER TABLE users DROP COLUMN credits;") == "INSTANT"
+    assert executed_sql(conn) == ["ALTER TABLE users DROP COLUMN credits, ALGORITHM=INSTANT"]
+
+
+@pytest.mark.asyncio
+async def test_exec_alter_falls_back_to_inplace_then_default():
+    conn = AsyncMock()
+    conn.execute.side_effect = [unsupported(1845), unsupported(1846), None]
+
+    assert await exec_alter(conn, "ALTER TABLE users MODIFY COLUMN a INT NULL") == "DEFAULT"
+    assert executed_sql(conn) == [
+        "ALTER TABLE users MODIFY COLUMN a INT NULL, ALGORITHM=INSTANT",
+        "ALTER TABLE users MODIFY COLUMN a INT NULL, ALGORITHM=INPLACE, LOCK=NONE",
+        "ALTER TABLE users MODIFY COLUMN a INT NULL",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_exec_alter_reraises_other_errors():
+    conn = AsyncMock()
+    conn.execute.side_effect = unsupported(1091)  # can't DROP; doesn't exist
+
+    with pytest.raises(OperationalError):
+        await exec_alter(conn, "ALTER TABLE users DROP COLUMN credits")
+    assert conn.execute.await_count == 1
+
+
+def test_mysql_error_code_reads_driver_errno():
+    assert mysql_error_code(unsupported(ER_DUP_KEYNAME)) == ER_DUP_KEYNAME
+    assert mysql_error_code(OperationalError("ALTER", {}, Exception("no errno"))) is None
+
+
+@pytest.mark.asyncio
+async def test_backfill_nulls_updates_in_batches_until_short_batch():
+    conn = AsyncMock()
+    conn.execute.side_effect = [MagicMock(rowcount=2), MagicMock(rowcount=2), MagicMock(rowcount=1)]
+
+    assert await backfill_nulls(conn, "lesson_audios", "script", "", batch_size=2) == 5
+    assert executed_sql(conn) == [
+        "UPDATE lesson_audios SET script = :value WHERE script IS NULL LIMIT 2"
+    ] * 3
+    assert conn.execute.await_args.args[1] == {"value": ""}
+
+
+@pytest.mark.asyncio
+async def test_is_applied_reads_schema_migrations():
+    conn = AsyncMock()
+    conn.execute.return_value = MagicMock(**{"scalar.return_value": 1})
+
+    assert await is_applied(conn, "remove_is_unlocked_column") is True
+    assert conn.execute.await_args.args[1] == {"name": "remove_is_unlocked_column"}
+
+
+@pytest.mark.asyncio
+async def test_is_applied_is_false_before_the_table_exists():
+    conn = AsyncMock()
+    conn.execute.side_effect = ProgrammingError(
+        "SELECT", {}, PyMySQLProgrammingError(1146, "Table doesn't exist")
+    )
+
+    assert await is_applied(conn, "remove_is_unlocked_column") is False
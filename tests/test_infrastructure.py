@@ -35,3 +35,13 @@ def test_faker_integration():
     users = generate_multiple_users(3)
     assert len(users) == 3
     assert all("email" in user for user in users)
+
+
+def test_script_runner_returns_coroutine_result():
+    """Verify the runner used by migrations and demo scripts."""
+    from app.common.runner import run
+
+    async def answer():
+        return 42
+
+    assert run(answer()) == 42
@@ -72,3 +72,41 @@ class TestLangChainService:
         
         with pytest.raises(ValueError, match="GEMINI_API_KEY not configured"):
             LangChainService(backend="gemini")
+
+
+def test_json_output_parser_validates_raw_json():
+    """JSON-mode output is parsed directly into the schema."""
+    from langchain_core.messages import AIMessage
+    from langchain_core.output_parsers import PydanticOutputParser
+    from app.services.langchain_service import _json_output_parser
+
+    parser = _json_output_parser(PydanticOutputParser(pydantic_object=SimpleResponse))
+
+    raw = AIMessage(content='{"answer": "4", "confidence": 0.9}')
+    fenced = AIMessage(content='```json\n{"answer": "4", "confidence": 0.9}\n```')
+
+    assert parser.invoke(raw) == SimpleResponse(answer="4", confidence=0.9)
+    assert parser.invoke(fenced) == SimpleResponse(answer="4", confidence=0.9)
+
+
+def test_gemini_structured_chain_uses_json_output_parser():
+    """The Gemini structured-output chain ends in the direct JSON parser."""
+    from langchain_core.runnables import RunnableLambda
+    from app.common.config import Settings
+
+    service = LangChainService(Settings(GEMINI_API_KEY="key"), backend="gemini")
+    chain = service._get_chain("sys", "user", None, SimpleResponse)
+
+    assert isinstance(chain.last, RunnableLambda)
+
+
+def test_structured_model_is_shared_across_prompts():
+    """Schema conversion is done once per schema, not once per prompt."""
+    from app.common.config import Settings
+
+    service = LangChainService(Settings(GEMINI_API_KEY="key"), backend="gemini")
+    first = service._get_chain("course on python", "user", None, SimpleResponse)
+    second = service._get_chain("course on rust", "user", None, SimpleResponse)
+
+    assert first is not second
+    assert first.last is second.last
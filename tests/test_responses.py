@@ -0,0 +1,31 @@
+"""Tests for the generic API response helpers."""
+from pydantic import BaseModel
+
+from app.common.responses import ApiResponse, error_response, success_response
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def test_success_response_serializes_like_validated_model():
+    item = Item(id=1, name="Python")
+
+    response = success_response(data=[item], details="ok", status_code=201)
+
+    assert response.data[0] is item
+    assert response.model_dump() == ApiResponse(
+        status_code=201, details="ok", data=[item]
+    ).model_dump()
+    assert ApiResponse[list[Item]].model_validate(response.model_dump()).data == [item]
+
+
+def test_error_response_defaults():
+    response = error_response(details="User not found", status_code=404)
+
+    assert response.model_dump() == {
+        "status_code": 404,
+        "details": "User not found",
+        "data": None,
+    }
@@ -22,3 +22,16 @@ def generate_user_data(
 def generate_multiple_users(count: int = 5) -> list[dict]:
     """Generate multiple user data dictionaries."""
     return [generate_user_data() for _ in range(count)]
+
+
+async def bulk_create(session, model, rows: list[dict]) -> list:
+    """Add one instance of model per row and flush them together.
+
+    The instances are returned with their generated ids populated, so sibling
+    rows (e.g. the lessons of one module) cost a single flush instead of one
+    each.
+    """
+    instances = [model(**row) for row in rows]
+    session.add_all(instances)
+    await session.flush()
+    return instances